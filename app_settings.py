@@ -41,7 +41,36 @@ class AppSettings:
                 "headless_mode": True,
                 "auto_save_interval": 300,  # 5 minutes
                 "max_log_files": 10,
-                "max_history_entries": 100
+                "log_view_max_lines": 5000,  # Older lines are dropped from the log tab
+                "log_file_max_mb": 5,  # Size at which logs/caixa_lead_gui.log is rotated
+                "max_history_entries": 100,
+                "driver_pool_size": 2,  # Browsers running lookups in parallel
+                "concurrency_mode": "browsers",  # "browsers": one Chrome per worker; "tabs": one Chrome, a tab per worker
+                "tab_count": 4,  # Tabs of the shared browser in "tabs" mode
+                "recycle_after_lookups": 200,  # Browser lookups before Chrome is restarted (0: never)
+                "recycle_rss_mb": 1500,  # Chrome memory that triggers a restart; needs psutil (0: never)
+                "warm_driver": True,  # Start a headless browser in the background before each run
+                "browser_profile": "standard",  # "standard" loads the full page; "lookup" skips images, fonts and trackers (opt-in; compare with benchmark_browser_profile.py)
+                "direct_urls": True,  # Open detail pages by learned URL pattern (data/url_patterns.json)
+                "review_lookahead": 10  # Leads looked up ahead of the operator's review (0: no limit)
+            },
+            "cache": {
+                "enabled": True,
+                "positive_ttl_hours": 168,  # Found properties stay valid for a week
+                "negative_ttl_hours": 24,  # Unavailable properties are rechecked daily
+                "max_entries": 5000
+            },
+            "catalog": {
+                "enabled": True,
+                "sitemap_url": "https://viahouseleiloes.com.br/sitemap.xml",
+                "refresh_hours": 6,  # Interval between sitemap syncs while the app is open
+                "max_age_hours": 24,  # Listings not seen in a sync for this long fall back to the live site
+                "max_pages_per_sync": 300  # Property pages fetched per sync; the rest waits for the next one
+            },
+            "contact_history": {
+                "enabled": True,
+                "window_days": 30,  # Leads messaged within this window are not contacted again
+                "action": "skip"  # "skip" the lead or just "flag" it
             },
             "ui": {
                 "theme": "default",
@@ -242,11 +271,11 @@ class AppSettings:
                     log_file.unlink()
                     cleared_files += 1
             
-            # Clear browser cache if exists
+            # Clear browser cache if exists (downloaded chromedrivers in ~/.wdm are kept,
+            # so the next run does not need the network; see driver_resolver)
             browser_cache_dirs = [
                 self.cache_dir / "selenium",
-                self.cache_dir / "chromedriver",
-                Path.home() / ".wdm" / "drivers"
+                self.cache_dir / "chromedriver"
             ]
             
             for cache_dir in browser_cache_dirs:
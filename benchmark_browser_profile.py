@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Browser Profile Benchmark
+Runs the Selenium property lookup for the same property codes with each
+browser profile and compares bytes transferred, WebDriver commands and
+latency per lead.
+Needs Chrome and network access.
+
+Usage: python benchmark_browser_profile.py CX0001... [CX0002... ...] [--visible]
+"""
+
+import sys
+import json
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from caixa_lead_processor import CAIXALeadProcessor
+from browser_profiles import PROFILES, build_chrome_options, configure_driver
+from driver_resolver import resolve_chromedriver
+
+
+def start_driver(profile, headless):
+    """Start Chrome with the profile and DevTools network logging"""
+    chrome_options = build_chrome_options(headless, profile)
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver_path = resolve_chromedriver()
+    driver = webdriver.Chrome(service=Service(driver_path) if driver_path else Service(), options=chrome_options)
+    driver.implicitly_wait(0)
+    configure_driver(driver, profile)
+    return driver
+
+
+def bytes_transferred(driver):
+    """Return (bytes, requests) finished since the last call, from the performance log"""
+    total = requests = 0
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] == "Network.loadingFinished":
+            total += message["params"].get("encodedDataLength", 0)
+            requests += 1
+    return total, requests
+
+
+def run_profile(profile, property_ids, headless):
+    """Look up every property with the profile; return per-lead (seconds, bytes, requests, city, commands)"""
+    processor = CAIXALeadProcessor(headless=headless, use_http_lookup=False, browser_profile=profile)
+    processor.driver = start_driver(profile, headless)
+    results = []
+    try:
+        # Warm-up lookup so that Chrome start-up is not counted against the first lead
+        processor._search_property_details_selenium(property_ids[0])
+        bytes_transferred(processor.driver)
+
+        for property_id in property_ids:
+            start = time.perf_counter()
+            details = processor._search_property_details_selenium(property_id)
+            seconds = time.perf_counter() - start
+            size, requests = bytes_transferred(processor.driver)
+            results.append((seconds, size, requests, details.get("city", ""), processor.webdriver_commands))
+    finally:
+        processor.driver.quit()
+    return results
+
+
+def main(argv=None):
+    """Run the benchmark and return a process exit code"""
+    args = sys.argv[1:] if argv is None else argv
+    headless = "--visible" not in args
+    property_ids = [arg for arg in args if not arg.startswith("--")]
+    if not property_ids:
+        print(__doc__.strip().splitlines()[-1])
+        return 2
+
+    summary = {}
+    for profile in PROFILES:
+        results = run_profile(profile, property_ids, headless)
+        count = len(results)
+        summary[profile] = {
+            "seconds": sum(r[0] for r in results) / count,
+            "kb": sum(r[1] for r in results) / count / 1024,
+            "requests": sum(r[2] for r in results) / count,
+            "cities": [r[3] for r in results],
+            "commands": sum(r[4] for r in results) / count,
+        }
+
+        print(f"Perfil {profile} ({count} imóveis):")
+        print(f"  tempo médio por lead: {summary[profile]['seconds']:.2f}s")
+        print(f"  transferido por lead: {summary[profile]['kb']:.0f} KB em {summary[profile]['requests']:.0f} requisições")
+        print(f"  comandos WebDriver por lead: {summary[profile]['commands']:.0f}")
+
+    standard, lookup = (summary[profile] for profile in PROFILES)
+    if lookup["cities"] != standard["cities"]:
+        print(f"FALHOU: cidades diferentes entre os perfis: {standard['cities']} x {lookup['cities']}")
+        return 1
+    print(f"Economia do perfil lookup: {100 * (1 - lookup['kb'] / standard['kb']):.0f}% dos bytes, "
+          f"{standard['seconds'] - lookup['seconds']:.2f}s por lead")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
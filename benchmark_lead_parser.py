@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Lead Parser Benchmark
+Times the shared lead parser on a synthetic paste of 10k leads, plus the same
+paste with malformed blocks that make the old DOTALL regex backtrack
+"""
+
+import io
+import re
+import sys
+import time
+
+from lead_parser import iter_lead_records
+
+LEAD_COUNT = 10000
+MALFORMED_COUNT = 5
+TIME_BUDGET = 1.0  # seconds
+
+LEAD_TEMPLATE = (
+    "Olá ,\n"
+    "Você possui um novo lead para o imóvel CX{index:014d}SP:\n"
+    "Nome: cliente {index}\n"
+    "E-mail: cliente{index}@example.com\n"
+    "Telefone: (11) 9{index:08d}\n\n"
+)
+
+# Pattern previously used by parse_bulk_leads, kept here for comparison
+OLD_BULK_PATTERN = r'imóvel\s+(CX\w+).*?Nome:\s*([^\n\r]+).*?E-mail:\s*([^\n\r]+).*?Telefone:\s*([^\n\r]+)'
+
+
+def build_paste(count, malformed=False):
+    """Build a synthetic paste with count leads"""
+    blocks = [LEAD_TEMPLATE.format(index=index) for index in range(count)]
+    if malformed:
+        # The last MALFORMED_COUNT leads lost their "Telefone:" line; the old regex
+        # backtracks over the rest of the text from each of them, and its time
+        # grows much faster than linearly with this count
+        for index in range(count - MALFORMED_COUNT, count):
+            blocks[index] = blocks[index].replace("Telefone:", "Tel")
+    return "".join(blocks)
+
+
+def time_new_parser(text):
+    """Return (seconds, number of complete leads) for the shared parser"""
+    start = time.perf_counter()
+    leads = [lead for _, lead in iter_lead_records(io.StringIO(text)) if lead.get("phone")]
+    return time.perf_counter() - start, len(leads)
+
+
+def time_old_regex(text):
+    """Return (seconds, number of matches) for the old DOTALL regex"""
+    start = time.perf_counter()
+    matches = re.findall(OLD_BULK_PATTERN, text, re.DOTALL | re.IGNORECASE)
+    return time.perf_counter() - start, len(matches)
+
+
+def main():
+    """Run the benchmark and return a process exit code"""
+    ok = True
+    for malformed in (False, True):
+        label = "com bloco malformado" if malformed else "bem formado"
+        text = build_paste(LEAD_COUNT, malformed)
+
+        new_seconds, new_count = time_new_parser(text)
+        old_seconds, old_count = time_old_regex(text)
+
+        print(f"{LEAD_COUNT} leads ({label}, {len(text) / 1e6:.1f} MB):")
+        print(f"  parser linear: {new_seconds:.3f}s, {new_count} leads completos")
+        print(f"  regex DOTALL antigo: {old_seconds:.3f}s, {old_count} correspondências")
+
+        ok = ok and new_seconds < TIME_BUDGET
+
+    print("OK" if ok else f"FALHOU: acima de {TIME_BUDGET}s")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
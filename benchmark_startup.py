@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Startup Benchmark
+Times a cold start of caixa_lead_gui in a fresh interpreter, from process start
+to the first paint of the main window, and checks that Selenium is not loaded
+before the first processing run
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+RUNS = 3
+TIME_BUDGET = 2.0  # seconds until the first paint
+HEAVY_MODULES = ("selenium", "webdriver_manager", "bs4", "pandas")
+
+# Executed in a fresh interpreter so that nothing is imported or cached beforehand
+CHILD_SCRIPT = r"""
+import json, sys, time
+started = time.perf_counter()
+
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication
+
+app = QApplication(sys.argv)
+import caixa_lead_gui
+imported = time.perf_counter()
+
+window = caixa_lead_gui.LeadProcessorGUI()
+constructed = time.perf_counter()
+painted = []
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not painted:
+            painted.append(time.perf_counter())
+            QTimer.singleShot(0, app.quit)
+        return False
+
+
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+QTimer.singleShot(5000, app.quit)
+window.show()
+app.exec_()
+
+print(json.dumps({
+    "import": imported - started,
+    "construct": constructed - imported,
+    "first_paint": (painted[0] if painted else time.perf_counter()) - started,
+    "painted": bool(painted),
+    "loaded": [name for name in HEAVY_MODULES if name in sys.modules],
+}))
+"""
+
+
+def time_cold_start():
+    """Return the timings reported by one cold start of the GUI"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    script = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n{CHILD_SCRIPT}"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, check=True
+    )
+    # The window prints messages of its own; the timings are on the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Run the benchmark and return a process exit code"""
+    samples = [time_cold_start() for _ in range(RUNS)]
+    best = min(samples, key=lambda sample: sample["first_paint"])
+    loaded = sorted({name for sample in samples for name in sample["loaded"]})
+
+    print(f"Abertura a frio ({RUNS} execuções, melhor tempo):")
+    print(f"  importar caixa_lead_gui: {best['import']:.3f}s")
+    print(f"  construir a janela: {best['construct']:.3f}s")
+    print(f"  primeira pintura: {best['first_paint']:.3f}s")
+    print(f"  módulos pesados carregados: {', '.join(loaded) or 'nenhum'}")
+
+    ok = best["painted"] and best["first_paint"] < TIME_BUDGET and not loaded
+    print("OK" if ok else f"FALHOU: acima de {TIME_BUDGET}s ou módulos pesados carregados na abertura")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
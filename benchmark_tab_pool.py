@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Tab Pool Benchmark
+Runs the Selenium property lookup for the same property codes with one tab
+and with several tabs of a shared browser, and compares the wall time.
+Tab mode only pays off if page loads in different tabs overlap; this is the
+check for it. Needs Chrome and network access.
+
+Usage: python benchmark_tab_pool.py CX0001... [CX0002... ...] [--tabs=4] [--visible]
+"""
+
+import sys
+import time
+
+from caixa_lead_processor import CAIXALeadProcessor
+from browser_profiles import PROFILE_LOOKUP
+from tab_pool import TabPool
+
+DEFAULT_TABS = 4
+
+
+def run_tabs(tab_count, property_ids, headless):
+    """Look up every property with tab_count tabs; return (seconds, cities in input order)"""
+    def factory():
+        return CAIXALeadProcessor(headless=headless, use_http_lookup=False, browser_profile=PROFILE_LOOKUP)
+
+    def lookup(processor, property_id):
+        return processor._search_property_details_selenium(property_id).get("city", "")
+
+    with TabPool(tab_count, headless=headless, processor_factory=factory) as pool:
+        # Warm-up round so that Chrome start-up and tab creation are not counted
+        list(pool.imap_unordered(lookup, property_ids[:tab_count]))
+
+        start = time.perf_counter()
+        cities = {index: city for index, _, city in pool.imap_unordered(lookup, property_ids)}
+        seconds = time.perf_counter() - start
+    return seconds, [cities[index] for index in sorted(cities)]
+
+
+def main(argv=None):
+    """Run the benchmark and return a process exit code"""
+    args = sys.argv[1:] if argv is None else argv
+    headless = "--visible" not in args
+    tab_count = DEFAULT_TABS
+    for arg in args:
+        if arg.startswith("--tabs="):
+            tab_count = int(arg.split("=", 1)[1])
+    property_ids = [arg for arg in args if not arg.startswith("--")]
+    if not property_ids:
+        print(__doc__.strip().splitlines()[-1])
+        return 2
+
+    single_seconds, single_cities = run_tabs(1, property_ids, headless)
+    print(f"1 aba: {single_seconds:.2f}s para {len(property_ids)} imóveis")
+    multi_seconds, multi_cities = run_tabs(tab_count, property_ids, headless)
+    print(f"{tab_count} abas: {multi_seconds:.2f}s para {len(property_ids)} imóveis")
+
+    if multi_cities != single_cities:
+        print(f"FALHOU: cidades diferentes: {single_cities} x {multi_cities}")
+        return 1
+    speedup = single_seconds / multi_seconds if multi_seconds else 0
+    print(f"Aceleração com {tab_count} abas: {speedup:.1f}x")
+    if speedup < 1.2:
+        print("AVISO: os carregamentos não estão se sobrepondo; prefira um navegador por busca")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Browser Profiles
+Chrome configurations for setup_driver: the standard full-page profile and a
+lookup profile that skips everything the property search does not read
+"""
+
+import logging
+
+logger = logging.getLogger('BrowserProfiles')
+
+PROFILE_STANDARD = "standard"
+PROFILE_LOOKUP = "lookup"
+PROFILES = (PROFILE_STANDARD, PROFILE_LOOKUP)
+
+# Content settings turned off in the lookup profile (2 = block)
+LOOKUP_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Requests dropped through DevTools in the lookup profile. Stylesheets are kept:
+# without them hidden search boxes become visible and the selectors may pick
+# the wrong one
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*facebook.com/tr*",
+    "*hotjar.com*", "*clarity.ms*", "*tiktok.com*",
+]
+
+
+def build_chrome_options(headless=False, profile=PROFILE_STANDARD, page_load_strategy=None):
+    """
+    Build the Chrome options used by setup_driver.
+
+    Args:
+        headless: Whether to run the browser in headless mode
+        profile: PROFILE_STANDARD or PROFILE_LOOKUP
+        page_load_strategy: Overrides the profile's page load strategy ("normal", "eager" or "none")
+
+    Returns:
+        Options: Selenium Chrome options
+    """
+    from selenium.webdriver.chrome.options import Options
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument("--headless=new")  # Use new headless mode
+
+    # Add additional options for stability
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-notifications")
+    # Tabs in the background keep loading and running scripts at full speed (tab pool mode)
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+
+    if profile == PROFILE_LOOKUP:
+        chrome_options.add_experimental_option("prefs", LOOKUP_PREFS)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        # get() returns at DOMContentLoaded; the lookup waits explicitly for what it reads
+        chrome_options.page_load_strategy = "eager"
+
+    if page_load_strategy:
+        chrome_options.page_load_strategy = page_load_strategy
+
+    return chrome_options
+
+
+def configure_driver(driver, profile=PROFILE_STANDARD):
+    """
+    Apply the settings of a profile that can only be set on a running browser.
+
+    Args:
+        driver: Chrome WebDriver started with build_chrome_options()
+        profile: PROFILE_STANDARD or PROFILE_LOOKUP
+    """
+    if profile != PROFILE_LOOKUP:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        # Images stay blocked through the preferences even without DevTools
+        logger.warning(f"Failed to set blocked URLs: {str(e)}")
@@ -6,7 +6,7 @@ from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QTextEdit, QFileDialog, QCheckBox, 
                             QProgressBar, QMessageBox, QTabWidget, QGroupBox, QFormLayout,
-                            QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+                            QLineEdit, QTableView, QAbstractItemView, QHeaderView, QComboBox,
                             QSplitter, QFrame, QStyleFactory, QStatusBar, QToolBar, QAction,
                             QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QGridLayout,
                             QStackedWidget, QScrollArea, QSizePolicy, QSpacerItem, QDialog, QSpinBox)
@@ -14,13 +14,27 @@ from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QUrl, QSize, QPropertyAnimati
                          QEasingCurve, QTimer, QPoint, QParallelAnimationGroup, 
                          QSequentialAnimationGroup, QAbstractAnimation)
 from PyQt5.QtGui import (QIcon, QFont, QDesktopServices, QTextCursor, QPixmap, QColor, 
-                        QPalette, QLinearGradient, QFontDatabase, QMovie)
-
-# Importar a classe CAIXALeadProcessor
-from caixa_lead_processor import CAIXALeadProcessor
+                        QPalette, QLinearGradient, QFontDatabase, QMovie, QTextDocument)
 
 # Importar sistema de configurações
 from app_settings import AppSettings
+from property_cache import PropertyCache
+from property_catalog import PropertyCatalog
+from url_resolver import URLResolver
+from lookup_coalescer import LookupCoalescer, group_leads_by_property
+from lead_parser import iter_lead_records
+from lead_index import LeadIdentityIndex, describe_duplicate
+from contact_ledger import ContactLedger, ACTION_SKIP, ACTION_FLAG, mark_contacted, contact_notice, flag_status
+from leads_table_model import LeadsTableModel, LeadsFilterProxyModel, LeadActionsDelegate, ACTIONS_COLUMN
+from log_sink import LogSink
+from run_statistics import RunStatistics
+from review_queue import ReviewQueue
+from warm_driver import WarmDriver
+from browser_profiles import PROFILE_STANDARD, PROFILE_LOOKUP
+from tab_pool import CONCURRENCY_BROWSERS, CONCURRENCY_TABS
+from driver_supervisor import DriverSupervisor, RECYCLE_AFTER_LOOKUPS, RECYCLE_RSS_MB
+from progress_events import (ProgressChannel, LogMessage, LeadStarted, LookupFinished, LeadUpdated,
+                             ProgressChanged, SOURCE_CACHE, SOURCE_CATALOG, SOURCE_SITE, SOURCE_SHARED)
 
 # Configurar logging
 logging.basicConfig(
@@ -42,6 +56,18 @@ SUCCESS_COLOR = "#4CAF50"  # Verde para sucesso
 WARNING_COLOR = "#FFC107"  # Amarelo para avisos
 ERROR_COLOR = "#F44336"  # Vermelho para erros
 
+# Pausa na digitação antes de filtrar a tabela de leads
+SEARCH_DEBOUNCE_MS = 200
+
+# Intervalo de leitura dos eventos de progresso do processamento
+UI_REFRESH_MS = 50
+
+# Espera após abrir a janela antes de aquecer o navegador, para não disputar a primeira pintura
+WARM_DRIVER_DELAY_MS = 2000
+
+# Espera após abrir a janela antes da primeira sincronização do catálogo de imóveis
+CATALOG_SYNC_DELAY_MS = 5000
+
 # Ícones em formato base64 para não depender de arquivos externos
 WHATSAPP_ICON = """
 <svg viewBox="-2.73 0 1225.016 1225.016" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" fill="#FFFFFF">
@@ -305,119 +331,132 @@ class Card(QFrame):
 
 class WorkerThread(QThread):
     """Thread para executar o processamento de leads em segundo plano"""
-    update_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int, int)  # (current, total)
-    lead_signal = pyqtSignal(dict)  # Emite informações do lead
     finished_signal = pyqtSignal(list)  # Emite lista de todos os leads processados
     error_signal = pyqtSignal(str)
     request_city_signal = pyqtSignal(dict)  # Solicitar cidade ao usuário
     warning_signal = pyqtSignal(str)  # Emite avisos não críticos
     
-    def __init__(self, file_path, headless=True, auto_skip=True):
+    def __init__(self, file_path, headless=True, auto_skip=True, pool_size=1, property_cache=None,
+                 contact_ledger=None, contact_window_days=30, contact_action=ACTION_SKIP, review_lookahead=10,
+                 warm_driver=None, browser_profile=PROFILE_STANDARD, property_catalog=None, url_resolver=None,
+                 concurrency_mode=CONCURRENCY_BROWSERS, tab_count=4, recycle_after_lookups=RECYCLE_AFTER_LOOKUPS,
+                 recycle_rss_mb=RECYCLE_RSS_MB):
         super().__init__()
         self.file_path = file_path
         self.headless = headless
         self.auto_skip = auto_skip
+        self.concurrency_mode = concurrency_mode
+        # No modo abas o paralelismo é o número de abas do navegador compartilhado
+        self.pool_size = max(1, tab_count if concurrency_mode == CONCURRENCY_TABS else pool_size)
+        self.property_cache = property_cache
+        self.contact_ledger = contact_ledger
+        self.contact_window_days = contact_window_days
+        self.contact_action = contact_action
+        self.already_contacted_leads = []
+        self.lookup_coalescer = LookupCoalescer()
+        self.events = ProgressChannel()  # Eventos de progresso lidos pela interface
+        self.statistics = RunStatistics()  # Contadores atualizados a cada lead concluído
+        self.review_queue = ReviewQueue(review_lookahead)  # Leads prontos para o operador
+        self.warm_driver = warm_driver  # Navegador já iniciado, usado na primeira busca via Selenium
+        self.browser_profile = browser_profile
+        self.property_catalog = property_catalog  # Índice local dos imóveis publicados no site
+        self.url_resolver = url_resolver  # Padrões de URL aprendidos para abrir o imóvel sem a busca
+        # Cada processador recebe um supervisor que reinicia o navegador travado e o recicla periodicamente
+        self.recycle_after_lookups = recycle_after_lookups
+        self.recycle_rss_mb = recycle_rss_mb
         self.processor = None
+        self.driver_pool = None
         self.stop_requested = False
         self.all_leads = []  # Lista para armazenar todos os leads processados
+        self.completed = {}  # Posição na lista buscada -> lead concluído
         self.current_lead_index = 0
         self.total_leads = 0
         
     def run(self):
         try:
-            self.update_signal.emit("🚀 Iniciando processamento de leads da CAIXA...")
+            self.events.log("🚀 Iniciando processamento de leads da CAIXA...")
             
-            # Inicializar o processador
+            # Inicializar o processador (Selenium só é carregado aqui, fora da abertura da janela)
             try:
-                self.processor = CAIXALeadProcessor(self.file_path, headless=self.headless)
-                self.update_signal.emit("✅ Processador inicializado com sucesso")
+                from caixa_lead_processor import CAIXALeadProcessor
+                # Sem console na interface: leads incompletos vão para a quarentena em vez de input()
+                self.processor = CAIXALeadProcessor(self.file_path, headless=self.headless,
+                                                    property_cache=self.property_cache,
+                                                    non_interactive=True, warm_driver=self.warm_driver,
+                                                    browser_profile=self.browser_profile,
+                                                    property_catalog=self.property_catalog,
+                                                    url_resolver=self.url_resolver,
+                                                    driver_supervisor=self.create_driver_supervisor())
+                self.events.log("✅ Processador inicializado com sucesso")
             except Exception as e:
                 self.error_signal.emit(f"Erro ao inicializar processador: {str(e)}")
                 return
             
             # Extrair leads
             try:
-                self.update_signal.emit("📄 [LENDO] Abrindo arquivo de leads...")
-                self.update_signal.emit(f"📁 [ARQUIVO] {self.file_path}")
+                self.events.log("📄 [LENDO] Abrindo arquivo de leads...")
+                self.events.log(f"📁 [ARQUIVO] {self.file_path}")
                 
-                self.update_signal.emit("🔍 [ANALISANDO] Extraindo informações dos leads...")
+                self.events.log("🔍 [ANALISANDO] Extraindo informações dos leads...")
                 leads = self.processor.extract_leads()
+                if self.processor.quarantined_count:
+                    self.warning_signal.emit(
+                        f"{self.processor.quarantined_count} lead(s) incompleto(s) enviados para quarentena: "
+                        f"{self.processor.quarantine_file}"
+                    )
                 
                 if not leads:
-                    self.update_signal.emit("⚠️ [VAZIO] Nenhum lead encontrado no arquivo.")
-                    self.update_signal.emit("📋 [DICA] Verifique se o arquivo contém dados no formato correto")
+                    self.events.log("⚠️ [VAZIO] Nenhum lead encontrado no arquivo.")
+                    self.events.log("📋 [DICA] Verifique se o arquivo contém dados no formato correto")
                     self.finished_signal.emit([])
                     return
                     
                 self.total_leads = len(leads)
-                self.update_signal.emit(f"✅ [SUCESSO] Encontrados {len(leads)} leads no arquivo.")
+                self.events.log(f"✅ [SUCESSO] Encontrados {len(leads)} leads no arquivo.")
                 
                 # Mostrar resumo dos leads encontrados
                 names = [lead.get('name', 'Nome não informado') for lead in leads[:3]]  # Primeiros 3 nomes
-                self.update_signal.emit(f"👥 [PREVIEW] Primeiros leads: {', '.join(names)}")
+                self.events.log(f"👥 [PREVIEW] Primeiros leads: {', '.join(names)}")
                 if len(leads) > 3:
-                    self.update_signal.emit(f"➕ [TOTAL] E mais {len(leads) - 3} leads...")
+                    self.events.log(f"➕ [TOTAL] E mais {len(leads) - 3} leads...")
+                
+                # Agrupar leads pelo imóvel para consultar cada código uma única vez
+                property_groups = group_leads_by_property(leads)
+                duplicates = len(leads) - len(property_groups)
+                if duplicates:
+                    self.events.log(
+                        f"🔁 [AGRUPADO] {len(property_groups)} imóveis únicos para {len(leads)} leads "
+                        f"({duplicates} consultas evitadas)"
+                    )
                 
             except Exception as e:
                 self.error_signal.emit(f"Erro ao extrair leads do arquivo: {str(e)}")
                 return
             
-            # Configurar o WebDriver
-            try:
-                self.update_signal.emit("🌐 [WEBDRIVER] Iniciando configuração do navegador...")
-                
+            # Leads já contatados recentemente não precisam de busca
+            file_leads = leads
+            leads = self.filter_contacted_leads(leads)
+            # O total inclui os leads ignorados, que já entram concluídos
+            self.statistics.start(len(file_leads))
+            for lead in self.already_contacted_leads:
+                self.statistics.record(lead["status"], skipped=True)
+            
+            # Processar os leads em paralelo quando o pool de navegadores estiver habilitado
+            if self.pool_size > 1 and len(leads) > 1:
+                self.process_leads_parallel(leads)
+            else:
+                # O navegador só é iniciado se alguma busca precisar do Selenium
+                self.events.log("⚡ [HTTP] Buscas feitas sem navegador; o Selenium é usado apenas como alternativa")
                 if self.headless:
-                    self.update_signal.emit("👤 [MODO] Execução em modo invisível (headless)")
+                    self.events.log("👤 [MODO] Execução em modo invisível (headless)")
                 else:
-                    self.update_signal.emit("🖥️ [MODO] Execução com interface visível")
-                
-                self.update_signal.emit("⬇️ [DOWNLOAD] Verificando ChromeDriver...")
-                self.processor.setup_driver(headless=self.headless)
-                self.update_signal.emit("✅ [WEBDRIVER] Navegador configurado e pronto para uso")
-                self.update_signal.emit("🚀 [PRONTO] Sistema pronto para processar leads")
-            except Exception as e:
-                self.error_signal.emit(f"Erro ao configurar WebDriver: {str(e)}")
-                return
-            
-            # Processar cada lead
-            for i, lead in enumerate(leads):
-                if self.stop_requested:
-                    self.update_signal.emit("⏹️ Processamento interrompido pelo usuário.")
-                    break
-                    
-                self.current_lead_index = i + 1
-                current = i + 1
-                self.progress_signal.emit(current, len(leads))
-                
-                lead_name = lead.get('name', 'Desconhecido')
-                property_id = lead.get('property_id', 'ID não encontrado')
-                phone = lead.get('phone', 'Telefone não informado')
-                
-                self.update_signal.emit("")  # Linha em branco para separar
-                self.update_signal.emit("=" * 60)
-                self.update_signal.emit(f"👤 [LEAD {current}/{len(leads)}] {lead_name}")
-                self.update_signal.emit(f"📞 [TELEFONE] {phone}")
-                self.update_signal.emit(f"🏠 [IMÓVEL ID] {property_id}")
-                self.update_signal.emit("=" * 60)
-                
-                # Emitir informações do lead para a interface
-                self.lead_signal.emit(lead)
-                
-                # Processar detalhes do imóvel com tratamento de erro robusto
-                lead_status = self.process_lead_safely(lead, property_id)
-                lead["status"] = lead_status
+                    self.events.log("🖥️ [MODO] Execução com interface visível")
+                self.events.log("🚀 [PRONTO] Sistema pronto para processar leads")
                 
-                # Adicionar o lead à lista de todos os leads
-                self.all_leads.append(lead.copy())
+                self.process_leads_sequential(leads)
                 
-                # Atualizar o lead na interface
-                self.lead_signal.emit(lead)
-                
-                # Aguardar um pouco para permitir que o usuário veja as informações
-                self.msleep(500)  # 500ms de pausa
-                
-            self.update_signal.emit("🎉 Processamento de leads concluído!")
+            self.all_leads = self.merge_in_file_order(file_leads, leads)
+            self.events.log("🎉 Processamento de leads concluído!")
             self.finished_signal.emit(self.all_leads)
             
         except Exception as e:
@@ -426,19 +465,198 @@ class WorkerThread(QThread):
             self.error_signal.emit(error_msg)
             self.finished_signal.emit(self.all_leads)  # Enviar leads processados até agora
         finally:
+            # Nenhum lead novo para revisão; os que já estão na fila continuam disponíveis
+            self.review_queue.close()
             # Limpar recursos
             self.cleanup_resources()
     
-    def process_lead_safely(self, lead, property_id):
+    def create_driver_supervisor(self, max_rss_mb=None):
+        """Criar o supervisor do navegador de um processador"""
+        max_rss_mb = self.recycle_rss_mb if max_rss_mb is None else max_rss_mb
+        return DriverSupervisor(recycle_after=self.recycle_after_lookups, max_rss_mb=max_rss_mb)
+    
+    def filter_contacted_leads(self, leads):
+        """Separar os leads já contatados dentro da janela configurada"""
+        if not self.contact_ledger:
+            return leads
+        
+        to_process = []
+        for lead in leads:
+            last_contact = self.contact_ledger.last_contact(lead, self.contact_window_days)
+            if last_contact is None:
+                to_process.append(lead)
+                continue
+            
+            mark_contacted(lead, last_contact)
+            notice = contact_notice(lead)
+            
+            if self.contact_action == ACTION_SKIP:
+                lead["status"] = f"⏭️ {notice}"
+                self.already_contacted_leads.append(lead)
+                self.events.log(f"⏭️ [JÁ CONTATADO] {lead.get('name', 'Desconhecido')} ({lead.get('property_id', '')}): {notice} - ignorado")
+            else:
+                # Buscado normalmente; o aviso segue no status e no painel do lead
+                to_process.append(lead)
+                self.events.log(f"⚠️ [JÁ CONTATADO] {lead.get('name', 'Desconhecido')} ({lead.get('property_id', '')}): {notice} - sinalizado")
+        
+        if self.already_contacted_leads:
+            self.events.log(f"⏭️ [HISTÓRICO] {len(self.already_contacted_leads)} leads já contatados nos últimos {self.contact_window_days} dias não serão buscados")
+        return to_process
+    
+    def merge_in_file_order(self, file_leads, searched_leads):
+        """Juntar os leads buscados e os ignorados na ordem do arquivo"""
+        positions = {id(lead): position for position, lead in enumerate(file_leads)}
+        merged = {positions[id(searched_leads[index])]: lead for index, lead in self.completed.items()}
+        merged.update((positions[id(lead)], lead) for lead in self.already_contacted_leads)
+        return [merged[position] for position in sorted(merged)]
+    
+    def announce_lead(self, current, total, lead):
+        """Publicar o início do processamento de um lead"""
+        self.events.publish(LeadStarted(current, total, lead.get('name'), lead.get('phone'), lead.get('property_id')))
+    
+    def process_leads_sequential(self, leads):
+        """Processar os leads um a um com o navegador do processador principal"""
+        for i, lead in enumerate(leads):
+            if self.stop_requested:
+                self.events.log("⏹️ Processamento interrompido pelo usuário.")
+                break
+                
+            self.current_lead_index = i + 1
+            current = i + 1
+            
+            self.announce_lead(current, len(leads), lead)
+            
+            # Processar detalhes do imóvel com tratamento de erro robusto
+            property_id = lead.get('property_id', 'ID não encontrado')
+            lead_status = flag_status(self.process_lead_safely(lead, property_id), lead)
+            lead["status"] = lead_status
+            
+            # Adicionar o lead à lista de todos os leads
+            finished = lead.copy()
+            self.completed[i] = finished
+            self.all_leads.append(finished)
+            self.statistics.record(lead_status)
+            self.events.publish(ProgressChanged(current, len(leads)))
+            
+            # Entregar o lead ao operador; aguarda se a fila de revisão estiver cheia
+            self.hand_over_lead(finished)
+    
+    def hand_over_lead(self, lead):
+        """Colocar um lead resolvido na fila de revisão e avisar a interface"""
+        if self.review_queue.put(lead, should_stop=lambda: self.stop_requested):
+            self.events.publish(LeadUpdated(lead))
+    
+    def process_leads_parallel(self, leads):
+        """Processar os leads em paralelo usando um pool de navegadores"""
+        from driver_pool import DriverPool
+        from tab_pool import TabPool
+        from caixa_lead_processor import CAIXALeadProcessor
+        
+        pool_size = min(self.pool_size, len(leads))
+        
+        def lookup(processor, item):
+            index, lead = item
+            self.announce_lead(index + 1, len(leads), lead)
+            property_id = lead.get('property_id', 'ID não encontrado')
+            # Linhas de workers diferentes se intercalam no log; o código do imóvel as identifica
+            with self.events.lead_context(property_id):
+                lead["status"] = flag_status(self.process_lead_safely(lead, property_id, processor), lead)
+            return lead
+        
+        def lookup_failed(item, error):
+            # O worker falhou fora do process_lead_safely (ex.: ao criar o processador)
+            index, lead = item
+            self.events.log(f"[{lead.get('property_id', '')}] ❌ [ERRO] Falha no worker ao processar {lead.get('name', 'Desconhecido')}: {str(error)}")
+            lead["property_url"] = ""
+            lead["city"] = ""
+            lead["manual_review_needed"] = True
+            lead["manual_review_reason"] = f"Erro crítico: {str(error)}"
+            lead["status"] = flag_status(f"❌ Erro crítico - {str(error)[:50]}...", lead)
+            return lead
+        
+        tabs = self.concurrency_mode == CONCURRENCY_TABS
+        # Em abas, a memória medida é a do navegador inteiro: o limite fica com o TabPool
+        tab_max_rss_mb = 0 if tabs else None
+        processor_factory = lambda: CAIXALeadProcessor(headless=self.headless, property_cache=self.property_cache,
+                                                       warm_driver=self.warm_driver,
+                                                       browser_profile=self.browser_profile,
+                                                       property_catalog=self.property_catalog,
+                                                       url_resolver=self.url_resolver,
+                                                       driver_supervisor=self.create_driver_supervisor(tab_max_rss_mb))
+        if tabs:
+            # Um único Chrome com uma aba por worker: menos memória que um navegador por busca
+            self.events.log(f"🗂️ [ABAS] Iniciando {pool_size} abas em um único navegador...")
+            self.driver_pool = TabPool(pool_size, headless=self.headless, processor_factory=processor_factory,
+                                       max_rss_mb=self.recycle_rss_mb)
+        else:
+            self.events.log(f"🌐 [WEBDRIVER] Iniciando pool com {pool_size} navegadores...")
+            self.driver_pool = DriverPool(pool_size, headless=self.headless, processor_factory=processor_factory)
+        try:
+            with self.driver_pool as pool:
+                self.events.log("🚀 [PRONTO] Sistema pronto para processar leads")
+                # Primeira ocorrência de cada imóvel primeiro, para que nenhum worker fique esperando uma busca em andamento
+                groups = group_leads_by_property(leads).values()
+                order = [indexes[0] for indexes in groups] + [index for indexes in groups for index in indexes[1:]]
+                items = [(index, leads[index]) for index in order]
+                results = pool.imap_unordered(lookup, items, should_stop=lambda: self.stop_requested,
+                                              on_error=lookup_failed)
+                
+                # Os resultados chegam na ordem de conclusão
+                for done, (_, (index, _), lead) in enumerate(results, 1):
+                    finished = lead.copy()
+                    self.completed[index] = finished
+                    self.all_leads.append(finished)
+                    self.statistics.record(lead["status"])
+                    self.current_lead_index = done
+                    self.events.publish(ProgressChanged(done, len(leads)))
+                    self.hand_over_lead(finished)
+        finally:
+            self.driver_pool = None
+        
+        if self.stop_requested:
+            self.events.log("⏹️ Processamento interrompido pelo usuário.")
+        # run() devolve os leads à ordem do arquivo com merge_in_file_order()
+    
+    def fetch_property_details(self, processor, property_id, start_time):
+        """Buscar os detalhes do imóvel no cache ou no site"""
+        import time
+        
+        # Consultar o cache antes de acessar o site
+        property_details = processor.property_cache.get(property_id) if processor.property_cache else None
+        if property_details:
+            self.events.publish(LookupFinished(property_id, SOURCE_CACHE, time.time() - start_time))
+            return property_details
+        
+        # Depois o catálogo local, sincronizado com o site em segundo plano
+        property_details = processor.property_catalog.get(property_id) if processor.property_catalog else None
+        if property_details:
+            self.events.publish(LookupFinished(property_id, SOURCE_CATALOG, time.time() - start_time))
+            return property_details
+        
+        # Etapa 3: Conectando ao site da CAIXA
+        self.events.log("🌐 [CONECTANDO] Acessando site da CAIXA...")
+        
+        supervisor = processor.driver_supervisor
+        replaced = supervisor.restarts + supervisor.recycles if supervisor else 0
+        property_details = processor.search_property_details(property_id, use_cache=False)
+        if supervisor and supervisor.restarts + supervisor.recycles != replaced:
+            self.events.log("♻️ [NAVEGADOR] Navegador reiniciado (travado ou reciclado) durante esta busca")
+        
+        self.events.publish(LookupFinished(property_id, SOURCE_SITE, time.time() - start_time,
+                                           processor.webdriver_commands))
+        return property_details
+    
+    def process_lead_safely(self, lead, property_id, processor=None):
         """Processar um lead individual com tratamento de erro robusto"""
+        processor = processor or self.processor
         try:
             lead_name = lead.get('name', 'Desconhecido')
             
             # Etapa 1: Iniciar processamento do lead
-            self.update_signal.emit(f"🔄 [INICIANDO] Processamento do lead: {lead_name}")
+            self.events.log(f"🔄 [INICIANDO] Processamento do lead: {lead_name}")
             
             # Etapa 2: Buscar detalhes do imóvel
-            self.update_signal.emit(f"🔍 [PESQUISANDO] Buscando detalhes do imóvel (ID: {property_id})...")
+            self.events.log(f"🔍 [PESQUISANDO] Buscando detalhes do imóvel (ID: {property_id})...")
             
             try:
                 # Usar timeout mais curto para evitar travamentos
@@ -452,69 +670,68 @@ class WorkerThread(QThread):
                 timeout_seconds = 30
                 start_time = time.time()
                 
-                # Etapa 3: Conectando ao site da CAIXA
-                self.update_signal.emit("🌐 [CONECTANDO] Acessando site da CAIXA...")
-                
-                property_details = self.processor.search_property_details(property_id)
-                
-                elapsed_time = time.time() - start_time
-                self.update_signal.emit(f"⏱️ [TEMPO] Busca realizada em {elapsed_time:.1f} segundos")
+                # Uma única busca por imóvel no lote; leads repetidos reutilizam o resultado
+                property_details, shared = self.lookup_coalescer.run(
+                    property_id, lambda: self.fetch_property_details(processor, property_id, start_time)
+                )
+                if shared:
+                    self.events.publish(LookupFinished(property_id, SOURCE_SHARED, time.time() - start_time))
                 
                 if property_details and property_details.get("url"):
                     lead["property_url"] = property_details["url"]
-                    self.update_signal.emit(f"✅ [SUCESSO] URL do imóvel encontrada")
-                    self.update_signal.emit(f"🔗 [URL] {property_details['url'][:60]}...")
+                    self.events.log(f"✅ [SUCESSO] URL do imóvel encontrada")
+                    self.events.log(f"🔗 [URL] {property_details['url'][:60]}...")
                     
                     # Etapa 4: Verificar disponibilidade do imóvel
-                    self.update_signal.emit("🔍 [VERIFICANDO] Disponibilidade do imóvel...")
+                    self.events.log("🔍 [VERIFICANDO] Disponibilidade do imóvel...")
                     
                     # Verificar se o imóvel não está mais disponível
                     if property_details.get("property_not_available"):
                         lead["property_not_available"] = True
                         lead["error_details"] = "property_no_longer_available"
                         lead["city"] = "N/A - Imóvel não disponível"
-                        self.update_signal.emit("⚠️ [INDISPONÍVEL] Imóvel não está mais disponível para venda")
-                        self.update_signal.emit("💬 [TEMPLATE] Mensagem especial será utilizada para este lead")
-                        self.update_signal.emit(f"✅ [FINALIZADO] Lead {lead_name} processado com template especial")
+                        self.events.log("⚠️ [INDISPONÍVEL] Imóvel não está mais disponível para venda")
+                        self.events.log("💬 [TEMPLATE] Mensagem especial será utilizada para este lead")
+                        self.events.log(f"✅ [FINALIZADO] Lead {lead_name} processado com template especial")
                         return "⚠️ Imóvel não disponível - Usar mensagem especial"
                     
-                    self.update_signal.emit("✅ [DISPONÍVEL] Imóvel está disponível para venda")
+                    self.events.log("✅ [DISPONÍVEL] Imóvel está disponível para venda")
                     
                     # Etapa 5: Extrair informações da cidade
-                    self.update_signal.emit("🏙️ [EXTRAINDO] Informações da cidade...")
+                    self.events.log("🏙️ [EXTRAINDO] Informações da cidade...")
                     
                     # Tentar extrair cidade com tratamento de erro específico
                     if property_details.get("city"):
                         lead["city"] = property_details["city"]
-                        self.update_signal.emit(f"✅ [CIDADE] Cidade extraída com sucesso: {property_details['city']}")
-                        self.update_signal.emit(f"🎯 [COMPLETO] Lead {lead_name} processado completamente")
+                        self.events.log(f"✅ [CIDADE] Cidade extraída com sucesso: {property_details['city']}")
+                        self.events.log(f"🎯 [COMPLETO] Lead {lead_name} processado completamente")
                         return "✅ Completo"
                     else:
                         # Cidade não encontrada - marcar para revisão manual
-                        self.update_signal.emit("⚠️ [CIDADE] Cidade não encontrada automaticamente")
-                        self.update_signal.emit("🔍 [TENTATIVA] Tentando métodos alternativos de extração...")
-                        self.update_signal.emit("❌ [FALHA] Métodos alternativos não obtiveram sucesso")
-                        self.update_signal.emit(f"📝 [MANUAL] Lead marcado para revisão manual")
-                        self.update_signal.emit(f"🔗 [REVISÃO] URL para revisão: {property_details['url'][:50]}...")
+                        self.events.log("⚠️ [CIDADE] Cidade não encontrada automaticamente")
+                        self.events.log("🔍 [TENTATIVA] Tentando métodos alternativos de extração...")
+                        self.events.log("❌ [FALHA] Métodos alternativos não obtiveram sucesso")
+                        self.events.log(f"📝 [MANUAL] Lead marcado para revisão manual")
+                        self.events.log(f"🔗 [REVISÃO] URL para revisão: {property_details['url'][:50]}...")
                         lead["city"] = "PENDENTE - Revisar manualmente"
                         lead["manual_review_needed"] = True
                         lead["manual_review_reason"] = "Cidade não encontrada automaticamente"
                         return "⚠️ Pendente - Revisar cidade manualmente"
                         
                 else:
-                    self.update_signal.emit(f"❌ [ERRO] Imóvel não encontrado no sistema (ID: {property_id})")
-                    self.update_signal.emit(f"🔍 [DIAGNÓSTICO] Possíveis causas: ID inválido ou imóvel removido")
+                    self.events.log(f"❌ [ERRO] Imóvel não encontrado no sistema (ID: {property_id})")
+                    self.events.log(f"🔍 [DIAGNÓSTICO] Possíveis causas: ID inválido ou imóvel removido")
                     lead["property_url"] = ""
                     lead["city"] = ""
                     lead["manual_review_needed"] = True
                     lead["manual_review_reason"] = "Imóvel não encontrado no site"
-                    self.update_signal.emit(f"📝 [MANUAL] Lead {lead_name} requer verificação manual")
+                    self.events.log(f"📝 [MANUAL] Lead {lead_name} requer verificação manual")
                     return f"❌ Erro - Imóvel não encontrado"
                     
             except TimeoutError as e:
-                self.update_signal.emit(f"⏱️ [TIMEOUT] Timeout na busca do imóvel após {timeout_seconds}s")
-                self.update_signal.emit(f"🌐 [CONECTIVIDADE] Possível problema de conexão ou site lento")
-                self.update_signal.emit(f"🔗 [ALTERNATIVA] Tentando obter URL alternativa...")
+                self.events.log(f"⏱️ [TIMEOUT] Timeout na busca do imóvel após {timeout_seconds}s")
+                self.events.log(f"🌐 [CONECTIVIDADE] Possível problema de conexão ou site lento")
+                self.events.log(f"🔗 [ALTERNATIVA] Tentando obter URL alternativa...")
                 # Tentar obter pelo menos a URL se possível
                 try:
                     url = f"https://viahouseleiloes.com.br/search?property_id={property_id}"
@@ -522,11 +739,11 @@ class WorkerThread(QThread):
                     lead["city"] = "PENDENTE - Timeout na busca"
                     lead["manual_review_needed"] = True
                     lead["manual_review_reason"] = f"Timeout após {timeout_seconds}s"
-                    self.update_signal.emit(f"✅ [URL] URL alternativa gerada para revisão manual")
-                    self.update_signal.emit(f"🔗 [REVISÃO] {url}")
-                    self.update_signal.emit(f"⚠️ [PENDENTE] Lead {lead_name} marcado para revisão devido ao timeout")
+                    self.events.log(f"✅ [URL] URL alternativa gerada para revisão manual")
+                    self.events.log(f"🔗 [REVISÃO] {url}")
+                    self.events.log(f"⚠️ [PENDENTE] Lead {lead_name} marcado para revisão devido ao timeout")
                 except:
-                    self.update_signal.emit(f"❌ [FALHA] Não foi possível gerar URL alternativa")
+                    self.events.log(f"❌ [FALHA] Não foi possível gerar URL alternativa")
                     lead["property_url"] = ""
                     lead["city"] = ""
                 return "⚠️ Erro - Timeout na busca"
@@ -539,8 +756,8 @@ class WorkerThread(QThread):
                 import traceback
                 stack_trace = traceback.format_exc()
                 
-                self.update_signal.emit(f"❌ ERRO DETALHADO: {error_details}")
-                self.update_signal.emit(f"📋 Stack Trace:\n{stack_trace}")
+                self.events.log(f"❌ ERRO DETALHADO: {error_details}")
+                self.events.log(f"📋 Stack Trace:\n{stack_trace}")
                 
                 # Tentar obter pelo menos uma URL para revisão manual
                 try:
@@ -550,7 +767,7 @@ class WorkerThread(QThread):
                     lead["manual_review_needed"] = True
                     lead["manual_review_reason"] = f"Erro: {error_details[:100]}..."
                     lead["error_stack_trace"] = stack_trace
-                    self.update_signal.emit(f"🔗 URL para revisão manual: {fallback_url}")
+                    self.events.log(f"🔗 URL para revisão manual: {fallback_url}")
                 except:
                     lead["property_url"] = ""
                     lead["city"] = ""
@@ -571,11 +788,11 @@ class WorkerThread(QThread):
             try:
                 import traceback
                 stack_trace = traceback.format_exc()
-                self.update_signal.emit(f"📋 Stack Trace Crítico:\n{stack_trace}")
+                self.events.log(f"📋 Stack Trace Crítico:\n{stack_trace}")
             except:
                 pass
                 
-            self.update_signal.emit(error_msg)
+            self.events.log(error_msg)
             lead["property_url"] = ""
             lead["city"] = ""
             lead["manual_review_needed"] = True
@@ -586,18 +803,62 @@ class WorkerThread(QThread):
     def cleanup_resources(self):
         """Limpar recursos usados pelo processador"""
         try:
-            if self.processor and hasattr(self.processor, 'driver') and self.processor.driver:
-                self.processor.driver.quit()
-                self.update_signal.emit("🧹 Recursos do WebDriver liberados")
+            if self.driver_pool:
+                # Não bloquear a interface esperando as buscas em andamento
+                self.driver_pool.shutdown(wait=False)
+                self.events.log("🧹 Pool de navegadores encerrado")
+            if self.processor:
+                had_driver = bool(self.processor.driver)
+                # Fecha a sessão HTTP e encerra o WebDriver do processador
+                self.processor.close()
+                if had_driver:
+                    self.events.log("🧹 Recursos do WebDriver liberados")
         except Exception as e:
-            self.update_signal.emit(f"⚠️ Aviso ao limpar recursos: {str(e)}")
+            self.events.log(f"⚠️ Aviso ao limpar recursos: {str(e)}")
     
     def stop(self):
         """Parar o processamento graciosamente"""
         self.stop_requested = True
-        self.update_signal.emit("⏸️ Solicitando interrupção do processamento...")
+        self.review_queue.close()
+        self.events.log("⏸️ Solicitando interrupção do processamento...")
         self.cleanup_resources()
 
+class CatalogSyncThread(QThread):
+    """Thread para sincronizar o catálogo de imóveis com o site sem travar a interface"""
+    finished_signal = pyqtSignal(dict)  # Contadores da sincronização
+    
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+    
+    def run(self):
+        self.finished_signal.emit(self.catalog.sync(should_stop=self.isInterruptionRequested))
+
+class BulkParseThread(QThread):
+    """Thread para extrair leads do texto colado sem travar a interface"""
+    progress_signal = pyqtSignal(int, int)  # (caracteres lidos, total)
+    finished_signal = pyqtSignal(list)  # Lista de leads extraídos
+    
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+    
+    def run(self):
+        total = len(self.text)
+        lines = self.text.splitlines(keepends=True)
+        
+        def tracked_lines():
+            consumed = 0
+            for i, line in enumerate(lines, 1):
+                consumed += len(line)
+                if i % 2000 == 0:
+                    self.progress_signal.emit(consumed, total)
+                yield line
+        
+        leads = [lead for _, lead in iter_lead_records(tracked_lines()) if lead]
+        self.progress_signal.emit(total, total)
+        self.finished_signal.emit(leads)
+
 class EditLeadDialog(QDialog):
     """Diálogo para editar informações do lead"""
     
@@ -805,24 +1066,33 @@ class ReportDialog(QMainWindow):
         table_card = Card("Lista de Leads")
         table_layout = QVBoxLayout()
         
-        self.leads_table = QTableWidget()
-        self.leads_table.setColumnCount(7)
-        self.leads_table.setHorizontalHeaderLabels(["Nome", "Email", "Telefone", "ID do Imóvel", "Cidade", "Status", "Ações"])
+        self.leads_model = LeadsTableModel(
+            self.leads,
+            headers=["Nome", "Email", "Telefone", "ID do Imóvel", "Cidade", "Status", "Ações"],
+            status_color=self.status_color
+        )
+        self.actions_delegate = LeadActionsDelegate(self.lead_actions, self)
+        self.actions_delegate.action_triggered.connect(self.handle_lead_action)
+        
+        self.leads_table = QTableView()
+        self.leads_table.setModel(self.leads_model)
+        self.leads_table.setItemDelegateForColumn(ACTIONS_COLUMN, self.actions_delegate)
         self.leads_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.leads_table.verticalHeader().setDefaultSectionSize(40)
         self.leads_table.setAlternatingRowColors(True)
         self.leads_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 background-color: white;
                 gridline-color: #f0f0f0;
                 font-family: 'Segoe UI';
                 font-size: 13px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
                 border-bottom: 1px solid #f0f0f0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e0f2f1;
                 color: #075e54;
             }
@@ -835,14 +1105,11 @@ class ReportDialog(QMainWindow):
                 font-family: 'Segoe UI';
                 font-size: 13px;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #f9f9f9;
             }
         """)
         
-        # Preencher a tabela com os leads
-        self.populate_table()
-        
         table_layout.addWidget(self.leads_table)
         table_card.layout.addLayout(table_layout)
         main_layout.addWidget(table_card, 1)  # 1 é o stretch factor
@@ -907,84 +1174,29 @@ class ReportDialog(QMainWindow):
         
         return card
     
-    def populate_table(self):
-        """Preencher a tabela com os leads"""
-        self.leads_table.setRowCount(len(self.leads))
-        
-        for i, lead in enumerate(self.leads):
-            # Nome
-            self.leads_table.setItem(i, 0, QTableWidgetItem(lead.get("name", "-")))
-            
-            # Email
-            self.leads_table.setItem(i, 1, QTableWidgetItem(lead.get("email", "-")))
-            
-            # Telefone
-            self.leads_table.setItem(i, 2, QTableWidgetItem(lead.get("phone", "-")))
-            
-            # ID do Imóvel
-            self.leads_table.setItem(i, 3, QTableWidgetItem(lead.get("property_id", "-")))
-            
-            # Cidade
-            city_item = QTableWidgetItem(lead.get("city", "-"))
-            self.leads_table.setItem(i, 4, city_item)
-            
-            # Status
-            status = lead.get("status", "-")
-            status_item = QTableWidgetItem(status)
-            
-            # Definir cor do status
-            if status == "Completo":
-                status_item.setForeground(QColor("#4CAF50"))
-            elif status.startswith("Pendente"):
-                status_item.setForeground(QColor("#FFC107"))
-            
-            self.leads_table.setItem(i, 5, status_item)
-            
-            # Botões de ação
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Botão para editar cidade
-            if status.startswith("Pendente"):
-                edit_button = QPushButton("Editar Cidade")
-                edit_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FFC107;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 5px 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #FFD54F;
-                    }
-                """)
-                edit_button.clicked.connect(lambda checked, row=i: self.edit_city(row))
-                action_layout.addWidget(edit_button)
-            
-            # Botão para ver imóvel
-            if lead.get("property_url"):
-                view_button = QPushButton("Ver Imóvel")
-                view_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #075e54;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 5px 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #128c7e;
-                    }
-                """)
-                view_button.clicked.connect(lambda checked, url=lead.get("property_url"): self.view_property(url))
-                action_layout.addWidget(view_button)
-            
-            action_layout.addStretch()
-            self.leads_table.setCellWidget(i, 6, action_widget)
+    def status_color(self, status):
+        """Cor usada para exibir um status na tabela"""
+        if status == "Completo":
+            return "#4CAF50"
+        if status.startswith("Pendente"):
+            return "#FFC107"
+        return None
+    
+    def lead_actions(self, lead):
+        """Botões de ação exibidos para um lead"""
+        actions = []
+        if lead.get("status", "-").startswith("Pendente"):
+            actions.append(("edit_city", "Editar Cidade", "#FFC107"))
+        if lead.get("property_url"):
+            actions.append(("view_property", "Ver Imóvel", "#075e54"))
+        return actions
+    
+    def handle_lead_action(self, row, action):
+        """Executar a ação clicada na tabela"""
+        if action == "edit_city":
+            self.edit_city(row)
+        elif action == "view_property":
+            self.view_property(self.leads[row].get("property_url"))
     
     def edit_city(self, row):
         """Editar a cidade de um lead"""
@@ -1006,37 +1218,8 @@ class ReportDialog(QMainWindow):
             lead["city"] = city
             lead["status"] = "Completo"
             
-            # Atualizar a tabela
-            self.leads_table.item(row, 4).setText(city)
-            self.leads_table.item(row, 5).setText("Completo")
-            self.leads_table.item(row, 5).setForeground(QColor("#4CAF50"))
-            
-            # Atualizar o widget de ação
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # Botão para ver imóvel
-            if lead.get("property_url"):
-                view_button = QPushButton("Ver Imóvel")
-                view_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #075e54;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 5px 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #128c7e;
-                    }
-                """)
-                view_button.clicked.connect(lambda checked, url=lead.get("property_url"): self.view_property(url))
-                action_layout.addWidget(view_button)
-            
-            action_layout.addStretch()
-            self.leads_table.setCellWidget(row, 6, action_widget)
+            # Atualizar apenas a linha do lead (os botões são redesenhados pelo delegate)
+            self.leads_model.update_lead(row)
             
             # Atualizar estatísticas
             self.update_stats()
@@ -1114,9 +1297,65 @@ class LeadProcessorGUI(QMainWindow):
         # Inicializar sistema de configurações
         self.settings = AppSettings()
         
+        # Cache de imóveis compartilhado entre execuções
+        self.property_cache = PropertyCache.from_settings(self.settings) if self.settings.get("cache.enabled", True) else None
+        
+        # Catálogo local dos imóveis do site, atualizado periodicamente a partir do sitemap
+        self.property_catalog = PropertyCatalog.from_settings(self.settings) if self.settings.get("catalog.enabled", True) else None
+        self.catalog_thread = None
+        self.catalog_timer = QTimer(self)
+        self.catalog_timer.setInterval(self.settings.get("catalog.refresh_hours", 6) * 3600 * 1000)
+        self.catalog_timer.timeout.connect(self.sync_catalog)
+        
+        # Padrões de URL aprendidos nas buscas, para abrir a página do imóvel diretamente
+        self.url_resolver = URLResolver.from_settings(self.settings) if self.settings.get("processing.direct_urls", True) else None
+        
+        # Histórico de contatos para não abordar o mesmo lead duas vezes
+        self.contact_ledger = ContactLedger.from_settings(self.settings) if self.settings.get("contact_history.enabled", True) else None
+        
+        # Mensagens de log são enfileiradas e exibidas em lotes
+        self.log_sink = LogSink.from_settings(self.settings, self.write_log_batch, self)
+        
+        # Navegador headless iniciado em segundo plano e entregue à próxima execução
+        self.warm_driver = WarmDriver(
+            browser_profile=self.settings.get("processing.browser_profile", PROFILE_STANDARD)
+        ) if self.settings.get("processing.warm_driver", True) else None
+        
+        # O documento do log existe desde o início; a aba de logs só é montada quando aberta
+        self.log_document = QTextDocument(self)
+        self.log_document.setHtml("""
+            <style>
+                .info { color: #50fa7b; }
+                .warning { color: #f1fa8c; }
+                .error { color: #ff5555; }
+                .debug { color: #8be9fd; }
+                .timestamp { color: #6272a4; }
+            </style>
+            <div style="color: #f8f8f2; text-align: center; padding: 20px;">
+                <h3>Sistema de Logs Iniciado</h3>
+                <p>Os logs do processamento aparecerão aqui em tempo real...</p>
+            </div>
+        """)
+        # Manter apenas as últimas linhas; o histórico completo fica em logs/
+        self.log_document.setMaximumBlockCount(self.settings.get("processing.log_view_max_lines", 5000))
+        
         self.worker_thread = None
         self.current_lead = None
         self.processed_leads = []
+        self.run_statistics = RunStatistics()  # Estatísticas dos leads exibidos nos relatórios
+        self.leads_model = LeadsTableModel(self.processed_leads, status_color=self.lead_status_color)
+        
+        # Eventos do processamento são lidos em intervalos fixos, não um a um
+        self.event_timer = QTimer(self)
+        self.event_timer.setInterval(UI_REFRESH_MS)
+        self.event_timer.timeout.connect(self.drain_progress_events)
+        self.event_handlers = {
+            LogMessage: lambda event: self.log(event.text),
+            LeadStarted: self.on_lead_started,
+            LookupFinished: self.on_lookup_finished,
+            LeadUpdated: self.on_lead_ready,
+            ProgressChanged: lambda event: self.update_progress(event.current, event.total),
+        }
         self.current_lead_index = 0  # Para navegação entre leads
         
         # Timer para auto-salvamento
@@ -1145,6 +1384,14 @@ class LeadProcessorGUI(QMainWindow):
         
         # Iniciar animação de carregamento
         self.start_loading_animation()
+        
+        # Aquecer o navegador enquanto o operador prepara o lote
+        QTimer.singleShot(WARM_DRIVER_DELAY_MS, self.warm_up_driver)
+        
+        # Sincronizar o catálogo de imóveis logo após a abertura e depois periodicamente
+        if self.property_catalog:
+            QTimer.singleShot(CATALOG_SYNC_DELAY_MS, self.sync_catalog)
+            self.catalog_timer.start()
     
     def center_window(self):
         """Centralizar a janela na tela"""
@@ -1419,6 +1666,10 @@ class LeadProcessorGUI(QMainWindow):
         # Estatística 4: Leads com Erro
         self.stats_error = self.create_stat_widget("Com Erro", "0", ERROR_COLOR)
         
+        # Estatística 5: Acertos do cache de imóveis
+        self.stats_cache = self.create_stat_widget("Cache", "0/0", PRIMARY_COLOR)
+        self.stats_cache.setToolTip("Acertos / falhas do cache de imóveis")
+        
         # Barra de progresso
         progress_widget = QWidget()
         progress_layout = QVBoxLayout(progress_widget)
@@ -1456,6 +1707,7 @@ class LeadProcessorGUI(QMainWindow):
         stats_layout.addWidget(self.stats_complete)
         stats_layout.addWidget(self.stats_pending)
         stats_layout.addWidget(self.stats_error)
+        stats_layout.addWidget(self.stats_cache)
         stats_layout.addStretch()
         stats_layout.addWidget(progress_widget)
         
@@ -1522,17 +1774,35 @@ class LeadProcessorGUI(QMainWindow):
         # Aba 3: Processamento
         self.create_processing_tab()
         
+        # Abas 4 a 6 só são montadas na primeira vez que forem abertas
+        self.lazy_tabs = {}
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
+        
         # Aba 4: Relatórios
-        self.create_reports_tab()
+        self.add_lazy_tab(self.create_reports_tab, "📊 Relatórios")
         
         # Aba 5: Logs
-        self.create_logs_tab()
+        self.add_lazy_tab(self.create_logs_tab, "📝 Logs")
         
         # Aba 6: Configurações Avançadas
-        self.create_advanced_settings_tab()
+        self.add_lazy_tab(self.create_advanced_settings_tab, "⚙️ Configurações")
         
         parent_layout.addWidget(self.tab_widget)
     
+    def add_lazy_tab(self, builder, title):
+        """Adicionar aba cujo conteúdo é criado por builder() ao ser aberta pela primeira vez"""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tab_widget.addTab(placeholder, title)
+        self.lazy_tabs[index] = builder
+    
+    def ensure_tab_built(self, index):
+        """Montar o conteúdo de uma aba adiada, se ainda não foi montado"""
+        builder = self.lazy_tabs.pop(index, None)
+        if builder:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+    
     def create_config_tab(self):
         """Criar aba de configuração"""
         config_tab = QWidget()
@@ -1652,6 +1922,122 @@ class LeadProcessorGUI(QMainWindow):
         timeout_layout.addWidget(self.timeout_spinbox)
         timeout_layout.addStretch()
         
+        # Número de navegadores em paralelo
+        pool_layout = QHBoxLayout()
+        pool_label = QLabel("Navegadores em paralelo:")
+        pool_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        
+        self.pool_size_spinbox = QSpinBox()
+        self.pool_size_spinbox.setRange(1, 8)
+        self.pool_size_spinbox.setValue(self.settings.get("processing.driver_pool_size", 2))
+        self.pool_size_spinbox.setStyleSheet("""
+            QSpinBox {
+                border: 2px solid #e0e0e0;
+                border-radius: 6px;
+                padding: 8px 12px;
+                background-color: white;
+                font-size: 13px;
+                min-width: 80px;
+            }
+            QSpinBox:focus {
+                border-color: #1976D2;
+            }
+        """)
+        self.pool_size_spinbox.valueChanged.connect(lambda x: self.settings.set("processing.driver_pool_size", x))
+        
+        pool_layout.addWidget(pool_label)
+        pool_layout.addWidget(self.pool_size_spinbox)
+        pool_layout.addStretch()
+        
+        # Paralelismo com vários navegadores ou com abas de um único navegador
+        concurrency_layout = QHBoxLayout()
+        concurrency_label = QLabel("Modo de paralelismo:")
+        concurrency_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        
+        self.concurrency_mode_combo = QComboBox()
+        self.concurrency_mode_combo.addItem("Um navegador por busca", CONCURRENCY_BROWSERS)
+        self.concurrency_mode_combo.addItem("Abas em um único navegador (menos memória)", CONCURRENCY_TABS)
+        self.concurrency_mode_combo.setCurrentIndex(
+            max(0, self.concurrency_mode_combo.findData(self.settings.get("processing.concurrency_mode", CONCURRENCY_BROWSERS)))
+        )
+        self.concurrency_mode_combo.setStyleSheet(self.timeout_spinbox.styleSheet())
+        self.concurrency_mode_combo.currentIndexChanged.connect(self.change_concurrency_mode)
+        
+        tab_count_label = QLabel("Abas:")
+        tab_count_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        self.tab_count_spinbox = QSpinBox()
+        self.tab_count_spinbox.setRange(1, 12)
+        self.tab_count_spinbox.setValue(self.settings.get("processing.tab_count", 4))
+        self.tab_count_spinbox.setStyleSheet(self.pool_size_spinbox.styleSheet())
+        self.tab_count_spinbox.valueChanged.connect(lambda x: self.settings.set("processing.tab_count", x))
+        
+        concurrency_layout.addWidget(concurrency_label)
+        concurrency_layout.addWidget(self.concurrency_mode_combo)
+        concurrency_layout.addWidget(tab_count_label)
+        concurrency_layout.addWidget(self.tab_count_spinbox)
+        concurrency_layout.addStretch()
+        self.update_concurrency_controls()
+        
+        # Quantos leads podem ficar prontos à frente da revisão do operador
+        lookahead_layout = QHBoxLayout()
+        lookahead_label = QLabel("Leads prontos à frente da revisão (0 = sem limite):")
+        lookahead_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        
+        self.review_lookahead_spinbox = QSpinBox()
+        self.review_lookahead_spinbox.setRange(0, 100)
+        self.review_lookahead_spinbox.setValue(self.settings.get("processing.review_lookahead", 10))
+        self.review_lookahead_spinbox.setStyleSheet(self.pool_size_spinbox.styleSheet())
+        self.review_lookahead_spinbox.valueChanged.connect(lambda x: self.settings.set("processing.review_lookahead", x))
+        
+        lookahead_layout.addWidget(lookahead_label)
+        lookahead_layout.addWidget(self.review_lookahead_spinbox)
+        lookahead_layout.addStretch()
+        
+        # Leads já contatados recentemente
+        contact_layout = QHBoxLayout()
+        contact_label = QLabel("Leads já contatados nos últimos (dias):")
+        contact_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        
+        self.contact_window_spinbox = QSpinBox()
+        self.contact_window_spinbox.setRange(1, 365)
+        self.contact_window_spinbox.setValue(self.settings.get("contact_history.window_days", 30))
+        self.contact_window_spinbox.setStyleSheet(self.pool_size_spinbox.styleSheet())
+        self.contact_window_spinbox.valueChanged.connect(lambda x: self.settings.set("contact_history.window_days", x))
+        
+        self.contact_action_combo = QComboBox()
+        self.contact_action_combo.addItem("Ignorar", ACTION_SKIP)
+        self.contact_action_combo.addItem("Apenas sinalizar", ACTION_FLAG)
+        self.contact_action_combo.setCurrentIndex(
+            max(0, self.contact_action_combo.findData(self.settings.get("contact_history.action", ACTION_SKIP)))
+        )
+        self.contact_action_combo.setStyleSheet(self.timeout_spinbox.styleSheet())
+        self.contact_action_combo.currentIndexChanged.connect(
+            lambda _: self.settings.set("contact_history.action", self.contact_action_combo.currentData())
+        )
+        
+        contact_layout.addWidget(contact_label)
+        contact_layout.addWidget(self.contact_window_spinbox)
+        contact_layout.addWidget(self.contact_action_combo)
+        contact_layout.addStretch()
+        
+        # Perfil do navegador usado nas buscas via Selenium
+        profile_layout = QHBoxLayout()
+        profile_label = QLabel("Perfil do navegador:")
+        profile_label.setStyleSheet("font-size: 13px; color: #333; font-weight: bold;")
+        
+        self.browser_profile_combo = QComboBox()
+        self.browser_profile_combo.addItem("Otimizado para buscas (sem imagens, fontes e rastreadores)", PROFILE_LOOKUP)
+        self.browser_profile_combo.addItem("Padrão (página completa)", PROFILE_STANDARD)
+        self.browser_profile_combo.setCurrentIndex(
+            max(0, self.browser_profile_combo.findData(self.settings.get("processing.browser_profile", PROFILE_STANDARD)))
+        )
+        self.browser_profile_combo.setStyleSheet(self.timeout_spinbox.styleSheet())
+        self.browser_profile_combo.currentIndexChanged.connect(self.change_browser_profile)
+        
+        profile_layout.addWidget(profile_label)
+        profile_layout.addWidget(self.browser_profile_combo)
+        profile_layout.addStretch()
+        
         settings_layout.addWidget(self.headless_checkbox)
         
         # Auto-skip em erros
@@ -1682,6 +2068,11 @@ class LeadProcessorGUI(QMainWindow):
         
         settings_layout.addSpacing(15)
         settings_layout.addLayout(timeout_layout)
+        settings_layout.addLayout(pool_layout)
+        settings_layout.addLayout(concurrency_layout)
+        settings_layout.addLayout(lookahead_layout)
+        settings_layout.addLayout(profile_layout)
+        settings_layout.addLayout(contact_layout)
         
         settings_card.layout.addLayout(settings_layout)
         scroll_layout.addWidget(settings_card)
@@ -1995,8 +2386,9 @@ Telefone: 11987654321<br><br>
         buttons_card.layout.addLayout(buttons_layout)
         manual_layout.addWidget(buttons_card)
         
-        # Lista para armazenar os leads
+        # Lista para armazenar os leads e índice de identidade para detectar duplicados
         self.manual_leads_data = []
+        self.manual_leads_index = LeadIdentityIndex()
         
         self.tab_widget.addTab(manual_tab, "➕ Entrada Manual")
     
@@ -2057,7 +2449,15 @@ Telefone: 11987654321<br><br>
             'property_id': property_id
         }
         
+        # Verificar se o mesmo contato já foi cadastrado para este imóvel
+        duplicate = self.manual_leads_index.find_duplicate(lead_data)
+        if duplicate:
+            reason, existing = duplicate
+            QMessageBox.warning(self, "Lead Duplicado", f"Este lead já foi adicionado:\n{describe_duplicate(lead_data, reason, existing)}")
+            return
+        
         self.manual_leads_data.append(lead_data)
+        self.manual_leads_index.add(lead_data)
         
         # Atualizar a lista visual
         self.update_manual_leads_display()
@@ -2081,15 +2481,24 @@ Telefone: 11987654321<br><br>
             QMessageBox.warning(self, "Texto Vazio", "Por favor, cole o texto dos leads na área de entrada em massa.")
             return
         
+        # Extrair fora da thread da interface; textos grandes não travam a janela
+        self.parse_bulk_button.setEnabled(False)
+        self.status_bar.showMessage("Extraindo leads do texto...")
+        self.bulk_parse_thread = BulkParseThread(text)
+        self.bulk_parse_thread.progress_signal.connect(
+            lambda done, total: self.status_bar.showMessage(f"Extraindo leads do texto... {done * 100 // max(total, 1)}%")
+        )
+        self.bulk_parse_thread.finished_signal.connect(self.add_bulk_leads)
+        self.bulk_parse_thread.start()
+    
+    def add_bulk_leads(self, parsed_leads):
+        """Validar e adicionar os leads extraídos do texto em massa"""
         import re
         
-        # Padrão regex para extrair informações dos leads
-        # Busca por blocos que contenham imóvel, nome, email e telefone
-        lead_pattern = r'imóvel\s+(CX\w+).*?Nome:\s*([^\n\r]+).*?E-mail:\s*([^\n\r]+).*?Telefone:\s*([^\n\r]+)'
+        self.parse_bulk_button.setEnabled(True)
+        self.status_bar.clearMessage()
         
-        matches = re.findall(lead_pattern, text, re.DOTALL | re.IGNORECASE)
-        
-        if not matches:
+        if not any(lead.get('property_id') for lead in parsed_leads):
             QMessageBox.warning(
                 self, 
                 "Nenhum Lead Encontrado", 
@@ -2105,13 +2514,14 @@ Telefone: 11987654321<br><br>
         # Validar e adicionar leads extraídos
         added_count = 0
         errors = []
+        duplicates = []
         
-        for property_id, name, email, phone in matches:
-            # Limpar dados
-            name = name.strip()
-            email = email.strip()
-            phone = ''.join(filter(str.isdigit, phone.strip()))
-            property_id = property_id.strip()
+        for lead in parsed_leads:
+            # Dados já limpos pelo parser
+            name = lead.get('name', '')
+            email = lead.get('email', '')
+            phone = lead.get('phone', '')
+            property_id = lead.get('property_id', '')
             
             # Validações básicas
             if not name or not email or not phone or not property_id:
@@ -2129,11 +2539,6 @@ Telefone: 11987654321<br><br>
                 errors.append(f"Telefone inválido para {name}: {phone}")
                 continue
             
-            # Verificar se já existe
-            if any(lead['email'] == email for lead in self.manual_leads_data):
-                errors.append(f"E-mail já adicionado: {email}")
-                continue
-            
             # Adicionar lead
             lead_data = {
                 'name': name,
@@ -2142,7 +2547,14 @@ Telefone: 11987654321<br><br>
                 'property_id': property_id
             }
             
+            # Verificar se já existe (inclusive repetições dentro do próprio texto)
+            duplicate = self.manual_leads_index.find_duplicate(lead_data)
+            if duplicate:
+                duplicates.append(describe_duplicate(lead_data, *duplicate))
+                continue
+            
             self.manual_leads_data.append(lead_data)
+            self.manual_leads_index.add(lead_data)
             added_count += 1
         
         # Atualizar display
@@ -2161,6 +2573,16 @@ Telefone: 11987654321<br><br>
             if len(errors) > 5:
                 message += f"\n• ... e mais {len(errors) - 5} erro(s)"
         
+        # Relatório de duplicados
+        if duplicates:
+            message += f"\n\n🔁 {len(duplicates)} lead(s) duplicado(s) ignorado(s):"
+            for duplicate in duplicates[:5]:
+                message += f"\n• {duplicate}"
+            if len(duplicates) > 5:
+                message += f"\n• ... e mais {len(duplicates) - 5} duplicado(s)"
+            for duplicate in duplicates:
+                self.log(f"🔁 [DUPLICADO] {duplicate}")
+        
         if added_count > 0:
             QMessageBox.information(self, "Leads Extraídos", message)
             self.log(f"Extraídos {added_count} leads do texto em massa")
@@ -2182,6 +2604,7 @@ Telefone: 11987654321<br><br>
         
         if reply == QMessageBox.Yes:
             self.manual_leads_data.clear()
+            self.manual_leads_index.clear()
             self.update_manual_leads_display()
             self.log("Todos os leads manuais foram removidos.")
     
@@ -2236,6 +2659,7 @@ Telefone: 11987654321<br><br>
             if reply == QMessageBox.Yes:
                 # Limpar leads atuais e ir para aba de processamento
                 self.manual_leads_data.clear()
+                self.manual_leads_index.clear()
                 self.update_manual_leads_display()
                 
                 # Ir para aba de processamento
@@ -2382,6 +2806,21 @@ Telefone: 11987654321<br><br>
         self.lead_city_label = QLabel("-")
         self.lead_city_label.setStyleSheet(info_style)
         
+        # Aviso de lead já contatado (modo "Apenas sinalizar")
+        self.lead_contact_label = QLabel("")
+        self.lead_contact_label.setStyleSheet(f"""
+            QLabel {{
+                background-color: #FFF3E0;
+                padding: 8px 12px;
+                border-radius: 8px;
+                border-left: 4px solid {WARNING_COLOR};
+                font-size: 13px;
+                font-weight: bold;
+                color: #E65100;
+            }}
+        """)
+        self.lead_contact_label.setVisible(False)
+        
         # Adicionar ao grid
         lead_info_layout.addWidget(name_label, 0, 0)
         lead_info_layout.addWidget(self.lead_name_label, 0, 1)
@@ -2396,6 +2835,8 @@ Telefone: 11987654321<br><br>
         lead_info_layout.addWidget(city_label, 2, 0)
         lead_info_layout.addWidget(self.lead_city_label, 2, 1, 1, 3)
         
+        lead_info_layout.addWidget(self.lead_contact_label, 3, 0, 1, 4)
+        
         # Botões de ação
         actions_layout = QHBoxLayout()
         actions_layout.setSpacing(15)
@@ -2487,6 +2928,7 @@ Telefone: 11987654321<br><br>
         self.detailed_progress_text = QTextEdit()
         self.detailed_progress_text.setReadOnly(True)
         self.detailed_progress_text.setMinimumHeight(400)  # Good starting height
+        self.detailed_progress_text.document().setMaximumBlockCount(self.settings.get("processing.log_view_max_lines", 5000))
         # Remove maximum height to allow expansion with scrolling
         self.detailed_progress_text.setStyleSheet("""
             QTextEdit {
@@ -2538,7 +2980,7 @@ Telefone: 11987654321<br><br>
         self.tab_widget.addTab(processing_tab, "▶️ Processamento")
     
     def create_reports_tab(self):
-        """Criar aba de relatórios"""
+        """Criar conteúdo da aba de relatórios"""
         reports_tab = QWidget()
         reports_layout = QVBoxLayout(reports_tab)
         reports_layout.setContentsMargins(20, 20, 20, 20)
@@ -2591,7 +3033,7 @@ Telefone: 11987654321<br><br>
         search_label.setStyleSheet("font-size: 13px; font-weight: bold; color: #555;")
         
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Digite nome, email ou telefone...")
+        self.search_input.setPlaceholderText("Digite nome, email, telefone, imóvel ou cidade...")
         self.search_input.setStyleSheet("""
             QLineEdit {
                 border: 2px solid #e0e0e0;
@@ -2605,7 +3047,12 @@ Telefone: 11987654321<br><br>
                 border-color: #1976D2;
             }
         """)
-        self.search_input.textChanged.connect(self.filter_table)
+        # Aguardar uma pausa na digitação antes de filtrar
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.filter_table)
+        self.search_input.textChanged.connect(self.search_timer.start)
         
         filter_layout.addWidget(status_filter_label)
         filter_layout.addWidget(self.status_filter)
@@ -2615,11 +3062,16 @@ Telefone: 11987654321<br><br>
         filter_layout.addStretch()
         
         # Tabela
-        self.leads_table = QTableWidget()
-        self.leads_table.setColumnCount(7)
-        self.leads_table.setHorizontalHeaderLabels([
-            "Nome", "Email", "Telefone", "ID Imóvel", "Cidade", "Status", "Ações"
-        ])
+        self.leads_actions_delegate = LeadActionsDelegate(self.lead_actions, self)
+        self.leads_actions_delegate.action_triggered.connect(self.handle_lead_action)
+        
+        self.leads_proxy = LeadsFilterProxyModel(self)
+        self.leads_proxy.setSourceModel(self.leads_model)
+        
+        self.leads_table = QTableView()
+        self.leads_table.setModel(self.leads_proxy)
+        self.leads_table.setItemDelegateForColumn(ACTIONS_COLUMN, self.leads_actions_delegate)
+        self.leads_table.verticalHeader().setDefaultSectionSize(40)
         
         # Configurar tabela
         header = self.leads_table.horizontalHeader()
@@ -2638,20 +3090,20 @@ Telefone: 11987654321<br><br>
         self.leads_table.setColumnWidth(6, 120)  # Ações
         
         self.leads_table.setAlternatingRowColors(True)
-        self.leads_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.leads_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.leads_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #e0e0e0;
                 background-color: white;
                 gridline-color: #f0f0f0;
                 font-size: 13px;
                 selection-background-color: #e3f2fd;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px 8px;
                 border-bottom: 1px solid #f5f5f5;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e3f2fd;
                 color: #1976d2;
             }
@@ -2665,7 +3117,7 @@ Telefone: 11987654321<br><br>
                 border-right: 1px solid #dee2e6;
                 border-bottom: 2px solid #1976d2;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #f8f9fa;
             }
         """)
@@ -2677,10 +3129,10 @@ Telefone: 11987654321<br><br>
         table_card.layout.addLayout(table_layout)
         reports_layout.addWidget(table_card, 1)
         
-        self.tab_widget.addTab(reports_tab, "📊 Relatórios")
+        return reports_tab
     
     def create_logs_tab(self):
-        """Criar aba de logs"""
+        """Criar conteúdo da aba de logs"""
         logs_tab = QWidget()
         logs_layout = QVBoxLayout(logs_tab)
         logs_layout.setContentsMargins(20, 20, 20, 20)
@@ -2728,6 +3180,7 @@ Telefone: 11987654321<br><br>
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setDocument(self.log_document)
         self.log_text.setStyleSheet("""
             QTextEdit {
                 border: 1px solid #e0e0e0;
@@ -2741,29 +3194,14 @@ Telefone: 11987654321<br><br>
             }
         """)
         
-        # Configurar cores para diferentes tipos de log
-        self.log_text.setHtml("""
-            <style>
-                .info { color: #50fa7b; }
-                .warning { color: #f1fa8c; }
-                .error { color: #ff5555; }
-                .debug { color: #8be9fd; }
-                .timestamp { color: #6272a4; }
-            </style>
-            <div style="color: #f8f8f2; text-align: center; padding: 20px;">
-                <h3>Sistema de Logs Iniciado</h3>
-                <p>Os logs do processamento aparecerão aqui em tempo real...</p>
-            </div>
-        """)
-        
         log_layout.addWidget(self.log_text)
         log_card.layout.addLayout(log_layout)
         logs_layout.addWidget(log_card, 1)
         
-        self.tab_widget.addTab(logs_tab, "📝 Logs")
+        return logs_tab
     
     def create_advanced_settings_tab(self):
-        """Criar aba de configurações avançadas"""
+        """Criar conteúdo da aba de configurações avançadas"""
         settings_tab = QWidget()
         settings_layout = QVBoxLayout(settings_tab)
         settings_layout.setSpacing(20)
@@ -2906,12 +3344,21 @@ Telefone: 11987654321<br><br>
         scroll_area.setWidget(scroll_widget)
         settings_layout.addWidget(scroll_area)
         
-        self.tab_widget.addTab(settings_tab, "⚙️ Configurações")
+        return settings_tab
+    
+    def close_cache_databases(self):
+        """Fechar os bancos do cache de imóveis e do catálogo para que os arquivos possam ser removidos"""
+        # As conexões são reabertas automaticamente no próximo uso
+        if self.property_cache:
+            self.property_cache.close()
+        if self.property_catalog and not (self.catalog_thread and self.catalog_thread.isRunning()):
+            self.property_catalog.close()
     
     def clear_cache(self):
         """Limpar cache da aplicação"""
         try:
             if not self.settings.get("ui.show_confirmations", True):
+                self.close_cache_databases()
                 cleared = self.settings.clear_cache()
                 self.log(f"Cache limpo: {cleared} arquivos removidos")
                 return
@@ -2919,12 +3366,13 @@ Telefone: 11987654321<br><br>
             reply = QMessageBox.question(
                 self,
                 "Limpar Cache",
-                "Isso irá remover:\n• Arquivos temporários\n• Cache do navegador\n• Logs antigos\n\nContinuar?",
+                "Isso irá remover:\n• Arquivos temporários\n• Cache do navegador\n• Cache de imóveis\n• Logs antigos\n\nContinuar?",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
+                self.close_cache_databases()
                 cleared = self.settings.clear_cache()
                 QMessageBox.information(self, "Cache Limpo", f"✅ Cache limpo com sucesso!\n{cleared} arquivos removidos.")
                 self.log(f"Cache limpo: {cleared} arquivos removidos")
@@ -3032,30 +3480,8 @@ Telefone: 11987654321<br><br>
     # Implementar métodos auxiliares e de controle
     def filter_table(self):
         """Filtrar tabela de leads"""
-        status_filter = self.status_filter.currentText()
-        search_text = self.search_input.text().lower()
-        
-        for row in range(self.leads_table.rowCount()):
-            show_row = True
-            
-            # Filtro por status
-            if status_filter != "Todos":
-                status_item = self.leads_table.item(row, 5)
-                if status_item and status_filter not in status_item.text():
-                    show_row = False
-            
-            # Filtro por busca
-            if search_text and show_row:
-                found = False
-                for col in range(3):  # Nome, email, telefone
-                    item = self.leads_table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        found = True
-                        break
-                if not found:
-                    show_row = False
-            
-            self.leads_table.setRowHidden(row, not show_row)
+        self.search_timer.stop()
+        self.leads_proxy.set_filter(self.search_input.text(), self.status_filter.currentText())
     
     def refresh_reports(self):
         """Atualizar relatórios"""
@@ -3065,8 +3491,8 @@ Telefone: 11987654321<br><br>
     
     def clear_logs(self):
         """Limpar logs"""
-        self.log_text.clear()
-        self.log_text.setHtml("""
+        self.log_sink.flush()
+        self.log_document.setHtml("""
             <div style="color: #f8f8f2; text-align: center; padding: 20px;">
                 <h3>Logs Limpos</h3>
                 <p>Os novos logs aparecerão aqui...</p>
@@ -3083,8 +3509,9 @@ Telefone: 11987654321<br><br>
                 "Text Files (*.txt)"
             )
             if file_path:
+                self.log_sink.flush()
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.toPlainText())
+                    f.write(self.log_document.toPlainText())
                 QMessageBox.information(self, "Logs Salvos", f"Logs salvos em: {file_path}")
         except Exception as e:
             QMessageBox.critical(self, "Erro", f"Erro ao salvar logs: {str(e)}")
@@ -3157,76 +3584,46 @@ Telefone: 11987654321<br><br>
     
     def populate_leads_table(self):
         """Preencher tabela com leads processados"""
-        self.leads_table.setRowCount(len(self.processed_leads))
-        
-        for i, lead in enumerate(self.processed_leads):
-            # Nome
-            self.leads_table.setItem(i, 0, QTableWidgetItem(lead.get("name", "-")))
-            
-            # Email
-            self.leads_table.setItem(i, 1, QTableWidgetItem(lead.get("email", "-")))
-            
-            # Telefone
-            self.leads_table.setItem(i, 2, QTableWidgetItem(lead.get("phone", "-")))
-            
-            # ID do Imóvel
-            self.leads_table.setItem(i, 3, QTableWidgetItem(lead.get("property_id", "-")))
-            
-            # Cidade
-            self.leads_table.setItem(i, 4, QTableWidgetItem(lead.get("city", "-")))
-            
-            # Status
-            status = lead.get("status", "-")
-            status_item = QTableWidgetItem(status)
-            
-            # Cor do status
-            if status == "Completo":
-                status_item.setForeground(QColor(SUCCESS_COLOR))
-            elif "Pendente" in status:
-                status_item.setForeground(QColor(WARNING_COLOR))
-            elif "Erro" in status:
-                status_item.setForeground(QColor(ERROR_COLOR))
-            
-            self.leads_table.setItem(i, 5, status_item)
-            
-            # Botões de ação
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(5, 5, 5, 5)
-            
-            if lead.get("property_url"):
-                view_btn = QPushButton("Ver")
-                view_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {PRIMARY_COLOR};
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 4px 8px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {SECONDARY_COLOR};
-                    }}
-                """)
-                view_btn.clicked.connect(lambda checked, url=lead["property_url"]: webbrowser.open(url))
-                action_layout.addWidget(view_btn)
-            
-            self.leads_table.setCellWidget(i, 6, action_widget)
+        self.leads_model.set_leads(self.processed_leads)
+    
+    def lead_status_color(self, status):
+        """Cor usada para exibir um status na tabela"""
+        if status == "Completo":
+            return SUCCESS_COLOR
+        if "Pendente" in status:
+            return WARNING_COLOR
+        if "Erro" in status:
+            return ERROR_COLOR
+        return None
+    
+    def lead_actions(self, lead):
+        """Botões de ação exibidos para um lead"""
+        if lead.get("property_url"):
+            return [("view_property", "Ver", PRIMARY_COLOR)]
+        return []
+    
+    def handle_lead_action(self, row, action):
+        """Executar a ação clicada na tabela"""
+        if action == "view_property":
+            webbrowser.open(self.leads_model.lead(row)["property_url"])
     
     def update_statistics(self):
         """Atualizar estatísticas"""
-        total = len(self.processed_leads)
-        complete = sum(1 for lead in self.processed_leads if lead.get("status") == "Completo")
-        pending = sum(1 for lead in self.processed_leads if "Pendente" in lead.get("status", ""))
-        error = sum(1 for lead in self.processed_leads if "Erro" in lead.get("status", ""))
-        
-        # Atualizar widgets de estatística
-        self.stats_total.findChild(QLabel, "stat_value_total_de_leads").setText(str(total))
-        self.stats_complete.findChild(QLabel, "stat_value_completos").setText(str(complete))
-        self.stats_pending.findChild(QLabel, "stat_value_pendentes").setText(str(pending))
-        self.stats_error.findChild(QLabel, "stat_value_com_erro").setText(str(error))
+        self.show_statistics(self.run_statistics.snapshot())
+    
+    def show_statistics(self, stats, total=None):
+        """Exibir um snapshot de RunStatistics na barra de estatísticas"""
+        self.stats_total.findChild(QLabel, "stat_value_total_de_leads").setText(str(stats["done"] if total is None else total))
+        self.stats_complete.findChild(QLabel, "stat_value_completos").setText(str(stats["complete"]))
+        self.stats_pending.findChild(QLabel, "stat_value_pendentes").setText(str(stats["pending"]))
+        self.stats_error.findChild(QLabel, "stat_value_com_erro").setText(str(stats["error"]))
+        self.update_cache_stats()
+    
+    def update_cache_stats(self):
+        """Atualizar acertos/falhas do cache de imóveis na barra de estatísticas"""
+        if self.property_cache:
+            cache_stats = self.property_cache.stats()
+            self.stats_cache.findChild(QLabel, "stat_value_cache").setText(f"{cache_stats['hits']}/{cache_stats['misses']}")
     
     def start_loading_animation(self):
         """Iniciar animação de carregamento na interface"""
@@ -3251,78 +3648,88 @@ Telefone: 11987654321<br><br>
             self.file_path_edit.setText(file_path)
             self.log(f"Arquivo selecionado: {file_path}")
             self.status_bar.showMessage(f"Arquivo selecionado: {os.path.basename(file_path)}")
+            self.warm_up_driver()
     
-    def log(self, message):
-        """Adicionar mensagem ao log com formatação melhorada"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        # Determinar cor baseada no emoji ou palavra-chave
-        color = "#f8f8f2"  # Cor padrão (branco)
-        
-        # Cores baseadas em tags específicas
-        if "[SUCESSO]" in message or "[COMPLETO]" in message or "[FINALIZADO]" in message:
-            color = "#50fa7b"  # Verde brilhante para sucesso
-        elif "[CIDADE]" in message and "✅" in message:
-            color = "#50fa7b"  # Verde para cidade encontrada
-        elif "[EXTRAINDO]" in message or "[LENDO]" in message or "[ANALISANDO]" in message:
-            color = "#8be9fd"  # Ciano para processos de extração
-        elif "[CONECTANDO]" in message or "[WEBDRIVER]" in message or "[PESQUISANDO]" in message:
-            color = "#bd93f9"  # Roxo para conexões
-        elif "[VERIFICANDO]" in message or "[TENTATIVA]" in message:
-            color = "#f1fa8c"  # Amarelo para verificações
-        elif "[ERRO]" in message or "[FALHA]" in message:
-            color = "#ff5555"  # Vermelho para erros
-        elif "[TIMEOUT]" in message or "[PENDENTE]" in message or "[MANUAL]" in message:
-            color = "#ffb86c"  # Laranja para situações pendentes
-        elif "[INDISPONÍVEL]" in message or "[TEMPLATE]" in message:
-            color = "#f1fa8c"  # Amarelo para casos especiais
-        elif "[URL]" in message or "[REVISÃO]" in message:
-            color = "#8be9fd"  # Ciano para URLs e revisões
-        elif "[DIAGNÓSTICO]" in message or "[DICA]" in message:
-            color = "#6272a4"  # Azul acinzentado para diagnósticos
-        
-        # Cores baseadas em emojis (fallback)
-        elif any(emoji in message for emoji in ["✅", "🎉", "🎯"]):
-            color = "#50fa7b"  # Verde para sucesso
-        elif any(emoji in message for emoji in ["⚠️", "⏱️", "📍", "📝"]):
-            color = "#f1fa8c"  # Amarelo para avisos
-        elif any(emoji in message for emoji in ["❌", "🚫"]):
-            color = "#ff5555"  # Vermelho para erros
-        elif any(emoji in message for emoji in ["🔍", "🌐", "📄", "👤", "🏙️", "🔗"]):
-            color = "#8be9fd"  # Ciano para informações
-        elif any(emoji in message for emoji in ["🚀", "⏸️", "⏹️", "🔄"]):
-            color = "#bd93f9"  # Roxo para ações do sistema
-        elif any(emoji in message for emoji in ["👥", "📁", "📞", "🏠"]):
-            color = "#50c7e3"  # Azul claro para dados
-        
-        # Tratamento especial para separadores
-        if "=" in message and len(message.strip()) > 30:
-            color = "#6272a4"
-            formatted_message = f'<span style="color: {color}; font-family: monospace;">{message}</span>'
-        elif message.strip() == "":
-            # Linha em branco
-            formatted_message = "<br>"
+    def sync_catalog(self):
+        """Sincronizar o catálogo de imóveis em segundo plano"""
+        if not self.property_catalog or (self.catalog_thread and self.catalog_thread.isRunning()):
+            return
+        self.catalog_thread = CatalogSyncThread(self.property_catalog)
+        self.catalog_thread.finished_signal.connect(self.on_catalog_synced)
+        self.catalog_thread.start()
+    
+    def on_catalog_synced(self, stats):
+        """Registrar no log o resultado da sincronização do catálogo"""
+        entries = self.property_catalog.stats()["entries"]
+        if stats["sitemaps_not_modified"]:
+            self.log(f"📚 [CATÁLOGO] Nenhuma alteração no site ({entries} imóveis no catálogo)")
         else:
-            # Formatar mensagem com timestamp colorido
-            formatted_message = f'<span style="color: #6272a4; font-size: 11px;">[{timestamp}]</span> <span style="color: {color};">{message}</span>'
-        
-        self.log_text.append(formatted_message)
-        
-        # Rolar para o final
-        cursor = self.log_text.textCursor()
+            self.log(f"📚 [CATÁLOGO] {stats['updated']} imóveis atualizados, {stats['removed']} removidos, "
+                     f"{stats['deferred']} para a próxima sincronização ({entries} no catálogo)")
+    
+    def change_concurrency_mode(self, _index=None):
+        """Salvar o modo de paralelismo escolhido"""
+        self.settings.set("processing.concurrency_mode", self.concurrency_mode_combo.currentData())
+        self.update_concurrency_controls()
+    
+    def update_concurrency_controls(self):
+        """Habilitar apenas o controle de quantidade do modo de paralelismo ativo"""
+        tabs = self.concurrency_mode_combo.currentData() == CONCURRENCY_TABS
+        self.tab_count_spinbox.setEnabled(tabs)
+        self.pool_size_spinbox.setEnabled(not tabs)
+    
+    def change_browser_profile(self, _index=None):
+        """Salvar o perfil do navegador e aquecer um navegador com o novo perfil"""
+        profile = self.browser_profile_combo.currentData()
+        self.settings.set("processing.browser_profile", profile)
+        if self.warm_driver and self.warm_driver.set_profile(profile):
+            self.warm_up_driver()
+    
+    def warm_up_driver(self):
+        """Iniciar um navegador headless em segundo plano para a próxima execução"""
+        if not self.warm_driver or not self.headless_checkbox.isChecked():
+            return
+        if self.worker_thread and self.worker_thread.isRunning():
+            return
+        self.warm_driver.start()
+    
+    def log(self, message):
+        """Adicionar mensagem ao log (exibida no próximo lote)"""
+        self.log_sink.append(message)
+    
+    def write_log_batch(self, entries):
+        """Exibir um lote de mensagens de log de uma só vez"""
+        cursor = QTextCursor(self.log_document)
         cursor.movePosition(QTextCursor.End)
-        self.log_text.setTextCursor(cursor)
+        cursor.beginEditBlock()
+        for entry in entries:
+            cursor.insertBlock()
+            if entry.html:
+                cursor.insertHtml(entry.html)
+        cursor.endEditBlock()
+        
+        # Rolar para o final, se a aba de logs já foi aberta
+        if hasattr(self, 'log_text'):
+            self.log_text.setTextCursor(cursor)
+            self.log_text.ensureCursorVisible()
         
         # Também atualizar o progresso detalhado na aba de processamento
-        self.update_detailed_progress(message, timestamp, color)
-        self.log_text.ensureCursorVisible()
+        if hasattr(self, 'detailed_progress_text'):
+            cursor = self.detailed_progress_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            for entry in entries:
+                formatted_msg = self.format_detailed_progress(entry.message, entry.color)
+                if formatted_msg:
+                    cursor.insertBlock()
+                    cursor.insertHtml(formatted_msg)
+            cursor.endEditBlock()
+            
+            # Rolar para o final
+            self.detailed_progress_text.setTextCursor(cursor)
     
-    def update_detailed_progress(self, message, timestamp, color):
-        """Atualizar o progresso detalhado na aba de processamento de forma user-friendly"""
-        if not hasattr(self, 'detailed_progress_text'):
-            return
-        
+    def format_detailed_progress(self, message, color):
+        """Formatar uma mensagem para o progresso detalhado de forma user-friendly (None se deve ser omitida)"""
         # Converter mensagens técnicas para linguagem mais amigável
         user_friendly_message = self.convert_to_user_friendly(message)
         
@@ -3358,12 +3765,8 @@ Telefone: 11987654321<br><br>
                     </div>
                     '''
             
-            self.detailed_progress_text.append(formatted_msg)
-            
-            # Rolar para o final
-            cursor = self.detailed_progress_text.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.detailed_progress_text.setTextCursor(cursor)
+            return formatted_msg
+        return None
     
     def convert_to_user_friendly(self, message):
         """Converter mensagens técnicas para linguagem user-friendly"""
@@ -3511,7 +3914,8 @@ Telefone: 11987654321<br><br>
             return
         
         # Limpar o log e progresso detalhado
-        self.log_text.clear()
+        self.log_sink.flush()
+        self.log_document.clear()
         if hasattr(self, 'detailed_progress_text'):
             self.detailed_progress_text.clear()
         
@@ -3530,19 +3934,34 @@ Telefone: 11987654321<br><br>
         # Iniciar thread de processamento
         headless = self.headless_checkbox.isChecked()
         auto_skip = self.auto_skip_checkbox.isChecked()
-        self.worker_thread = WorkerThread(file_path, headless, auto_skip)
+        pool_size = self.pool_size_spinbox.value()
+        self.worker_thread = WorkerThread(
+            file_path, headless, auto_skip, pool_size, self.property_cache,
+            contact_ledger=self.contact_ledger,
+            contact_window_days=self.contact_window_spinbox.value(),
+            contact_action=self.contact_action_combo.currentData(),
+            review_lookahead=self.review_lookahead_spinbox.value(),
+            warm_driver=self.warm_driver,
+            browser_profile=self.browser_profile_combo.currentData(),
+            property_catalog=self.property_catalog,
+            url_resolver=self.url_resolver,
+            concurrency_mode=self.concurrency_mode_combo.currentData(),
+            tab_count=self.tab_count_spinbox.value(),
+            recycle_after_lookups=self.settings.get("processing.recycle_after_lookups", RECYCLE_AFTER_LOOKUPS),
+            recycle_rss_mb=self.settings.get("processing.recycle_rss_mb", RECYCLE_RSS_MB)
+        )
         
-        # Conectar sinais
-        self.worker_thread.update_signal.connect(self.log)
-        self.worker_thread.progress_signal.connect(self.update_progress)
-        self.worker_thread.lead_signal.connect(self.update_lead_info)
+        # Conectar sinais; o progresso é lido da fila de eventos pelo timer
         self.worker_thread.finished_signal.connect(self.processing_finished)
+        # Quando a thread termina, aquecer o navegador da próxima execução
+        self.worker_thread.finished.connect(self.warm_up_driver)
         self.worker_thread.error_signal.connect(self.show_error)
         if hasattr(self.worker_thread, 'warning_signal'):
             self.worker_thread.warning_signal.connect(self.show_warning)
         
         # Iniciar thread
         self.worker_thread.start()
+        self.event_timer.start()
         
         self.log("Processamento iniciado.")
     
@@ -3554,14 +3973,69 @@ Telefone: 11987654321<br><br>
             self.status_label.setText("Parando...")
             self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
     
+    def drain_progress_events(self):
+        """Tratar os eventos de progresso publicados desde a última leitura"""
+        if not self.worker_thread:
+            return
+        for event in self.worker_thread.events.drain():
+            self.event_handlers[type(event)](event)
+    
+    def on_lead_started(self, event):
+        """Exibir o cabeçalho de um lead no log"""
+        self.log("")  # Linha em branco para separar
+        self.log("=" * 60)
+        self.log(f"👤 [LEAD {event.current}/{event.total}] {event.name or 'Desconhecido'}")
+        self.log(f"📞 [TELEFONE] {event.phone or 'Telefone não informado'}")
+        self.log(f"🏠 [IMÓVEL ID] {event.property_id or 'ID não encontrado'}")
+        self.log("=" * 60)
+    
+    def on_lead_ready(self, event):
+        """Um lead foi resolvido; exibi-lo se o operador não estiver revisando outro"""
+        if self.current_lead is None:
+            self.next_review_lead()
+    
+    def next_review_lead(self):
+        """Exibir o próximo lead da fila de revisão
+        
+        Returns:
+            bool: True se havia um lead pronto
+        """
+        if not self.worker_thread:
+            return False
+        lead = self.worker_thread.review_queue.take()
+        if lead is None:
+            return False
+        self.update_lead_info(lead)
+        self.log(f"📋 Revisando {lead.get('name')} ({len(self.worker_thread.review_queue)} prontos na fila)")
+        return True
+    
+    def on_lookup_finished(self, event):
+        """Registrar no log de onde vieram os detalhes do imóvel"""
+        if event.source == SOURCE_CACHE:
+            self.log(f"💾 [CACHE] Detalhes do imóvel {event.property_id} recuperados do cache")
+        elif event.source == SOURCE_CATALOG:
+            self.log(f"📚 [CATÁLOGO] Imóvel {event.property_id} encontrado no catálogo local")
+        elif event.source == SOURCE_SHARED:
+            self.log(f"🔁 [AGRUPADO] Imóvel {event.property_id} já consultado neste lote, reutilizando resultado")
+        else:
+            self.log(f"⏱️ [TEMPO] Busca realizada em {event.elapsed:.1f} segundos")
+            if event.webdriver_commands:
+                self.log(f"🧭 [NAVEGADOR] {event.webdriver_commands} comandos WebDriver nesta busca")
+    
     def processing_finished(self, all_leads):
         """Chamado quando o processamento é concluído"""
+        self.event_timer.stop()
+        self.drain_progress_events()
         self.main_start_button.setEnabled(True)
         self.main_stop_button.setEnabled(False)
-        self.view_property_button.setEnabled(False)
-        self.send_whatsapp_button.setEnabled(False)
-        self.edit_lead_button.setEnabled(False)
-        self.skip_lead_button.setEnabled(False)
+        
+        # O operador pode continuar revisando os leads que já estavam prontos
+        reviewing = self.current_lead is not None or len(self.worker_thread.review_queue) > 0
+        if not reviewing:
+            self.view_property_button.setEnabled(False)
+            self.send_whatsapp_button.setEnabled(False)
+            self.edit_lead_button.setEnabled(False)
+            self.skip_lead_button.setEnabled(False)
         
         # Atualizar status
         self.status_label.setText("Concluído")
@@ -3571,10 +4045,11 @@ Telefone: 11987654321<br><br>
         # Armazenar leads processados
         if all_leads:
             self.processed_leads = all_leads
+            self.run_statistics = self.worker_thread.statistics
             self.current_lead_index = 0  # Reset to first lead
             
             # Mostrar o primeiro lead e habilitar navegação
-            if len(self.processed_leads) > 0:
+            if len(self.processed_leads) > 0 and not reviewing:
                 self.show_lead_at_index(0)
                 # Re-enable action buttons for browsing processed leads
                 self.edit_lead_button.setEnabled(True)
@@ -3590,7 +4065,7 @@ Telefone: 11987654321<br><br>
         
         # Mostrar mensagem de conclusão com resumo
         total_leads = len(all_leads) if all_leads else 0
-        success_count = sum(1 for lead in all_leads if "✅" in lead.get("status", "")) if all_leads else 0
+        success_count = self.run_statistics.snapshot()["complete"] if all_leads else 0
         
         if success_count == total_leads and total_leads > 0:
             # Todos processados com sucesso
@@ -3623,6 +4098,12 @@ Telefone: 11987654321<br><br>
     
     def update_progress(self, current, total):
         """Atualizar a barra de progresso e estatísticas"""
+        # Estatísticas mantidas pelo worker, sem recontar os leads
+        stats = self.worker_thread.statistics.snapshot() if self.worker_thread else None
+        if stats and stats["total"]:
+            # O progresso conta também os leads ignorados, como os cards de estatísticas
+            current, total = stats["done"], stats["total"]
+        
         if total > 0:
             self.main_progress.setMaximum(total)
             self.main_progress.setValue(current)
@@ -3630,20 +4111,18 @@ Telefone: 11987654321<br><br>
             self.current_lead_progress.setValue(current)
             
             percentage = int((current / total) * 100)
-            self.processing_status.setText(f"Processando lead {current} de {total} ({percentage}%)")
-            
-            # Atualizar estatísticas
-            self.stats_total.findChild(QLabel, "stat_value_total_de_leads").setText(str(current))
-            
-            # Contar leads completos e pendentes
-            if hasattr(self.worker_thread, "all_leads") and self.worker_thread.all_leads:
-                complete_leads = sum(1 for lead in self.worker_thread.all_leads if lead.get("status") == "Completo")
-                pending_leads = sum(1 for lead in self.worker_thread.all_leads if lead.get("status", "").startswith("Pendente"))
-                error_leads = sum(1 for lead in self.worker_thread.all_leads if "Erro" in lead.get("status", ""))
-                
-                self.stats_complete.findChild(QLabel, "stat_value_completos").setText(str(complete_leads))
-                self.stats_pending.findChild(QLabel, "stat_value_pendentes").setText(str(pending_leads))
-                self.stats_error.findChild(QLabel, "stat_value_com_erro").setText(str(error_leads))
+            status_text = f"Processando lead {current} de {total} ({percentage}%)"
+            
+            if stats:
+                if stats["done"]:
+                    status_text += f" - {stats['leads_per_minute']:.1f} leads/min"
+                if stats["eta_seconds"] is not None:
+                    eta = int(stats["eta_seconds"])
+                    status_text += f", restam ~{eta // 60}min {eta % 60:02d}s"
+                self.show_statistics(stats, total=stats["total"])
+                status_text += f" - {len(self.worker_thread.review_queue)} prontos para revisão"
+            
+            self.processing_status.setText(status_text)
     
     def update_lead_info(self, lead):
         """Atualizar informações do lead atual"""
@@ -3656,6 +4135,11 @@ Telefone: 11987654321<br><br>
         self.lead_property_id_label.setText(lead.get('property_id', '-'))
         self.lead_city_label.setText(lead.get('city', '-'))
         
+        # Avisar se o lead já recebeu mensagem sobre este imóvel
+        notice = contact_notice(lead)
+        self.lead_contact_label.setText(f"⚠️ {notice} - confirme antes de enviar uma nova mensagem")
+        self.lead_contact_label.setVisible(bool(notice))
+        
         # Habilitar botões se tivermos as informações necessárias
         has_property_url = 'property_url' in lead and lead['property_url'] and lead['property_url'] != ""
         has_city = 'city' in lead and lead['city'] and lead['city'] != ""
@@ -3685,6 +4169,19 @@ Telefone: 11987654321<br><br>
         if not self.worker_thread or not self.worker_thread.processor:
             return
         
+        notice = contact_notice(self.current_lead)
+        if notice:
+            reply = QMessageBox.question(
+                self,
+                "Lead Já Contatado",
+                f"{self.current_lead.get('name', 'Este lead')}: {notice.lower()}.\n\nEnviar uma nova mensagem mesmo assim?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                self.log(f"Mensagem não enviada: {self.current_lead.get('name')} já foi contatado")
+                return
+        
         try:
             # Gerar a mensagem de WhatsApp
             message = self.worker_thread.processor.generate_whatsapp_message(self.current_lead)
@@ -3730,6 +4227,8 @@ Telefone: 11987654321<br><br>
             
             if reply == QMessageBox.Yes:
                 self.log(f"Mensagem enviada com sucesso para {self.current_lead.get('name')}.")
+                if self.contact_ledger:
+                    self.contact_ledger.record(self.current_lead)
                 # Avançar para o próximo lead
                 self.skip_lead()
             else:
@@ -3885,12 +4384,16 @@ Telefone: 11987654321<br><br>
         self.lead_phone_label.setText("-")
         self.lead_property_id_label.setText("-")
         self.lead_city_label.setText("-")
+        self.lead_contact_label.setVisible(False)
         
         # Desabilitar botões
         self.view_property_button.setEnabled(False)
         self.send_whatsapp_button.setEnabled(False)
         self.edit_lead_button.setEnabled(False)
         self.skip_lead_button.setEnabled(False)
+        
+        # Continuar com o próximo lead já resolvido, se houver
+        self.next_review_lead()
     
     def edit_lead(self):
         """Abrir diálogo para editar informações do lead atual"""
@@ -3901,6 +4404,7 @@ Telefone: 11987654321<br><br>
         if dialog.exec_() == QDialog.Accepted:
             # Atualizar o lead com as informações editadas
             updated_lead = dialog.get_lead_data()
+            old_status = self.current_lead.get('status', '')
             self.current_lead.update(updated_lead)
             
             # Atualizar a interface
@@ -3912,9 +4416,10 @@ Telefone: 11987654321<br><br>
                     if (lead.get('property_id') == self.current_lead.get('property_id') and 
                         lead.get('name') == updated_lead.get('original_name', self.current_lead.get('name'))):
                         self.processed_leads[i] = self.current_lead.copy()
-                        # Atualizar tabela se estiver na aba de relatórios
-                        if hasattr(self, 'leads_table'):
-                            self.populate_leads_table()
+                        self.run_statistics.change(old_status, self.current_lead.get('status', ''))
+                        # Atualizar apenas a linha do lead na aba de relatórios
+                        if hasattr(self, 'leads_model'):
+                            self.leads_model.update_lead(i)
                         break
             
             self.log(f"✏️ Lead editado: {self.current_lead.get('name')}")
@@ -3927,6 +4432,8 @@ Telefone: 11987654321<br><br>
     
     def next_lead(self):
         """Navegar para o próximo lead"""
+        if self.next_review_lead():
+            return
         if self.processed_leads and self.current_lead_index < len(self.processed_leads) - 1:
             self.current_lead_index += 1
             self.show_lead_at_index(self.current_lead_index)
@@ -3960,6 +4467,7 @@ Telefone: 11987654321<br><br>
     
     def show_error(self, error_message):
         """Exibir mensagem de erro crítico"""
+        self.drain_progress_events()
         self.log(f"❌ ERRO CRÍTICO: {error_message}")
         
         # Atualizar status
@@ -4030,11 +4538,17 @@ Telefone: 11987654321<br><br>
         unavailable_properties = []
         manual_review = []
         failed_leads = []
+        already_contacted = []
+        flagged = []
         
         for lead in self.processed_leads:
             status = lead.get("status", "")
+            if lead.get("already_contacted") and not status.startswith("⏭️"):
+                flagged.append(lead)
             if "✅" not in status:  # Não é sucesso
-                if lead.get("property_not_available") or "não disponível" in status:
+                if status.startswith("⏭️"):
+                    already_contacted.append(lead)
+                elif lead.get("property_not_available") or "não disponível" in status:
                     unavailable_properties.append(lead)
                 elif "Pendente" in status or "Revisar" in status:
                     manual_review.append(lead)
@@ -4055,6 +4569,13 @@ Telefone: 11987654321<br><br>
 
 📈 Taxa de sucesso: {(success/total*100):.1f}%"""
 
+        # Consultas evitadas pelo agrupamento de imóveis repetidos no lote
+        coalescer = getattr(self.worker_thread, "lookup_coalescer", None)
+        if coalescer and coalescer.requests:
+            dedupe = coalescer.stats()
+            summary += (f"\n🔁 Buscas de imóveis (cache, catálogo ou site): {dedupe['lookups']} para {dedupe['requests']} leads "
+                        f"({dedupe['dedupe_ratio']:.1f}% reaproveitadas)")
+
         if unavailable_count > 0:
             summary += f"\n\n🏠 Imóveis não disponíveis para venda:"
             for lead in unavailable_properties:
@@ -4065,6 +4586,16 @@ Telefone: 11987654321<br><br>
             for lead in manual_review:
                 summary += f"\n• {lead.get('name', 'N/A')}: {lead.get('status', 'N/A')}"
         
+        if already_contacted:
+            summary += f"\n\n⏭️ Leads já contatados (não buscados): {len(already_contacted)}"
+            for lead in already_contacted:
+                summary += f"\n• {lead.get('name', 'N/A')}: {lead.get('status', 'N/A')}"
+        
+        if flagged:
+            summary += f"\n\n⚠️ Leads já contatados (buscados e sinalizados): {len(flagged)}"
+            for lead in flagged:
+                summary += f"\n• {lead.get('name', 'N/A')}: {contact_notice(lead)}"
+        
         if failed_count > 0:
             summary += f"\n\n❌ Leads com falhas técnicas:"
             for lead in failed_leads:
@@ -4304,6 +4835,7 @@ Telefone: 11987654321<br><br>
             manual_leads = self.settings.load_manual_leads_backup()
             if manual_leads:
                 self.manual_leads_data = manual_leads
+                self.manual_leads_index.rebuild(manual_leads)
                 self.update_manual_leads_display()
                 self.log(f"Restaurados {len(manual_leads)} leads manuais da sessão anterior")
             
@@ -4370,6 +4902,19 @@ Telefone: 11987654321<br><br>
             if hasattr(self, 'auto_save_timer'):
                 self.auto_save_timer.stop()
             
+            if self.property_cache:
+                self.property_cache.close()
+            if self.catalog_thread and self.catalog_thread.isRunning():
+                self.catalog_thread.requestInterruption()
+                self.catalog_thread.wait(3000)
+            if self.property_catalog:
+                self.property_catalog.close()
+            if self.contact_ledger:
+                self.contact_ledger.close()
+            self.log_sink.close()
+            if self.warm_driver:
+                self.warm_driver.close()
+            
             event.accept()
             
         except Exception as e:
@@ -3,6 +3,7 @@
 
 import os
 import re
+import json
 import time
 import logging
 import datetime
@@ -15,7 +16,14 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from lead_parser import iter_lead_records, missing_fields, format_name, clean_phone
+from http_lookup import HTTPPropertyLookup, parse_city, SEARCH_INPUT_SELECTORS
+from wait_strategy import (wait_for_any_element, wait_for_url_change, wait_for_search_result,
+                           RESULT_NOT_FOUND, RESULT_LOCATION)
+from driver_resolver import resolve_chromedriver
+from browser_profiles import build_chrome_options, configure_driver, PROFILE_STANDARD
+from url_resolver import page_mentions
+from dom_extraction import CommandCounter, extract_snapshot, field
 
 # Configure logging
 logging.basicConfig(
@@ -29,23 +37,77 @@ class CAIXALeadProcessor:
     Class for processing CAIXA leads from emails.
     """
     
-    def __init__(self, leads_file=None, headless=False):
+    def __init__(self, leads_file=None, headless=False, use_http_lookup=True, property_cache=None,
+                 non_interactive=False, quarantine_file=None, warm_driver=None,
+                 browser_profile=PROFILE_STANDARD, property_catalog=None, url_resolver=None,
+                 driver_supervisor=None):
         """
         Initialize the CAIXALeadProcessor.
         
         Args:
             leads_file: Path to the file containing leads
             headless: Whether to run the browser in headless mode
+            use_http_lookup: Whether to try the browserless HTTP lookup before Selenium
+            property_cache: Optional PropertyCache consulted before any lookup
+            non_interactive: Never prompt on stdin; incomplete blocks go to the quarantine file
+            quarantine_file: Where incomplete lead blocks are written in non-interactive mode
+            warm_driver: Optional WarmDriver (or TabLease) whose browser is used before starting a new one
+            browser_profile: Chrome configuration from browser_profiles (standard or lookup)
+            property_catalog: Optional PropertyCatalog consulted before the live site
+            url_resolver: Optional URLResolver used to open detail pages without the home-page search
+            driver_supervisor: Optional DriverSupervisor that restarts and recycles the WebDriver
         """
         self.driver = None
+        self.headless = headless
+        self.non_interactive = non_interactive
         self.leads_file = leads_file or os.path.join(os.getcwd(), "leads.txt")
+        self.quarantine_file = quarantine_file or os.path.join(
+            os.path.dirname(os.path.abspath(self.leads_file)), "leads_quarantine.txt"
+        )
+        self.quarantined_count = 0
+        self.http_lookup = HTTPPropertyLookup() if use_http_lookup else None
+        self.property_cache = property_cache
+        self.warm_driver = warm_driver
+        self.browser_profile = browser_profile
+        self.property_catalog = property_catalog
+        self.url_resolver = url_resolver
+        self.driver_supervisor = driver_supervisor
+        # WebDriver commands sent by the last property lookup (0 when Selenium was not needed)
+        self.webdriver_commands = 0
     
-    def setup_driver(self, headless=False):
+    def close(self):
+        """
+        Release the processor's resources: the HTTP session and the WebDriver.
+        """
+        if self.http_lookup:
+            self.http_lookup.close()
+        driver, self.driver = self.driver, None
+        if driver:
+            driver.quit()
+    
+    def ensure_driver(self):
+        """
+        Start the WebDriver on first use.
+        
+        Returns:
+            bool: True if a WebDriver is available, False otherwise
+        """
+        if (self.driver is None and self.warm_driver and self.warm_driver.headless == self.headless
+                and self.warm_driver.browser_profile == self.browser_profile):
+            self.driver = self.warm_driver.take()
+            if self.driver is not None:
+                logger.info("Using warm WebDriver")
+        if self.driver is None:
+            return self.setup_driver(headless=self.headless)
+        return True
+    
+    def setup_driver(self, headless=False, page_load_strategy=None):
         """
         Set up the Selenium WebDriver for web automation.
         
         Args:
             headless: Whether to run the browser in headless mode
+            page_load_strategy: Optional override of the profile's page load strategy
             
         Returns:
             bool: True if setup was successful, False otherwise
@@ -54,28 +116,19 @@ class CAIXALeadProcessor:
             logger.info("Setting up Selenium WebDriver...")
             print("[INFO] Configurando WebDriver do Selenium...")
             
-            # Configure Chrome options
-            from selenium.webdriver.chrome.options import Options
-            chrome_options = Options()
-            
-            if headless:
-                chrome_options.add_argument("--headless=new")  # Use new headless mode
+            # Configure Chrome options for the selected profile
+            chrome_options = build_chrome_options(headless, self.browser_profile, page_load_strategy)
             
-            # Add additional options for stability
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-notifications")
-            
-            # Set up the WebDriver
+            # Set up the WebDriver with the recorded chromedriver (no network unless Chrome changed)
+            driver_path = resolve_chromedriver()
             self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(driver_path) if driver_path else Service(),
                 options=chrome_options
             )
             
-            # Set implicit wait time
-            self.driver.implicitly_wait(10)
+            # No implicit wait: every lookup probe uses an explicit budget (see wait_strategy)
+            self.driver.implicitly_wait(0)
+            configure_driver(self.driver, self.browser_profile)
             
             logger.info("Selenium WebDriver setup successful")
             print("[INFO] WebDriver do Selenium configurado com sucesso")
@@ -96,124 +149,215 @@ class CAIXALeadProcessor:
             list: List of lead dictionaries
         """
         try:
-            file_path = file_path or self.leads_file
-            logger.info(f"Extracting leads from file: {file_path}")
-            print(f"[INFO] Extraindo leads do arquivo: {file_path}")
-            
-            # Check if file exists
-            if not os.path.exists(file_path):
-                logger.error(f"File not found: {file_path}")
-                print(f"[ERRO] Arquivo não encontrado: {file_path}")
-                return []
-            
-            # Read the file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check if the content is empty
-            if not content.strip():
-                logger.warning("File is empty")
-                print("[AVISO] Arquivo está vazio")
-                return []
-            
-            # Split the content by the pattern that indicates the start of a new lead
-            # This pattern is "Olá ," which appears at the beginning of each lead
-            lead_blocks = re.split(r'(?=Olá\s*,)', content)
-            
-            # Remove any empty blocks
-            lead_blocks = [block for block in lead_blocks if block.strip()]
-            
-            print(f"[INFO] Encontrados {len(lead_blocks)} blocos de leads no arquivo")
-            
-            # Process each lead block
-            leads = []
-            for i, lead_block in enumerate(lead_blocks):
-                if not lead_block.strip():
-                    continue
-                
-                print(f"\n[INFO] Processando lead #{i+1}:")
-                print("-" * 40)
-                print(lead_block[:200] + "..." if len(lead_block) > 200 else lead_block)
-                print("-" * 40)
-                
-                # Extract lead information using regex patterns that match the specified format
-                property_id_match = re.search(r'imóvel\s+(CX[0-9A-Z]+):', lead_block, re.IGNORECASE)
-                name_match = re.search(r'Nome:\s+([^\r\n]+)', lead_block, re.IGNORECASE)
-                email_match = re.search(r'E-mail:\s+([^\r\n]+)', lead_block, re.IGNORECASE)
-                phone_match = re.search(r'Telefone:\s+([^\r\n]+)', lead_block, re.IGNORECASE)
-                
-                # Create lead dictionary
-                lead = {}
-                
-                if property_id_match:
-                    lead["property_id"] = property_id_match.group(1)
-                    print(f"[INFO] Código do imóvel encontrado: {lead['property_id']}")
-                else:
-                    print("[AVISO] Código do imóvel não encontrado")
-                
-                if name_match:
-                    # Format name with first letters capitalized
-                    raw_name = name_match.group(1).strip()
-                    formatted_name = ' '.join(word.capitalize() for word in raw_name.split())
-                    lead["name"] = formatted_name
-                    print(f"[INFO] Nome encontrado: {lead['name']}")
-                else:
-                    print("[AVISO] Nome não encontrado")
-                
-                if email_match:
-                    lead["email"] = email_match.group(1).strip()
-                    print(f"[INFO] Email encontrado: {lead['email']}")
-                else:
-                    print("[AVISO] Email não encontrado")
+            return list(self.iter_leads(file_path))
+        except Exception as e:
+            logger.error(f"Failed to extract leads from file: {str(e)}")
+            print(f"[ERRO] Falha ao extrair leads do arquivo: {str(e)}")
+            return []
+    
+    def iter_leads(self, file_path=None):
+        """
+        Stream leads from a text file, yielding each one as soon as its block is read.
+        
+        The file is read line by line, so memory use does not depend on its size.
+        
+        Args:
+            file_path: Path to the text file (optional, uses self.leads_file if not provided)
+            
+        Yields:
+            dict: Lead dictionary with at least property_id, name and phone
+        """
+        file_path = file_path or self.leads_file
+        logger.info(f"Extracting leads from file: {file_path}")
+        print(f"[INFO] Extraindo leads do arquivo: {file_path}")
+        
+        # Check if file exists
+        if not os.path.exists(file_path):
+            logger.error(f"File not found: {file_path}")
+            print(f"[ERRO] Arquivo não encontrado: {file_path}")
+            return
+        
+        block_count = 0
+        lead_count = 0
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for lead_block, lead in iter_lead_records(f):
+                block_count += 1
+                logger.debug(f"Lead block #{block_count}: {lead_block[:200]!r}")
                 
-                if phone_match:
-                    # Clean up the phone number (remove non-digits)
-                    phone = re.sub(r'[^\d]', '', phone_match.group(1).strip())
-                    lead["phone"] = phone
-                    print(f"[INFO] Telefone encontrado: {lead['phone']}")
-                else:
-                    print("[AVISO] Telefone não encontrado")
+                missing = missing_fields(lead)
                 
-                # If any information is missing, allow manual input
-                if not lead.get("property_id") or not lead.get("name") or not lead.get("phone"):
-                    print("\n[AVISO] Algumas informações não foram encontradas automaticamente.")
-                    manual_input = input("Deseja inserir as informações manualmente? (s/n): ")
-                    
-                    if manual_input.lower() == "s":
-                        if not lead.get("property_id"):
-                            property_id = input("Digite o código do imóvel (ex: CX123456): ")
-                            lead["property_id"] = property_id
-                        
-                        if not lead.get("name"):
-                            name = input("Digite o nome do cliente: ")
-                            # Format name with first letters capitalized
-                            lead["name"] = ' '.join(word.capitalize() for word in name.split())
-                        
-                        if not lead.get("phone"):
-                            phone = input("Digite o telefone do cliente (apenas números): ")
-                            lead["phone"] = re.sub(r'[^\d]', '', phone)
+                # If any information is missing, quarantine the block or allow manual input
+                if missing:
+                    logger.debug(f"Lead block #{block_count} missing fields: {', '.join(missing)}")
+                    if self.non_interactive:
+                        self.quarantine_lead_block(lead_block, lead)
+                        continue
+                    lead = self._complete_lead_manually(lead_block, lead)
                 
                 # Check if we have the minimum required information
-                if lead.get("property_id") and lead.get("name") and lead.get("phone"):
-                    leads.append(lead)
-                    logger.info(f"Extracted lead: {lead.get('name', 'Unknown')}")
-                    print(f"[INFO] Lead extraído com sucesso: {lead.get('name')}")
-                else:
+                if missing_fields(lead):
                     logger.warning(f"Incomplete lead information in email text")
                     print(f"[AVISO] Informações incompletas no texto do email. Este lead será ignorado.")
+                    continue
+                
+                lead_count += 1
+                logger.debug(f"Extracted lead: {lead.get('name', 'Unknown')}")
+                yield lead
+        
+        if block_count == 0:
+            logger.warning("File is empty")
+            print("[AVISO] Arquivo está vazio")
+            return
+        
+        logger.info(f"Extracted {lead_count} leads from {block_count} blocks")
+        print(f"[INFO] Extraídos {lead_count} leads de {block_count} blocos do arquivo")
+        if self.quarantined_count:
+            print(f"[AVISO] {self.quarantined_count} blocos incompletos enviados para quarentena: {self.quarantine_file}")
+    
+    def _complete_lead_manually(self, lead_block, lead):
+        """
+        Ask the operator for the fields missing from a lead block.
+        
+        Args:
+            lead_block: Raw text of the lead block
+            lead: Fields that could be extracted from the block
             
-            logger.info(f"Extracted {len(leads)} leads from file")
-            print(f"\n[INFO] Extraídos {len(leads)} leads do arquivo")
-            return leads
-        except Exception as e:
-            logger.error(f"Failed to extract leads from file: {str(e)}")
-            print(f"[ERRO] Falha ao extrair leads do arquivo: {str(e)}")
-            return []
+        Returns:
+            dict: Lead dictionary with the fields typed by the operator
+        """
+        print("-" * 40)
+        print(lead_block[:200] + "..." if len(lead_block) > 200 else lead_block)
+        print("-" * 40)
+        print("\n[AVISO] Algumas informações não foram encontradas automaticamente.")
+        manual_input = input("Deseja inserir as informações manualmente? (s/n): ")
+        
+        if manual_input.lower() == "s":
+            if not lead.get("property_id"):
+                property_id = input("Digite o código do imóvel (ex: CX123456): ")
+                lead["property_id"] = property_id
+            
+            if not lead.get("name"):
+                name = input("Digite o nome do cliente: ")
+                # Format name with first letters capitalized
+                lead["name"] = format_name(name)
+            
+            if not lead.get("phone"):
+                phone = input("Digite o telefone do cliente (apenas números): ")
+                lead["phone"] = clean_phone(phone)
+        
+        return lead
+    
+    def quarantine_lead_block(self, lead_block, lead):
+        """
+        Append an incomplete lead block to the quarantine file.
+        
+        Args:
+            lead_block: Raw text of the lead block
+            lead: Fields that could be extracted from the block
+        """
+        missing = missing_fields(lead)
+        timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+        with open(self.quarantine_file, 'a', encoding='utf-8') as f:
+            f.write(f"# {timestamp} - campos faltantes: {', '.join(missing)}\n")
+            f.write(lead_block.strip() + "\n\n")
+        self.quarantined_count += 1
+        logger.warning(f"Incomplete lead block quarantined (missing: {', '.join(missing)})")
+        print(f"[AVISO] Lead incompleto enviado para quarentena (faltando: {', '.join(missing)})")
+    
+    def write_result(self, results, lead):
+        """
+        Append one processed lead to the JSON Lines results of an unattended run.
+        
+        Each lead is flushed as soon as it is written, so an interrupted run
+        keeps every result obtained until then.
+        
+        Args:
+            results: Results file opened for writing
+            lead: Processed lead dictionary
+        """
+        record = dict(lead, processed_at=datetime.datetime.now().isoformat(timespec="seconds"))
+        results.write(json.dumps(record, ensure_ascii=False) + "\n")
+        results.flush()
     
-    def search_property_details(self, property_id, timeout=30):
+    def search_property_details(self, property_id, timeout=30, use_cache=True):
         """
         Search for property details on viahouseleiloes.com.br.
         
+        The property cache is consulted first, then the local property catalog,
+        then the browserless HTTP lookup; the Selenium search is only used when
+        the page needs JavaScript to render.
+        
+        Args:
+            property_id: Property ID to search for
+            timeout: Maximum time to wait for operations (default: 30 seconds)
+            use_cache: Whether to read from the property cache and catalog (results are always cached)
+            
+        Returns:
+            dict: Property details dictionary
+        """
+        self.webdriver_commands = 0
+        if self.property_cache and use_cache:
+            property_details = self.property_cache.get(property_id)
+            if property_details is not None:
+                print(f"[INFO] Imóvel encontrado no cache: {property_details.get('url')}")
+                return property_details
+        
+        if self.property_catalog and use_cache:
+            property_details = self.property_catalog.get(property_id)
+            if property_details is not None:
+                print(f"[INFO] Imóvel encontrado no catálogo local: {property_details.get('url')}")
+                return property_details
+        
+        property_details = None
+        if self.http_lookup:
+            property_details = self.http_lookup.lookup(property_id)
+            if property_details is not None:
+                print(f"[INFO] Imóvel resolvido via HTTP: {property_details.get('url')}")
+            else:
+                print("[INFO] Página requer JavaScript, usando o navegador...")
+        
+        if property_details is None:
+            property_details = self._search_property_details_supervised(property_id, timeout)
+        
+        # Every detail page reached through the search teaches the resolver how URLs are built
+        if (self.url_resolver and property_details.get("city") and property_details.get("lookup_method") != "direct"
+                and not property_details.get("property_not_available")):
+            self.url_resolver.learn(property_id, property_details.get("url"))
+        
+        if self.property_cache:
+            self.property_cache.put(property_id, property_details)
+        return property_details
+    
+    def _search_property_details_supervised(self, property_id, timeout=30):
+        """
+        Run the Selenium lookup under the driver supervisor, if there is one.
+        
+        The driver is checked (and recycled when due) before the lookup; if the
+        browser died during the lookup it is replaced and the lookup retried once.
+        
+        Args:
+            property_id: Property ID to search for
+            timeout: Maximum time to wait for operations (default: 30 seconds)
+            
+        Returns:
+            dict: Property details dictionary
+        """
+        if not self.driver_supervisor:
+            return self._search_property_details_selenium(property_id, timeout)
+        
+        if self.driver_supervisor.before_lookup(self):
+            print("[INFO] Navegador será reiniciado antes desta busca")
+        property_details = self._search_property_details_selenium(property_id, timeout)
+        if self.driver_supervisor.after_lookup(self, property_details):
+            print("[AVISO] O navegador parou de responder; repetindo a busca com um novo navegador...")
+            property_details = self._search_property_details_selenium(property_id, timeout)
+            self.driver_supervisor.after_lookup(self, property_details)
+        return property_details
+    
+    def _search_property_details_selenium(self, property_id, timeout=30):
+        """
+        Search for property details using the Selenium WebDriver.
+        
         Args:
             property_id: Property ID to search for
             timeout: Maximum time to wait for operations (default: 30 seconds)
@@ -227,107 +371,81 @@ class CAIXALeadProcessor:
             "manual_review_needed": False,
             "error_details": ""
         }
+        commands = None
         
         try:
             logger.info(f"Searching for property details (ID: {property_id})...")
             print(f"[INFO] Pesquisando detalhes do imóvel (ID: {property_id})...")
             
+            # Start the browser only when the fallback is actually needed
+            if not self.ensure_driver():
+                property_details["manual_review_needed"] = True
+                property_details["error_details"] = "webdriver_unavailable"
+                return property_details
+            commands = CommandCounter(self.driver).start()
+            
             # Set timeout for the driver
             self.driver.set_page_load_timeout(timeout)
             
-            # Navigate to the website
-            self.driver.get("https://viahouseleiloes.com.br/")
-            
-            # Wait for the page to load with reduced time
-            time.sleep(2)
-            
-            # Wait for the search box to be available
-            try:
-                search_box = WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='Digite condomínio, região, bairro ou cidade']"))
-                )
-            except:
-                # Try a different selector
-                search_box = WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text'][name='q']"))
-                )
-            
-            # Enter the property ID and search
-            search_box.clear()
-            search_box.send_keys(property_id)
-            search_box.send_keys(Keys.RETURN)
-            
-            # Wait for the page to load after search (reduced time but more responsive)
-            time.sleep(5)
-            
-            # Get the current URL (after redirection)
-            current_url = self.driver.current_url
-            property_details["url"] = current_url
+            # Open the detail page straight away when its URL can be predicted
+            direct_result = self._open_property_page_directly(property_id)
             
-            print(f"[INFO] URL do imóvel: {current_url}")
-            
-            # Check if property is no longer for sale
-            try:
-                not_found_element = self.driver.find_element(By.CSS_SELECTOR, ".container h1")
-                if "Imóvel não encontrado" in not_found_element.text:
-                    print(f"[AVISO] Imóvel não está mais disponível para venda")
-                    property_details["city"] = ""
-                    property_details["manual_review_needed"] = True
-                    property_details["error_details"] = "property_no_longer_available"
-                    property_details["property_not_available"] = True
-                    return property_details
-            except:
-                # Element not found, property is still available
-                pass
-            
-            # Try to extract the city from the page
-            try:
-                # Wait for the location element to be present
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".info-destaque.localizacao"))
-                )
-                
-                # Get the location element
-                location_element = self.driver.find_element(By.CSS_SELECTOR, ".info-destaque.localizacao")
+            if direct_result is not None:
+                property_details["lookup_method"] = "direct"
+            else:
+                # Navigate to the website (get() returns once the document has loaded)
+                self.driver.get("https://viahouseleiloes.com.br/")
                 
-                # Try to get the HTML content to parse the city
-                location_html = location_element.get_attribute('innerHTML')
+                # Wait for whichever search box selector matches first
+                search_box = wait_for_any_element(self.driver, SEARCH_INPUT_SELECTORS)
                 
-                # Try to extract city from HTML (format: "(Street) s/n <br> (city)- SP")
-                city_match = re.search(r'<br>\s*([^-<]+)-\s*SP', location_html)
+                # Enter the property ID and search
+                home_url = self.driver.current_url
+                search_box.clear()
+                search_box.send_keys(property_id)
+                search_box.send_keys(Keys.RETURN)
                 
-                if city_match:
-                    city = city_match.group(1).strip()
-                    property_details["city"] = city
-                    print(f"[INFO] Cidade encontrada: {city}")
-                else:
-                    # Fallback to text extraction
-                    location_text = location_element.text.strip()
-                    
-                    # Try to extract city from text
-                    # Look for pattern: something followed by a dash and SP
-                    city_text_match = re.search(r'([^-\n]+)-\s*SP', location_text)
-                    
-                    if city_text_match:
-                        city = city_text_match.group(1).strip()
-                        property_details["city"] = city
-                        print(f"[INFO] Cidade encontrada: {city}")
-                    else:
-                        # Last resort: just use the whole text and clean it up
-                        city_text = location_text.replace("SP", "").replace("-", "").strip()
-                        # Remove any street address if present
-                        if "," in city_text:
-                            city_text = city_text.split(",")[-1].strip()
-                        property_details["city"] = city_text
-                        print(f"[INFO] Cidade extraída: {city_text}")
-            except Exception as e:
+                # Wait for the redirect to the result page instead of sleeping
+                wait_for_url_change(self.driver, home_url)
+            
+            # Race "not found" against the location block and use whichever appears first;
+            # the winning poll already carries the URL and the location content
+            try:
+                result, snapshot = direct_result or wait_for_search_result(self.driver)
+            except TimeoutException as e:
+                property_details["url"] = self.driver.current_url
+                print(f"[INFO] URL do imóvel: {property_details['url']}")
                 logger.warning(f"Could not extract city automatically: {str(e)}")
-                print(f"[AVISO] Não foi possível extrair a cidade automaticamente: {str(e)}")
+                print(f"[AVISO] Não foi possível extrair a cidade automaticamente: tempo esgotado")
                 
                 # Mark for manual review instead of asking for console input
                 property_details["city"] = ""
                 property_details["manual_review_needed"] = True
-                property_details["error_details"] = str(e)
+                property_details["error_details"] = "city_not_found"
+                print(f"[INFO] Cidade será revisada manualmente após o processamento")
+                return property_details
+            
+            # Get the current URL (after redirection)
+            property_details["url"] = snapshot["url"]
+            print(f"[INFO] URL do imóvel: {snapshot['url']}")
+            
+            # Check if property is no longer for sale
+            if result == RESULT_NOT_FOUND:
+                print(f"[AVISO] Imóvel não está mais disponível para venda")
+                property_details["city"] = ""
+                property_details["manual_review_needed"] = True
+                property_details["error_details"] = "property_no_longer_available"
+                property_details["property_not_available"] = True
+                return property_details
+            
+            # Parse the city from the HTML, falling back to the visible text
+            city = parse_city(snapshot["location_html"], snapshot["location_text"])
+            property_details["city"] = city
+            if city:
+                print(f"[INFO] Cidade encontrada: {city}")
+            else:
+                property_details["manual_review_needed"] = True
+                property_details["error_details"] = "city_not_found"
                 print(f"[INFO] Cidade será revisada manualmente após o processamento")
             
             return property_details
@@ -343,8 +461,52 @@ class CAIXALeadProcessor:
             property_details["manual_review_needed"] = True
             property_details["error_details"] = str(e)
             return property_details
+        finally:
+            if commands:
+                self.webdriver_commands = commands.stop()
+                logger.info(f"WebDriver commands for {property_id}: {self.webdriver_commands}")
     
-
+    def _open_property_page_directly(self, property_id):
+        """
+        Navigate to the detail URL predicted by the URL resolver and verify it by content.
+        
+        Args:
+            property_id: Property ID to open
+            
+        Returns:
+            tuple: (RESULT_LOCATION, snapshot) as returned by wait_for_search_result() if the
+                page is the property's detail page, None if the home-page search is needed
+                (including when the direct URL shows "not found", which is left to the search to confirm)
+        """
+        if not self.url_resolver:
+            return None
+        direct_url, template = self.url_resolver.candidate_url(property_id)
+        if not direct_url:
+            return None
+        
+        print(f"[INFO] Abrindo diretamente: {direct_url}")
+        try:
+            self.driver.get(direct_url)
+            result, snapshot = wait_for_search_result(self.driver)
+            page_html = None
+            if result == RESULT_LOCATION:
+                # The whole document is serialised once, after the poll that found the page
+                page_html = extract_snapshot(self.driver, {"page_html": field("html", "outerHTML")}).get("page_html")
+        except Exception as e:
+            logger.info(f"Direct navigation failed for {property_id}: {str(e)}")
+            result = None
+        
+        if result == RESULT_NOT_FOUND:
+            # A withdrawn property gives the same page, so this says nothing about the template
+            print("[INFO] Imóvel não encontrado pela URL direta, confirmando pela busca do site...")
+            return None
+        
+        verified = result is not None and page_mentions(property_id, page_html)
+        self.url_resolver.record(template, verified)
+        if not verified:
+            print("[INFO] Página direta não confirmada, usando a busca do site...")
+            return None
+        return result, snapshot
     
     def send_whatsapp_message(self, lead):
         """
@@ -478,6 +640,10 @@ class CAIXALeadProcessor:
             # Perguntar ao usuário se deseja abrir o link do WhatsApp no navegador
             open_link = input("\nDeseja abrir o link do WhatsApp no navegador? (s/n): ")
             
+            if not self.ensure_driver():
+                print("[ERRO] Não foi possível configurar o WebDriver do Selenium.")
+                return False
+            
             if open_link.lower() == "s":
                 # Abrir o link do WhatsApp no navegador
                 print("[INFO] Abrindo link para o WhatsApp App...")
@@ -541,12 +707,18 @@ class CAIXALeadProcessor:
     # Alias for backward compatibility
     extract_leads_from_file = extract_leads
     
-    def process_leads(self, headless=False):
+    def process_leads(self, headless=False, output_file=None):
         """
         Process CAIXA leads from a text file.
         
+        In non-interactive mode no message is sent: every lead is looked up,
+        its WhatsApp message is generated and each result is appended to
+        output_file as one JSON line as soon as it is ready.
+        
         Args:
             headless: Whether to run the browser in headless mode
+            output_file: JSON Lines results file for non-interactive mode
+                (default: leads_results.jsonl next to the leads file)
             
         Returns:
             bool: True if processing was successful, False otherwise
@@ -571,6 +743,11 @@ class CAIXALeadProcessor:
                 print("Telefone: 11992963253")
                 return False
             
+            # Unattended runs stream leads straight from the file into the lookups
+            if self.non_interactive:
+                self.headless = headless
+                return self._process_leads_unattended(self.iter_leads(file_path), output_file)
+            
             # Extract leads from the file
             leads = self.extract_leads(file_path)
             
@@ -579,11 +756,9 @@ class CAIXALeadProcessor:
                 print("[STATUS] Saindo do programa...")
                 return False
             
-            # Setup Selenium WebDriver
-            selenium_success = self.setup_driver(headless=headless)
-            if not selenium_success:
-                print("[ERRO] Não foi possível configurar o WebDriver do Selenium.")
-                return False
+            # The WebDriver is only started when a lookup or message actually needs it
+            self.headless = headless
+            
             
             # Process each lead
             for i, lead in enumerate(leads):
@@ -660,7 +835,7 @@ class CAIXALeadProcessor:
                     if continue_processing.lower() != "s":
                         print("[STATUS] Interrompendo processamento de leads...")
                         break
-            
+                
             logger.info("CAIXA lead processing completed")
             print("\n[INFO] Processamento de leads da CAIXA concluído")
             return True
@@ -676,6 +851,53 @@ class CAIXALeadProcessor:
                 except:
                     pass
                     
+    def _process_leads_unattended(self, leads, output_file=None):
+        """
+        Look up every lead without prompting and stream the results to JSON Lines.
+        
+        Args:
+            leads: Iterable of lead dictionaries (may be a generator)
+            output_file: JSON Lines results file, one processed lead per line
+                
+        Returns:
+            bool: True if the results were written
+        """
+        output_file = output_file or os.path.join(
+            os.path.dirname(os.path.abspath(self.leads_file)), "leads_results.jsonl"
+        )
+        
+        written = 0
+        with open(output_file, 'w', encoding='utf-8') as results:
+            for i, lead in enumerate(leads):
+                print(f"\n[INFO] Processando lead {i+1}: {lead.get('name', 'Desconhecido')}")
+                
+                property_details = self.search_property_details(lead["property_id"])
+                lead["property_url"] = property_details.get("url", "")
+                lead["city"] = property_details.get("city", "")
+                lead["property_not_available"] = bool(property_details.get("property_not_available"))
+                lead["manual_review_needed"] = bool(property_details.get("manual_review_needed"))
+                lead["error_details"] = property_details.get("error_details", "")
+                
+                if lead["property_not_available"]:
+                    lead["status"] = "property_not_available"
+                elif lead["manual_review_needed"] or not lead["property_url"] or not lead["city"]:
+                    lead["status"] = "manual_review"
+                else:
+                    lead["status"] = "complete"
+                try:
+                    lead["message"] = self.generate_whatsapp_message(lead)
+                except ValueError:
+                    # Missing fields are already reflected in the status
+                    lead["message"] = ""
+                self.write_result(results, lead)
+                written += 1
+        
+        logger.info(f"{written} results written to {output_file}")
+        print(f"[INFO] {written} resultados gravados em: {output_file}")
+        logger.info("CAIXA lead processing completed")
+        print("\n[INFO] Processamento de leads da CAIXA concluído")
+        return True
+    
     def get_greeting(self):
         """
         Get greeting based on time of day.
@@ -765,22 +987,49 @@ class CAIXALeadProcessor:
             logger.error(f"Failed to process message template: {str(e)}")
             raise
 
-def main():
+def main(argv=None):
     """
     Main function.
+    
+    Args:
+        argv: Command line arguments (default: sys.argv)
     """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Processador de leads da CAIXA")
+    parser.add_argument("--leads-file", help="Arquivo de leads (padrão: leads.txt no diretório atual)")
+    parser.add_argument("--non-interactive", action="store_true",
+                        help="Não fazer perguntas: leads incompletos vão para quarentena e os resultados para JSON Lines")
+    parser.add_argument("--headless", action="store_true", help="Executar navegador em modo invisível")
+    parser.add_argument("--output", help="Arquivo JSON Lines de resultados, um lead por linha (modo não interativo)")
+    parser.add_argument("--quarantine", help="Arquivo de quarentena para leads incompletos")
+    args = parser.parse_args(argv)
+    
     print("\n" + "=" * 50)
     print("PROCESSADOR DE LEADS DA CAIXA")
     print("=" * 50 + "\n")
     
     # Ask if the user wants to run the browser in headless mode
-    headless = input("Executar navegador em modo invisível? (s/n, padrão: n): ").lower() == "s"
+    headless = args.headless
+    if not args.non_interactive and not headless:
+        headless = input("Executar navegador em modo invisível? (s/n, padrão: n): ").lower() == "s"
     
-    # Create an instance of the CAIXALeadProcessor
-    processor = CAIXALeadProcessor()
+    # Create an instance of the CAIXALeadProcessor sharing the on-disk property cache
+    from app_settings import AppSettings
+    from property_cache import PropertyCache
+    from driver_supervisor import DriverSupervisor
+    settings = AppSettings()
+    property_cache = PropertyCache.from_settings(settings) if settings.get("cache.enabled", True) else None
+    processor = CAIXALeadProcessor(
+        leads_file=args.leads_file,
+        property_cache=property_cache,
+        non_interactive=args.non_interactive,
+        quarantine_file=args.quarantine,
+        driver_supervisor=DriverSupervisor.from_settings(settings)
+    )
     
     # Process leads
-    result = processor.process_leads(headless=headless)
+    result = processor.process_leads(headless=headless, output_file=args.output)
     
     print("\n" + "=" * 50)
     print("PROCESSAMENTO CONCLUÍDO")
@@ -789,4 +1038,5 @@ def main():
     return result
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import sys
+    sys.exit(0 if main() else 1)
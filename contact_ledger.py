@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Contact Ledger
+Persistent history of WhatsApp contacts, so leads re-forwarded in later
+sessions can be skipped before any property lookup
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+from lead_index import normalize_phone, normalize_property_id
+
+logger = logging.getLogger('ContactLedger')
+
+LEDGER_FILE_NAME = "contact_history.sqlite3"
+
+ACTION_SKIP = "skip"
+ACTION_FLAG = "flag"
+
+
+def mark_contacted(lead, contacted_at):
+    """
+    Mark a lead whose phone was already messaged about its property.
+
+    Args:
+        lead: Lead dictionary (updated in place)
+        contacted_at: Unix timestamp of the last contact
+    """
+    lead["already_contacted"] = True
+    lead["last_contacted_at"] = datetime.fromtimestamp(contacted_at).isoformat(timespec="seconds")
+
+
+def contact_notice(lead):
+    """
+    Describe the last contact of a lead marked by mark_contacted().
+
+    Args:
+        lead: Lead dictionary
+
+    Returns:
+        str: Notice for the operator, or "" if the lead was not contacted before
+    """
+    if not lead.get("already_contacted") or not lead.get("last_contacted_at"):
+        return ""
+    contacted_on = datetime.fromisoformat(lead["last_contacted_at"]).strftime("%d/%m/%Y")
+    return f"Já contatado em {contacted_on}"
+
+
+def flag_status(status, lead):
+    """
+    Append the contact notice of a flagged lead to its lookup status.
+
+    The notice goes after the status, so the status keeps its facet
+    (Completo, Pendente, Erro) in the statistics and the search.
+
+    Args:
+        status: Status returned by the lookup
+        lead: Lead dictionary
+
+    Returns:
+        str: Status with the notice, or the status unchanged
+    """
+    notice = contact_notice(lead)
+    if not notice or notice in status:
+        return status
+    return f"{status} · ⚠️ {notice}"
+
+
+class ContactLedger:
+    """
+    SQLite ledger of (phone, property_id) pairs that were messaged.
+
+    Lookups hit a composite index on (phone, property_id, contacted_at), so
+    they stay fast with hundreds of thousands of rows.
+    """
+
+    def __init__(self, db_path):
+        """
+        Initialize the ContactLedger.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS contacts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                phone TEXT NOT NULL,
+                property_id TEXT NOT NULL,
+                name TEXT,
+                email TEXT,
+                contacted_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_contact ON contacts (phone, property_id, contacted_at)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Open the ledger in the application data directory.
+
+        Args:
+            settings: AppSettings instance
+
+        Returns:
+            ContactLedger: Ledger stored under data/
+        """
+        return cls(settings.data_dir / LEDGER_FILE_NAME)
+
+    def record(self, lead, contacted_at=None):
+        """
+        Record that a lead was messaged.
+
+        Args:
+            lead: Lead dictionary (phone and property_id are required)
+            contacted_at: Unix timestamp of the contact (default: now)
+
+        Returns:
+            bool: True if the contact was recorded
+        """
+        phone = normalize_phone(lead.get("phone"))
+        property_id = normalize_property_id(lead.get("property_id"))
+        if not phone or not property_id:
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO contacts (phone, property_id, name, email, contacted_at) VALUES (?, ?, ?, ?, ?)",
+                (phone, property_id, lead.get("name", ""), lead.get("email", ""), contacted_at or time.time()),
+            )
+            self._conn.commit()
+        logger.info(f"Contact recorded: {phone} / {property_id}")
+        return True
+
+    def last_contact(self, lead, window_days=None):
+        """
+        Return when a lead's phone was last messaged about its property.
+
+        Args:
+            lead: Lead dictionary
+            window_days: Only consider contacts in the last N days (None: any time)
+
+        Returns:
+            float: Unix timestamp of the last contact, or None
+        """
+        phone = normalize_phone(lead.get("phone"))
+        property_id = normalize_property_id(lead.get("property_id"))
+        if not phone or not property_id:
+            return None
+
+        since = time.time() - window_days * 86400 if window_days else 0
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(contacted_at) FROM contacts WHERE phone = ? AND property_id = ? AND contacted_at >= ?",
+                (phone, property_id, since),
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - DOM Extraction
+Reads every field a lookup needs with one injected script per poll instead
+of a find_element/get_attribute round trip per field, and counts the
+WebDriver commands a lookup sends
+"""
+
+# Runs in the page: arguments[0] maps field names to {selector, property, all}.
+# A property missing from the node is read as an attribute; a missing node
+# gives null (or [] for "all" fields)
+SNAPSHOT_SCRIPT = """
+var fields = arguments[0], snapshot = {url: window.location.href, ready_state: document.readyState};
+function read(node, property) {
+    var value = property in node ? node[property] : node.getAttribute(property);
+    return value === null || value === undefined ? "" : String(value);
+}
+for (var name in fields) {
+    var spec = fields[name];
+    if (spec.all) {
+        var nodes = document.querySelectorAll(spec.selector), values = [];
+        for (var i = 0; i < nodes.length; i++) { values.push(read(nodes[i], spec.property)); }
+        snapshot[name] = values;
+    } else {
+        var node = document.querySelector(spec.selector);
+        snapshot[name] = node ? read(node, spec.property) : null;
+    }
+}
+return snapshot;
+"""
+
+
+def field(selector, property="innerText", all=False):
+    """
+    Describe one value to read from the page.
+
+    Args:
+        selector: CSS selector of the element
+        property: DOM property (or attribute) to read; innerText matches WebElement.text
+        all: Read every matching element into a list instead of the first one
+
+    Returns:
+        dict: Field specification for extract_snapshot()
+    """
+    return {"selector": selector, "property": property, "all": all}
+
+
+# Fields of the property details page read by LeadProcessor
+PROPERTY_DETAIL_FIELDS = {
+    "title": field(".property-title"),
+    "price": field(".property-price"),
+    "address": field(".property-address"),
+    "area": field(".property-features .area"),
+    "bedrooms": field(".property-features .bedrooms"),
+    "bathrooms": field(".property-features .bathrooms"),
+    "description": field(".property-description"),
+    "features": field(".property-features-list li", all=True),
+    "images": field(".property-images img", "src", all=True),
+}
+
+
+def extract_snapshot(driver, fields):
+    """
+    Read several fields of the current page in a single WebDriver command.
+
+    Args:
+        driver: Selenium WebDriver
+        fields: dict mapping field names to field() specifications
+
+    Returns:
+        dict: Field name -> value (None or [] when nothing matched), plus
+            "url" and "ready_state" of the document
+    """
+    return driver.execute_script(SNAPSHOT_SCRIPT, fields) or {}
+
+
+def wait_for_snapshot(driver, fields, condition, timeout, poll_frequency=0.2):
+    """
+    Poll extract_snapshot() until condition accepts the snapshot.
+
+    Every poll is a single command, so waiting for one of several elements
+    costs no more round trips than waiting for one.
+
+    Args:
+        driver: Selenium WebDriver
+        fields: dict mapping field names to field() specifications
+        condition: Callable taking a snapshot and returning a truthy value when done
+        timeout: Budget in seconds
+        poll_frequency: Seconds between polls
+
+    Returns:
+        tuple: (value returned by condition, snapshot)
+
+    Raises:
+        TimeoutException: If condition never accepted a snapshot within the budget
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import WebDriverException
+
+    def accepted(driver):
+        try:
+            snapshot = extract_snapshot(driver, fields)
+        except WebDriverException:
+            # The page is still being replaced; poll again
+            return False
+        value = condition(snapshot)
+        return (value, snapshot) if value else False
+
+    return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(accepted)
+
+
+def snapshot_to_property_details(snapshot):
+    """
+    Turn a snapshot of PROPERTY_DETAIL_FIELDS into LeadProcessor's details dict.
+
+    Args:
+        snapshot: Result of extract_snapshot() with PROPERTY_DETAIL_FIELDS
+
+    Returns:
+        dict: Property details with stripped text and "" / [] for missing fields
+    """
+    property_details = {}
+    for name, spec in PROPERTY_DETAIL_FIELDS.items():
+        value = snapshot.get(name)
+        if spec["all"]:
+            property_details[name] = [item.strip() for item in value or [] if item.strip()]
+        else:
+            property_details[name] = (value or "").strip()
+    return property_details
+
+
+class CommandCounter:
+    """
+    Counts the WebDriver commands sent through a driver.
+
+    Every Selenium call, including WebElement methods, goes through the
+    driver's execute(); the counter wraps it on the instance while active.
+    """
+
+    def __init__(self, driver):
+        """
+        Initialize the CommandCounter.
+
+        Args:
+            driver: Selenium WebDriver to observe
+        """
+        self.driver = driver
+        self.count = 0
+        self._previous = None
+        self._active = False
+
+    def start(self):
+        """
+        Start counting.
+
+        Returns:
+            CommandCounter: self, for chaining
+        """
+        if self._active:
+            return self
+        self._previous = self.driver.__dict__.get("execute")
+        execute = self.driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.count += 1
+            return execute(driver_command, params)
+
+        self.driver.execute = counted_execute
+        self._active = True
+        return self
+
+    def stop(self):
+        """
+        Stop counting and restore the driver.
+
+        Returns:
+            int: Commands sent while the counter was active
+        """
+        if self._active:
+            if self._previous is None:
+                self.driver.__dict__.pop("execute", None)
+            else:
+                self.driver.execute = self._previous
+            self._active = False
+        return self.count
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - WebDriver Pool
+Fans property lookups out across several browser instances in parallel
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logger = logging.getLogger('DriverPool')
+
+
+class DriverPool:
+    """
+    Pool of CAIXALeadProcessor instances for parallel property lookups.
+
+    Each worker thread lazily creates and owns its own processor (and therefore
+    its own WebDriver), so no browser is ever shared between threads.
+    """
+
+    def __init__(self, size=2, headless=True, processor_factory=None):
+        """
+        Initialize the DriverPool.
+
+        Args:
+            size: Number of workers (and browser instances) in the pool
+            headless: Whether to run the browsers in headless mode
+            processor_factory: Optional callable returning a new processor
+        """
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.processor_factory = processor_factory or self._default_factory
+        self._local = threading.local()
+        self._processors = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+
+    def _default_factory(self):
+        """Create a processor; its WebDriver is only started if a lookup falls back to Selenium"""
+        from caixa_lead_processor import CAIXALeadProcessor
+        return CAIXALeadProcessor(headless=self.headless)
+
+    def start(self):
+        """Start the worker threads"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="lookup-worker")
+            logger.info(f"Driver pool started with {self.size} workers")
+        return self
+
+    def _get_processor(self):
+        """Return the processor owned by the current worker thread, creating it on first use"""
+        processor = getattr(self._local, "processor", None)
+        if processor is None:
+            processor = self.processor_factory()
+            self._local.processor = processor
+            with self._lock:
+                self._processors.append(processor)
+        return processor
+
+    def _run_task(self, fn, args):
+        if self._closed:
+            raise RuntimeError("Pool encerrado")
+        return fn(self._get_processor(), *args)
+
+    def submit(self, fn, *args):
+        """
+        Schedule fn(processor, *args) on the next free worker.
+
+        Returns:
+            concurrent.futures.Future: Future with the result of fn
+        """
+        self.start()
+        return self._executor.submit(self._run_task, fn, args)
+
+    def imap_unordered(self, fn, items, should_stop=None, on_error=None):
+        """
+        Run fn(processor, item) for every item and yield results as they complete.
+
+        Args:
+            fn: Callable receiving (processor, item)
+            items: Sequence of items to process
+            should_stop: Optional callable; when it returns True pending items are cancelled
+            on_error: Optional callable receiving (item, exception) and returning the result
+                for an item whose fn (or the worker's processor_factory) raised; without it
+                the exception is re-raised
+
+        Yields:
+            tuple: (index, item, result) in completion order
+        """
+        futures = {self.submit(fn, item): (index, item) for index, item in enumerate(items)}
+
+        for future in as_completed(futures):
+            index, item = futures[future]
+            if should_stop and should_stop():
+                for pending in futures:
+                    pending.cancel()
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                # One failing item must not take the other items down with it
+                logger.warning(f"Pooled task failed for item {index}: {str(e)}")
+                result = on_error(item, e)
+            yield index, item, result
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers and quit every browser created by the pool.
+
+        Args:
+            wait: Whether to wait for running lookups to finish before quitting the browsers
+        """
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+        with self._lock:
+            processors, self._processors = self._processors, []
+
+        for processor in processors:
+            try:
+                # Closes the processor's HTTP session and quits its WebDriver
+                processor.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled processor: {str(e)}")
+
+        logger.info("Driver pool shut down")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
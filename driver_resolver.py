@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - ChromeDriver Resolver
+Remembers which chromedriver matched the installed Chrome, so setup_driver
+reuses it without probing versions or touching the network on every start
+"""
+
+import os
+import re
+import json
+import logging
+import subprocess
+import threading
+from datetime import datetime
+
+logger = logging.getLogger('DriverResolver')
+
+DEFAULT_RECORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "chromedriver.json")
+
+# Commands that print the Chrome version on Linux and macOS
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+]
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+_lock = threading.Lock()
+
+
+def detect_chrome_version():
+    """
+    Read the installed Chrome version without using the network.
+
+    Returns:
+        str: Version such as "120.0.6099.109", or None if Chrome was not found
+    """
+    try:
+        import winreg
+    except ImportError:
+        winreg = None
+
+    if winreg is not None:
+        for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                    return winreg.QueryValueEx(key, "version")[0]
+            except OSError:
+                continue
+        return None
+
+    for command in CHROME_VERSION_COMMANDS:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = VERSION_PATTERN.search(output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def major_version(version):
+    """Return the major part of a Chrome version ("120.0.6099.109" -> "120")"""
+    return version.split(".", 1)[0] if version else None
+
+
+def install_chromedriver():
+    """Download (or find in ~/.wdm) the chromedriver for the installed Chrome"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+class ChromeDriverResolver:
+    """
+    Resolve the chromedriver path, consulting webdriver_manager only when needed.
+
+    The resolved Chrome/driver pair is recorded in a JSON file. Later starts
+    reuse the recorded driver as long as it exists and Chrome kept the same
+    major version (chromedriver is compatible within a major version). If
+    resolving fails, e.g. with no network, the last recorded driver is
+    still used.
+    """
+
+    def __init__(self, record_file=None, installer=None, version_probe=None):
+        """
+        Initialize the ChromeDriverResolver.
+
+        Args:
+            record_file: JSON file holding the last resolved Chrome/driver pair
+            installer: Callable returning a chromedriver path (default: webdriver_manager)
+            version_probe: Callable returning the installed Chrome version, or None
+        """
+        self.record_file = record_file or DEFAULT_RECORD_FILE
+        self.installer = installer or install_chromedriver
+        self.version_probe = version_probe or detect_chrome_version
+
+    def load_record(self):
+        """
+        Load the last resolved pair.
+
+        Returns:
+            dict: chrome_version, driver_path and resolved_at, or None
+        """
+        try:
+            with open(self.record_file, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return record if isinstance(record, dict) and record.get("driver_path") else None
+
+    def save_record(self, chrome_version, driver_path):
+        """Record a resolved Chrome/driver pair"""
+        record = {
+            "chrome_version": chrome_version,
+            "driver_path": driver_path,
+            "resolved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.record_file)), exist_ok=True)
+            with open(self.record_file, "w", encoding="utf-8") as f:
+                json.dump(record, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Failed to save chromedriver record: {str(e)}")
+        return record
+
+    def resolve(self):
+        """
+        Return the chromedriver to use.
+
+        Returns:
+            str: Path to chromedriver, or None to let Selenium locate one itself
+        """
+        with _lock:
+            record = self.load_record()
+            recorded_path = record["driver_path"] if record and os.path.exists(record["driver_path"]) else None
+            chrome_version = self.version_probe()
+
+            if recorded_path and major_version(chrome_version) in (None, major_version(record.get("chrome_version"))):
+                logger.info(f"Reusing recorded chromedriver: {recorded_path}")
+                return recorded_path
+
+            try:
+                driver_path = self.installer()
+            except Exception as e:
+                if recorded_path:
+                    logger.warning(f"Failed to resolve chromedriver ({str(e)}); using the last recorded one")
+                    return recorded_path
+                logger.warning(f"Failed to resolve chromedriver: {str(e)}")
+                return None
+
+            self.save_record(chrome_version, driver_path)
+            logger.info(f"Resolved chromedriver for Chrome {chrome_version}: {driver_path}")
+            return driver_path
+
+
+def resolve_chromedriver():
+    """Resolve the chromedriver path with the default record file (see ChromeDriverResolver.resolve)"""
+    return ChromeDriverResolver().resolve()
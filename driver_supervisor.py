@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Driver Supervisor
+Keeps a processor's WebDriver usable through long runs: checks the session
+before each Selenium lookup, replaces a crashed browser and retries the
+lookup that hit the crash, and recycles the browser after a number of
+lookups or once it uses too much memory
+"""
+
+import logging
+
+from warm_driver import driver_is_alive
+
+logger = logging.getLogger('DriverSupervisor')
+
+RECYCLE_AFTER_LOOKUPS = 200
+RECYCLE_RSS_MB = 1500
+
+REASON_DEAD = "dead"
+REASON_CRASH = "crash"
+REASON_LOOKUPS = "lookups"
+REASON_MEMORY = "memory"
+
+
+def browser_rss_mb(driver):
+    """
+    Measure the resident memory of the browser behind a driver.
+
+    Chrome runs as children of the chromedriver process, so the whole tree
+    under the driver service is summed. Needs the optional psutil package.
+
+    Args:
+        driver: Selenium WebDriver started with a local service
+
+    Returns:
+        float: Resident memory in MB, or None if it cannot be measured
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    try:
+        service_process = psutil.Process(driver.service.process.pid)
+        processes = [service_process] + service_process.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            # Renderer processes come and go while the page runs
+            continue
+    return total / (1024 * 1024)
+
+
+class DriverSupervisor:
+    """
+    Health checks, restarts and recycling for one processor's WebDriver.
+
+    The processor calls before_lookup() ahead of every Selenium lookup and
+    after_lookup() with its result. A driver that is dropped is quit and
+    left as None, so the processor's ensure_driver() starts a fresh one
+    (from the warm driver, the tab pool or setup_driver) on the next lookup.
+    """
+
+    def __init__(self, recycle_after=RECYCLE_AFTER_LOOKUPS, max_rss_mb=RECYCLE_RSS_MB,
+                 health_check=driver_is_alive, rss_probe=browser_rss_mb):
+        """
+        Initialize the DriverSupervisor.
+
+        Args:
+            recycle_after: Selenium lookups after which the browser is replaced (0: never)
+            max_rss_mb: Browser memory in MB above which it is replaced (0: never)
+            health_check: Callable returning True if a driver still answers
+            rss_probe: Callable returning a driver's browser memory in MB, or None
+        """
+        self.recycle_after = recycle_after
+        self.max_rss_mb = max_rss_mb
+        self.health_check = health_check
+        self.rss_probe = rss_probe
+        self.lookups = 0  # Selenium lookups served by the current driver
+        self.restarts = 0
+        self.recycles = 0
+        self._driver = None
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Create a supervisor with the recycling limits of the settings.
+
+        Args:
+            settings: AppSettings instance
+
+        Returns:
+            DriverSupervisor: Supervisor for one processor
+        """
+        return cls(recycle_after=settings.get("processing.recycle_after_lookups", RECYCLE_AFTER_LOOKUPS),
+                   max_rss_mb=settings.get("processing.recycle_rss_mb", RECYCLE_RSS_MB))
+
+    def before_lookup(self, processor):
+        """
+        Check the processor's driver before a Selenium lookup.
+
+        Args:
+            processor: CAIXALeadProcessor about to use its driver
+
+        Returns:
+            str: REASON_* constant if the driver was dropped, None if it is kept
+        """
+        driver = processor.driver
+        if driver is None:
+            return None
+        self._track(driver)
+
+        if not self.health_check(driver):
+            reason = REASON_DEAD
+        elif self.recycle_after and self.lookups >= self.recycle_after:
+            reason = REASON_LOOKUPS
+        elif self.max_rss_mb and (self.rss_probe(driver) or 0) > self.max_rss_mb:
+            reason = REASON_MEMORY
+        else:
+            return None
+
+        self.discard(processor, reason)
+        return reason
+
+    def after_lookup(self, processor, property_details):
+        """
+        Count a finished Selenium lookup and drop the driver if it crashed during it.
+
+        Args:
+            processor: CAIXALeadProcessor that ran the lookup
+            property_details: Details returned by the lookup
+
+        Returns:
+            bool: True if the session died during the lookup and the lookup should be retried
+        """
+        driver = processor.driver
+        if driver is None:
+            # The browser could not be started; a retry would fail the same way
+            return False
+        self._track(driver)
+        self.lookups += 1
+
+        if not property_details.get("manual_review_needed") or property_details.get("property_not_available"):
+            return False
+        if self.health_check(driver):
+            # An ordinary lookup failure (timeout, missing city...), not a dead browser
+            return False
+        self.discard(processor, REASON_CRASH)
+        return True
+
+    def discard(self, processor, reason):
+        """
+        Quit the processor's driver and leave it to be replaced on the next lookup.
+
+        Args:
+            processor: CAIXALeadProcessor owning the driver
+            reason: REASON_* constant, for the log and the counters
+        """
+        driver, processor.driver = processor.driver, None
+        if reason in (REASON_DEAD, REASON_CRASH):
+            self.restarts += 1
+            logger.warning(f"WebDriver session lost ({reason}); a new browser will be started")
+        else:
+            self.recycles += 1
+            logger.info(f"Recycling WebDriver after {self.lookups} lookups ({reason})")
+        self._driver = None
+        self.lookups = 0
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.info(f"Failed to quit discarded WebDriver: {str(e)}")
+
+    def _track(self, driver):
+        """Restart the lookup count when the processor got a new driver"""
+        if driver is not self._driver:
+            self._driver = driver
+            self.lookups = 0
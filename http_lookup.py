@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - HTTP Property Lookup
+Resolves property details on viahouseleiloes.com.br with plain HTTP requests,
+so the common case needs no browser at all
+"""
+
+import re
+import time
+import logging
+import threading
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger('HTTPPropertyLookup')
+
+BASE_URL = "https://viahouseleiloes.com.br/"
+NOT_FOUND_TEXT = "Imóvel não encontrado"
+NOT_FOUND_SELECTOR = ".container h1"
+LOCATION_SELECTOR = ".info-destaque.localizacao"
+SEARCH_INPUT_SELECTORS = [
+    "input[placeholder*='Digite condomínio, região, bairro ou cidade']",
+    "input[type='text'][name='q']",
+]
+
+# How long a home page without the search form is trusted before it is fetched again
+FORM_RETRY_SECONDS = 600
+
+# Cached in place of the form when the home page needs JavaScript to render it
+NO_SEARCH_FORM = object()
+
+# Location block format: "(Street) s/n <br> (city)- SP"
+CITY_HTML_PATTERN = re.compile(r'<br\s*/?>\s*([^-<]+)-\s*SP')
+CITY_TEXT_PATTERN = re.compile(r'([^-\n]+)-\s*SP')
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+}
+
+
+def parse_city(location_html, location_text=""):
+    """
+    Extract the city from the location block of a property page.
+
+    Args:
+        location_html: Inner HTML of the location element
+        location_text: Visible text of the location element (fallback)
+
+    Returns:
+        str: City name, or an empty string if nothing could be extracted
+    """
+    city_match = CITY_HTML_PATTERN.search(location_html or "")
+    if city_match:
+        return city_match.group(1).strip()
+
+    location_text = (location_text or "").strip()
+    city_text_match = CITY_TEXT_PATTERN.search(location_text)
+    if city_text_match:
+        return city_text_match.group(1).strip()
+
+    # Last resort: just use the whole text and clean it up
+    city_text = location_text.replace("SP", "").replace("-", "").strip()
+    if "," in city_text:
+        city_text = city_text.split(",")[-1].strip()
+    return city_text
+
+
+def parse_property_page(html, url):
+    """
+    Parse a property page fetched without JavaScript.
+
+    Args:
+        html: Raw HTML of the page
+        url: Final URL of the page (after redirects)
+
+    Returns:
+        dict: Property details, or None if the page needs JavaScript to render
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    not_found_element = soup.select_one(NOT_FOUND_SELECTOR)
+    if not_found_element and NOT_FOUND_TEXT in not_found_element.get_text():
+        return {
+            "url": url,
+            "city": "",
+            "manual_review_needed": True,
+            "error_details": "property_no_longer_available",
+            "property_not_available": True,
+            "lookup_method": "http",
+        }
+
+    location_element = soup.select_one(LOCATION_SELECTOR)
+    if location_element is None:
+        return None
+
+    city = parse_city(location_element.decode_contents(), location_element.get_text("\n"))
+    return {
+        "url": url,
+        "city": city,
+        "manual_review_needed": not city,
+        "error_details": "" if city else "city_not_found",
+        "lookup_method": "http",
+    }
+
+
+class HTTPPropertyLookup:
+    """
+    Lightweight property lookup engine built on a pooled requests.Session.
+
+    The search form of the home page is discovered once per session and then
+    submitted directly for each property ID, following the redirect to the
+    property page. A home page without the form is remembered too, for
+    form_retry_seconds, so those leads go straight to Selenium.
+    """
+
+    def __init__(self, base_url=BASE_URL, timeout=10, pool_size=8,
+                 form_retry_seconds=FORM_RETRY_SECONDS, clock=time.monotonic):
+        """
+        Initialize the HTTPPropertyLookup.
+
+        Args:
+            base_url: Home page of the property site
+            timeout: Timeout in seconds for each HTTP request
+            pool_size: Maximum number of kept-alive connections
+            form_retry_seconds: Seconds before a home page without the search form is fetched again
+            clock: Monotonic clock in seconds (replaceable in tests)
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.form_retry_seconds = form_retry_seconds
+        self._clock = clock
+        self._search_form = None
+        self._search_form_checked_at = 0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _discover_search_form(self):
+        """
+        Find the action, method and field name of the home page search form.
+
+        Returns:
+            tuple: (action_url, method, field_name) or None if the form is not in the raw HTML
+        """
+        with self._lock:
+            if self._search_form is NO_SEARCH_FORM:
+                if self._clock() - self._search_form_checked_at < self.form_retry_seconds:
+                    return None
+            elif self._search_form is not None:
+                return self._search_form
+
+            response = self.session.get(self.base_url, timeout=self.timeout)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.text, "lxml")
+
+            for selector in SEARCH_INPUT_SELECTORS:
+                search_input = soup.select_one(selector)
+                if search_input is None or not search_input.get("name"):
+                    continue
+                form = search_input.find_parent("form")
+                if form is None:
+                    continue
+                action = urllib.parse.urljoin(response.url, form.get("action") or response.url)
+                method = (form.get("method") or "get").lower()
+                self._search_form = (action, method, search_input["name"])
+                logger.info(f"Search form discovered: {method.upper()} {action}")
+                return self._search_form
+
+            self._search_form = NO_SEARCH_FORM
+            self._search_form_checked_at = self._clock()
+            return None
+
+    def lookup(self, property_id):
+        """
+        Look up a property without a browser.
+
+        Args:
+            property_id: Property ID to search for
+
+        Returns:
+            dict: Property details, or None if the page needs the Selenium fallback
+        """
+        try:
+            search_form = self._discover_search_form()
+            if search_form is None:
+                logger.info("Search form not present in raw HTML, JavaScript required")
+                return None
+
+            action, method, field_name = search_form
+            if method == "post":
+                response = self.session.post(action, data={field_name: property_id}, timeout=self.timeout)
+            else:
+                response = self.session.get(action, params={field_name: property_id}, timeout=self.timeout)
+            response.raise_for_status()
+
+            details = parse_property_page(response.text, response.url)
+            if details is None:
+                logger.info(f"Property page for {property_id} requires JavaScript")
+            return details
+        except requests.RequestException as e:
+            logger.warning(f"HTTP lookup failed for {property_id}: {str(e)}")
+            return None
+
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
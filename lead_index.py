@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Lead Identity Index
+Hash index over the manually entered leads for constant-time duplicate checks
+"""
+
+DUPLICATE_EMAIL = "email"
+DUPLICATE_PHONE = "phone"
+
+
+def normalize_email(email):
+    """
+    Normalize an e-mail address for comparison.
+
+    Args:
+        email: E-mail as typed
+
+    Returns:
+        str: Lower-case e-mail without surrounding spaces
+    """
+    return (email or "").strip().lower()
+
+
+def normalize_phone(phone):
+    """
+    Normalize a phone number for comparison.
+
+    Args:
+        phone: Phone number as typed
+
+    Returns:
+        str: Digits only, without the Brazilian country code
+    """
+    digits = ''.join(filter(str.isdigit, phone or ""))
+    if digits.startswith("55") and len(digits) > 11:
+        digits = digits[2:]
+    return digits
+
+
+def normalize_property_id(property_id):
+    """
+    Normalize a property code for comparison.
+
+    Args:
+        property_id: Property code as typed
+
+    Returns:
+        str: Upper-case property code without surrounding spaces
+    """
+    return (property_id or "").strip().upper()
+
+
+class LeadIdentityIndex:
+    """
+    Index of lead identities: (normalized e-mail, normalized phone, property_id).
+
+    A lead is a duplicate when the same e-mail or the same phone is already
+    registered for the same property, so a contact that changed e-mail but
+    kept the phone is still caught.
+    """
+
+    def __init__(self, leads=None):
+        """
+        Initialize the LeadIdentityIndex.
+
+        Args:
+            leads: Optional leads to index
+        """
+        self._by_key = {}
+        self.rebuild(leads or [])
+
+    @staticmethod
+    def _keys(lead):
+        property_id = normalize_property_id(lead.get("property_id"))
+        email = normalize_email(lead.get("email"))
+        phone = normalize_phone(lead.get("phone"))
+        keys = []
+        if email:
+            keys.append((DUPLICATE_EMAIL, email, property_id))
+        if phone:
+            keys.append((DUPLICATE_PHONE, phone, property_id))
+        return keys
+
+    def find_duplicate(self, lead):
+        """
+        Look for an indexed lead with the same identity.
+
+        Args:
+            lead: Lead dictionary
+
+        Returns:
+            tuple: (DUPLICATE_EMAIL or DUPLICATE_PHONE, existing lead), or None
+        """
+        for key in self._keys(lead):
+            existing = self._by_key.get(key)
+            if existing is not None:
+                return key[0], existing
+        return None
+
+    def add(self, lead):
+        """
+        Index a lead.
+
+        Args:
+            lead: Lead dictionary
+        """
+        for key in self._keys(lead):
+            self._by_key.setdefault(key, lead)
+
+    def clear(self):
+        """Remove every indexed lead"""
+        self._by_key.clear()
+
+    def rebuild(self, leads):
+        """
+        Replace the index contents with the given leads.
+
+        Args:
+            leads: Leads to index
+        """
+        self.clear()
+        for lead in leads:
+            self.add(lead)
+
+
+def describe_duplicate(lead, reason, existing):
+    """
+    Describe a rejected duplicate for the user.
+
+    Args:
+        lead: Lead that was rejected
+        reason: DUPLICATE_EMAIL or DUPLICATE_PHONE
+        existing: Lead already registered
+
+    Returns:
+        str: Human readable description (Portuguese, shown in the GUI)
+    """
+    property_id = lead.get("property_id", "")
+    if reason == DUPLICATE_EMAIL:
+        return f"{lead.get('name', 'N/A')}: e-mail {lead.get('email', '')} já cadastrado para {property_id}"
+    if normalize_email(lead.get("email")) != normalize_email(existing.get("email")):
+        return (f"{lead.get('name', 'N/A')}: telefone {lead.get('phone', '')} já cadastrado para {property_id} "
+                f"com outro e-mail ({existing.get('email', '')})")
+    return f"{lead.get('name', 'N/A')}: telefone {lead.get('phone', '')} já cadastrado para {property_id}"
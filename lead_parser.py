@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Lead Parser
+Single-pass parser shared by the lead file reader and the bulk paste area.
+Text is read line by line and each "Olá ," block is yielded as soon as it
+closes; no pattern spans more than one block, so parsing time is linear
+"""
+
+import re
+
+# Every lead e-mail starts with this greeting
+LEAD_START_PATTERN = re.compile(r'Olá\s*,')
+
+PROPERTY_ID_PATTERN = re.compile(r'imóvel\s+(CX[0-9A-Z]+):', re.IGNORECASE)
+NAME_PATTERN = re.compile(r'Nome:\s+([^\r\n]+)', re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r'E-mail:\s+([^\r\n]+)', re.IGNORECASE)
+PHONE_PATTERN = re.compile(r'Telefone:\s+([^\r\n]+)', re.IGNORECASE)
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+
+REQUIRED_FIELDS = ("property_id", "name", "phone")
+
+
+def format_name(raw_name):
+    """
+    Capitalize the first letter of every word of a name.
+
+    Args:
+        raw_name: Name as typed by the lead
+
+    Returns:
+        str: Formatted name
+    """
+    return ' '.join(word.capitalize() for word in raw_name.split())
+
+
+def clean_phone(raw_phone):
+    """
+    Keep only the digits of a phone number.
+
+    Args:
+        raw_phone: Phone number as typed by the lead
+
+    Returns:
+        str: Digits of the phone number
+    """
+    return NON_DIGIT_PATTERN.sub('', raw_phone)
+
+
+def iter_lead_blocks(lines):
+    """
+    Split a stream of lines into lead blocks.
+
+    A block starts at every "Olá ," (even in the middle of a line), matching
+    the behaviour of re.split(r'(?=Olá\\s*,)') on the whole text. Text before
+    the first greeting (e.g. a forwarding header) is ignored; if there is no
+    greeting at all, the whole text is yielded as one block.
+
+    Args:
+        lines: Iterable of text lines (e.g. an open file)
+
+    Yields:
+        str: Text of each non-empty block
+    """
+    block = []
+    seen_greeting = False
+    for line in lines:
+        position = 0
+        for match in LEAD_START_PATTERN.finditer(line):
+            block.append(line[position:match.start()])
+            text = ''.join(block)
+            if seen_greeting and text.strip():
+                yield text
+            block = []
+            position = match.start()
+            seen_greeting = True
+        block.append(line[position:])
+
+    text = ''.join(block)
+    if text.strip():
+        yield text
+
+
+def parse_lead_block(block):
+    """
+    Extract the lead fields found in a block.
+
+    Args:
+        block: Text of one lead block
+
+    Returns:
+        dict: Lead fields that were found (property_id, name, email, phone)
+    """
+    lead = {}
+
+    property_id_match = PROPERTY_ID_PATTERN.search(block)
+    if property_id_match:
+        lead["property_id"] = property_id_match.group(1)
+
+    name_match = NAME_PATTERN.search(block)
+    if name_match:
+        lead["name"] = format_name(name_match.group(1).strip())
+
+    email_match = EMAIL_PATTERN.search(block)
+    if email_match:
+        lead["email"] = email_match.group(1).strip()
+
+    phone_match = PHONE_PATTERN.search(block)
+    if phone_match:
+        lead["phone"] = clean_phone(phone_match.group(1).strip())
+
+    return lead
+
+
+def iter_lead_records(lines):
+    """
+    Parse a stream of lines into lead records.
+
+    Args:
+        lines: Iterable of text lines (e.g. an open file)
+
+    Yields:
+        tuple: (block text, lead dict) for every block
+    """
+    for block in iter_lead_blocks(lines):
+        yield block, parse_lead_block(block)
+
+
+def missing_fields(lead):
+    """
+    List the required fields a lead is missing.
+
+    Args:
+        lead: Lead dictionary
+
+    Returns:
+        list: Names of the missing required fields
+    """
+    return [field for field in REQUIRED_FIELDS if not lead.get(field)]
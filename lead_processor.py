@@ -31,11 +31,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
 # Import the OutlookConnector
 from outlook_connector import OutlookConnector
+from driver_resolver import resolve_chromedriver
+from dom_extraction import extract_snapshot, snapshot_to_property_details, PROPERTY_DETAIL_FIELDS
 
 # Import the fixed methods
 try:
@@ -152,7 +153,8 @@ class LeadProcessor:
             chrome_options.add_argument("--disable-extensions")
             
             # Set up the Chrome driver
-            service = Service(ChromeDriverManager().install())
+            driver_path = resolve_chromedriver()
+            service = Service(driver_path) if driver_path else Service()
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set implicit wait time
@@ -627,60 +629,13 @@ class LeadProcessor:
         Returns:
             dict: Property details dictionary
         """
-        property_details = {
-            "title": "",
-            "price": "",
-            "address": "",
-            "area": "",
-            "bedrooms": "",
-            "bathrooms": "",
-            "description": "",
-            "features": [],
-            "images": []
-        }
-        
         try:
-            # Extract title
-            title_element = self.driver.find_element(By.CLASS_NAME, "property-title")
-            property_details["title"] = title_element.text.strip()
-            
-            # Extract price
-            price_element = self.driver.find_element(By.CLASS_NAME, "property-price")
-            property_details["price"] = price_element.text.strip()
-            
-            # Extract address
-            address_element = self.driver.find_element(By.CLASS_NAME, "property-address")
-            property_details["address"] = address_element.text.strip()
-            
-            # Extract area
-            area_element = self.driver.find_element(By.CSS_SELECTOR, ".property-features .area")
-            property_details["area"] = area_element.text.strip()
-            
-            # Extract bedrooms
-            bedrooms_element = self.driver.find_element(By.CSS_SELECTOR, ".property-features .bedrooms")
-            property_details["bedrooms"] = bedrooms_element.text.strip()
-            
-            # Extract bathrooms
-            bathrooms_element = self.driver.find_element(By.CSS_SELECTOR, ".property-features .bathrooms")
-            property_details["bathrooms"] = bathrooms_element.text.strip()
-            
-            # Extract description
-            description_element = self.driver.find_element(By.CLASS_NAME, "property-description")
-            property_details["description"] = description_element.text.strip()
-            
-            # Extract features
-            features_elements = self.driver.find_elements(By.CSS_SELECTOR, ".property-features-list li")
-            property_details["features"] = [feature.text.strip() for feature in features_elements]
-            
-            # Extract images
-            image_elements = self.driver.find_elements(By.CSS_SELECTOR, ".property-images img")
-            property_details["images"] = [image.get_attribute("src") for image in image_elements]
-            
-            return property_details
+            # All fields come back from a single script instead of one find_element per field
+            return snapshot_to_property_details(extract_snapshot(self.driver, PROPERTY_DETAIL_FIELDS))
         except Exception as e:
             logger.warning(f"Failed to extract some property details: {str(e)}")
             print(f"[AVISO] Falha ao extrair alguns detalhes do imóvel: {str(e)}")
-            return property_details
+            return snapshot_to_property_details({})
     
     def send_whatsapp_message(self, phone, message):
         """
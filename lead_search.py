@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Lead Search Index
+Precomputed, accent-folded search text and status facet per lead, so the
+leads table can be filtered without touching the lead dictionaries
+"""
+
+import unicodedata
+
+SEARCH_FIELDS = ("name", "email", "phone", "property_id", "city")
+
+FACET_ALL = "Todos"
+STATUS_FACETS = ("Completo", "Pendente", "Erro")
+FACET_OTHER = ""
+
+# Separates fields in the search text so a query never matches across two fields
+FIELD_SEPARATOR = "\x1f"
+
+
+def fold_text(text):
+    """
+    Normalize text for searching.
+
+    Args:
+        text: Text as typed or stored
+
+    Returns:
+        str: Lower-case text without accents ("Imóvel" -> "imovel")
+    """
+    text = text or ""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def status_facet(status):
+    """
+    Return the status facet a lead belongs to.
+
+    Args:
+        status: Lead status (e.g. "Pendente - cidade não encontrada")
+
+    Returns:
+        str: One of STATUS_FACETS, or FACET_OTHER
+    """
+    for facet in STATUS_FACETS:
+        if facet in (status or ""):
+            return facet
+    return FACET_OTHER
+
+
+class LeadSearchIndex:
+    """
+    Search text and status facet per row of a lead list.
+
+    Rows are kept in the same order as the leads, so row numbers can be
+    shared with a table model.
+    """
+
+    def __init__(self, leads=None):
+        """
+        Initialize the LeadSearchIndex.
+
+        Args:
+            leads: Optional leads to index
+        """
+        self._texts = []
+        self._facets = []
+        self.rebuild(leads or [])
+
+    @staticmethod
+    def _entry(lead):
+        text = FIELD_SEPARATOR.join(fold_text(str(lead.get(field) or "")) for field in SEARCH_FIELDS)
+        return text, status_facet(lead.get("status", ""))
+
+    def __len__(self):
+        return len(self._texts)
+
+    def rebuild(self, leads):
+        """
+        Replace the index contents with the given leads.
+
+        Args:
+            leads: Leads to index, in row order
+        """
+        entries = [self._entry(lead) for lead in leads]
+        self._texts = [text for text, _ in entries]
+        self._facets = [facet for _, facet in entries]
+
+    def update(self, row, lead):
+        """
+        Re-index the lead of a row.
+
+        Args:
+            row: Row of the lead
+            lead: Lead dictionary
+        """
+        self._texts[row], self._facets[row] = self._entry(lead)
+
+    def append(self, lead):
+        """
+        Index a lead added after the last row.
+
+        Args:
+            lead: Lead dictionary
+        """
+        text, facet = self._entry(lead)
+        self._texts.append(text)
+        self._facets.append(facet)
+
+    def row_matches(self, row, query, facet=FACET_ALL):
+        """
+        Check one row against a filter.
+
+        Args:
+            row: Row to check
+            query: Search text already passed through fold_text
+            facet: Status facet, or FACET_ALL
+
+        Returns:
+            bool: True if the row passes the filter
+        """
+        if facet != FACET_ALL and self._facets[row] != facet:
+            return False
+        return not query or query in self._texts[row]
+
+    def matching_rows(self, query, facet=FACET_ALL):
+        """
+        Return the rows that pass a filter.
+
+        Args:
+            query: Search text (folded here)
+            facet: Status facet, or FACET_ALL
+
+        Returns:
+            list: Matching rows in ascending order
+        """
+        query = fold_text(query)
+        return [row for row in range(len(self._texts)) if self.row_matches(row, query, facet)]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Leads Table Model
+Model/view table of leads: rows are only painted while visible and a single
+lead can be refreshed without rebuilding the table
+"""
+
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QSortFilterProxyModel, QModelIndex,
+                          QRect, QEvent, pyqtSignal)
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+
+from lead_search import LeadSearchIndex, fold_text, FACET_ALL
+
+# (lead key, header) per column; the last column holds the action buttons
+LEAD_COLUMNS = [
+    ("name", "Nome"),
+    ("email", "Email"),
+    ("phone", "Telefone"),
+    ("property_id", "ID Imóvel"),
+    ("city", "Cidade"),
+    ("status", "Status"),
+    (None, "Ações"),
+]
+STATUS_COLUMN = 5
+ACTIONS_COLUMN = 6
+
+LEAD_ROLE = Qt.UserRole
+LEAD_ROW_ROLE = Qt.UserRole + 1
+
+
+class LeadsTableModel(QAbstractTableModel):
+    """Table model over a list of lead dictionaries"""
+
+    def __init__(self, leads=None, headers=None, status_color=None, parent=None):
+        """
+        Initialize the LeadsTableModel.
+
+        Args:
+            leads: List of lead dictionaries (kept by reference)
+            headers: Optional column headers overriding LEAD_COLUMNS
+            status_color: Optional callable status -> color name for the status column
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._leads = leads if leads is not None else []
+        self._headers = headers or [header for _, header in LEAD_COLUMNS]
+        self._status_color = status_color
+        self.search_index = LeadSearchIndex(self._leads)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._leads)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(LEAD_COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        lead = self._leads[index.row()]
+        key = LEAD_COLUMNS[index.column()][0]
+
+        if role == LEAD_ROLE:
+            return lead
+        if role == LEAD_ROW_ROLE:
+            return index.row()
+        if key is None:
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return lead.get(key) or "-"
+        if role == Qt.ForegroundRole and index.column() == STATUS_COLUMN and self._status_color:
+            color = self._status_color(lead.get("status", ""))
+            return QColor(color) if color else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def lead(self, row):
+        """Return the lead shown in a row"""
+        return self._leads[row]
+
+    def leads(self):
+        """Return the list of leads shown by the model"""
+        return self._leads
+
+    def set_leads(self, leads):
+        """Replace every lead shown by the model"""
+        self.beginResetModel()
+        self._leads = leads
+        self.search_index.rebuild(leads)
+        self.endResetModel()
+
+    def update_lead(self, row, lead=None):
+        """
+        Refresh a single row, optionally replacing its lead.
+
+        Args:
+            row: Row to refresh
+            lead: New lead dictionary for the row (default: keep the current one)
+        """
+        if lead is not None:
+            self._leads[row] = lead
+        self.search_index.update(row, self._leads[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(LEAD_COLUMNS) - 1))
+
+    def append_lead(self, lead):
+        """Add a lead at the end of the table"""
+        row = len(self._leads)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._leads.append(lead)
+        self.search_index.append(lead)
+        self.endInsertRows()
+
+
+class LeadsFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a LeadsTableModel by search text and status facet.
+
+    Rows are checked against the source model's search index, so filtering
+    never reads or folds the lead dictionaries themselves.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+        self._facet = FACET_ALL
+
+    def set_filter(self, text, facet=FACET_ALL):
+        """
+        Apply a new filter.
+
+        Args:
+            text: Search text as typed
+            facet: Status facet, or FACET_ALL
+        """
+        query = fold_text(text.strip())
+        if (query, facet) == (self._query, self._facet):
+            return
+        self._query, self._facet = query, facet
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._query and self._facet == FACET_ALL:
+            return True
+        return self.sourceModel().search_index.row_matches(source_row, self._query, self._facet)
+
+
+class LeadActionsDelegate(QStyledItemDelegate):
+    """
+    Paints the action buttons of a row instead of creating widgets for them.
+
+    buttons_for(lead) returns a list of (action, label, color) tuples; clicks
+    are reported through action_triggered(row, action), with the row of the
+    lead in the source model even when the view shows a filter proxy.
+    """
+
+    action_triggered = pyqtSignal(int, str)
+
+    BUTTON_HEIGHT = 24
+    BUTTON_PADDING = 8
+    BUTTON_SPACING = 6
+
+    def __init__(self, buttons_for, parent=None):
+        """
+        Initialize the LeadActionsDelegate.
+
+        Args:
+            buttons_for: Callable lead -> list of (action, label, color)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.buttons_for = buttons_for
+
+    def _button_rects(self, option, lead):
+        """Yield (action, label, color, rect) for every button of a row"""
+        metrics = option.fontMetrics
+        x = option.rect.left() + self.BUTTON_SPACING
+        top = option.rect.top() + (option.rect.height() - self.BUTTON_HEIGHT) // 2
+        for action, label, color in self.buttons_for(lead):
+            width = metrics.horizontalAdvance(label) + 2 * self.BUTTON_PADDING
+            yield action, label, color, QRect(x, top, width, self.BUTTON_HEIGHT)
+            x += width + self.BUTTON_SPACING
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        lead = index.data(LEAD_ROLE)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        for _, label, color, rect in self._button_rects(option, lead):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            lead = index.data(LEAD_ROLE)
+            for action, _, _, rect in self._button_rects(option, lead):
+                if rect.contains(event.pos()):
+                    self.action_triggered.emit(index.data(LEAD_ROW_ROLE), action)
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Log Sink
+Queues log messages, classifies them through a precomputed tag/emoji table
+and hands them to the GUI in batches, while the full history goes to a
+rotating file under logs/
+"""
+
+import re
+import html
+import time
+import logging
+from collections import deque, namedtuple
+from logging.handlers import RotatingFileHandler
+
+from PyQt5.QtCore import QObject, QTimer
+
+LOG_FILE_NAME = "caixa_lead_gui.log"
+
+FLUSH_INTERVAL_MS = 100
+DEFAULT_COLOR = "#f8f8f2"
+SEPARATOR_COLOR = "#6272a4"
+TIMESTAMP_COLOR = "#6272a4"
+
+# Tag -> color; a message takes the color of the first known tag it contains
+TAG_COLORS = {}
+for _tags, _color in (
+    (("SUCESSO", "COMPLETO", "FINALIZADO"), "#50fa7b"),  # Verde para sucesso
+    (("EXTRAINDO", "LENDO", "ANALISANDO"), "#8be9fd"),  # Ciano para extração
+    (("CONECTANDO", "WEBDRIVER", "PESQUISANDO"), "#bd93f9"),  # Roxo para conexões
+    (("VERIFICANDO", "TENTATIVA"), "#f1fa8c"),  # Amarelo para verificações
+    (("ERRO", "FALHA"), "#ff5555"),  # Vermelho para erros
+    (("TIMEOUT", "PENDENTE", "MANUAL"), "#ffb86c"),  # Laranja para pendências
+    (("INDISPONÍVEL", "TEMPLATE"), "#f1fa8c"),  # Amarelo para casos especiais
+    (("URL", "REVISÃO"), "#8be9fd"),  # Ciano para URLs e revisões
+    (("DIAGNÓSTICO", "DICA"), "#6272a4"),  # Azul acinzentado para diagnósticos
+):
+    for _tag in _tags:
+        TAG_COLORS[_tag] = _color
+
+# Emoji -> color, used when the message has no known tag
+EMOJI_COLORS = {}
+for _emojis, _color in (
+    (("✅", "🎉", "🎯"), "#50fa7b"),  # Verde para sucesso
+    (("⚠️", "⏱️", "📍", "📝"), "#f1fa8c"),  # Amarelo para avisos
+    (("❌", "🚫"), "#ff5555"),  # Vermelho para erros
+    (("🔍", "🌐", "📄", "👤", "🏙️", "🔗"), "#8be9fd"),  # Ciano para informações
+    (("🚀", "⏸️", "⏹️", "🔄"), "#bd93f9"),  # Roxo para ações do sistema
+    (("👥", "📁", "📞", "🏠"), "#50c7e3"),  # Azul claro para dados
+):
+    for _emoji in _emojis:
+        EMOJI_COLORS[_emoji] = _color
+
+TAG_PATTERN = re.compile(r"\[([^\[\]\s]+)\]")
+# Longest emojis first so "⚠️" wins over a bare "⚠"
+EMOJI_PATTERN = re.compile("|".join(re.escape(emoji) for emoji in sorted(EMOJI_COLORS, key=len, reverse=True)))
+
+LogEntry = namedtuple("LogEntry", ["timestamp", "message", "color", "html"])
+
+
+def is_separator(message):
+    """Check whether a message is a "=====" separator line"""
+    return "=" in message and len(message.strip()) > 30
+
+
+def classify_message(message):
+    """
+    Return the display color of a log message.
+
+    Args:
+        message: Log message
+
+    Returns:
+        str: Color for the message
+    """
+    if is_separator(message):
+        return SEPARATOR_COLOR
+
+    for tag in TAG_PATTERN.findall(message):
+        if tag == "CIDADE":
+            if "✅" in message:
+                return TAG_COLORS["SUCESSO"]
+            continue
+        color = TAG_COLORS.get(tag)
+        if color:
+            return color
+
+    match = EMOJI_PATTERN.search(message)
+    if match:
+        return EMOJI_COLORS[match.group(0)]
+    return DEFAULT_COLOR
+
+
+def format_log_html(message, timestamp, color):
+    """
+    Format a log message for the log view.
+
+    Args:
+        message: Log message
+        timestamp: Time of the message ("HH:MM:SS")
+        color: Color from classify_message
+
+    Returns:
+        str: HTML for the message ("" for a blank line)
+    """
+    if not message.strip():
+        return ""
+    text = html.escape(message)
+    if is_separator(message):
+        return f'<span style="color: {color}; font-family: monospace;">{text}</span>'
+    return (f'<span style="color: {TIMESTAMP_COLOR}; font-size: 11px;">[{timestamp}]</span> '
+            f'<span style="color: {color};">{text}</span>')
+
+
+class LogSink(QObject):
+    """
+    Batches log messages for the GUI.
+
+    append() only queues the message; a timer classifies and formats the
+    queued messages and passes them to writer(entries) in one call, so the
+    UI is updated a few times per second however fast messages arrive.
+    """
+
+    def __init__(self, writer, log_file=None, max_bytes=5 * 1024 * 1024, backup_count=10,
+                 flush_interval_ms=FLUSH_INTERVAL_MS, parent=None):
+        """
+        Initialize the LogSink.
+
+        Args:
+            writer: Callable receiving a list of LogEntry on each flush
+            log_file: Optional path of the rotating history file
+            max_bytes: Size at which the history file is rotated
+            backup_count: Number of rotated history files to keep
+            flush_interval_ms: Delay between a message and its flush
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.writer = writer
+        self._pending = deque()
+
+        self._file_handler = None
+        if log_file:
+            self._file_handler = RotatingFileHandler(
+                str(log_file), maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+            self._file_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @classmethod
+    def from_settings(cls, settings, writer, parent=None):
+        """
+        Create a sink writing its history under the logs directory.
+
+        Args:
+            settings: AppSettings instance
+            writer: Callable receiving a list of LogEntry on each flush
+            parent: Parent QObject
+
+        Returns:
+            LogSink: Configured sink
+        """
+        return cls(
+            writer,
+            log_file=settings.logs_dir / LOG_FILE_NAME,
+            max_bytes=settings.get("processing.log_file_max_mb", 5) * 1024 * 1024,
+            backup_count=settings.get("processing.max_log_files", 10),
+            parent=parent,
+        )
+
+    def append(self, message):
+        """
+        Queue a message.
+
+        Args:
+            message: Log message
+        """
+        self._pending.append((time.time(), message))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def pending_count(self):
+        """Return the number of queued messages"""
+        return len(self._pending)
+
+    def flush(self):
+        """Format every queued message and hand the batch to the writer"""
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        entries = []
+        while self._pending:
+            created, message = self._pending.popleft()
+            timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+            color = classify_message(message)
+            entries.append(LogEntry(timestamp, message, color, format_log_html(message, timestamp, color)))
+
+            if self._file_handler and message.strip():
+                record = logging.makeLogRecord({"msg": message, "created": created, "msecs": created % 1 * 1000})
+                self._file_handler.handle(record)
+
+        self.writer(entries)
+
+    def close(self):
+        """Flush the queue and close the history file"""
+        self.flush()
+        if self._file_handler:
+            self._file_handler.close()
+            self._file_handler = None
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Lookup Coalescer
+Single-flight property lookups: leads in a batch that share a property ID
+trigger exactly one lookup and all receive its result
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger('LookupCoalescer')
+
+
+def group_leads_by_property(leads):
+    """
+    Group lead indexes by property ID, keeping file order.
+
+    Args:
+        leads: List of lead dictionaries
+
+    Returns:
+        OrderedDict: property_id -> list of lead indexes
+    """
+    groups = OrderedDict()
+    for index, lead in enumerate(leads):
+        groups.setdefault(lead.get("property_id", ""), []).append(index)
+    return groups
+
+
+def is_shareable(property_details):
+    """
+    Tell whether a lookup result can be given to other leads of the batch.
+
+    Args:
+        property_details: Result of a lookup, or None if it raised
+
+    Returns:
+        bool: True for resolved properties and properties no longer available
+    """
+    if property_details is None:
+        return False
+    return not property_details.get("manual_review_needed") or bool(property_details.get("property_not_available"))
+
+
+class LookupCoalescer:
+    """
+    Memoizes lookups for the duration of one batch.
+
+    The first caller for a property ID runs the lookup; concurrent callers for
+    the same ID wait for it and later callers get the stored result. Results
+    that need manual review are given to the callers already waiting but not
+    stored, so later callers look the property up again. If the lookup
+    raised, one of the waiting callers takes over and runs it again.
+    """
+
+    def __init__(self):
+        """Initialize the LookupCoalescer"""
+        self._results = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.lookups = 0
+
+    def run(self, property_id, lookup):
+        """
+        Return the result for property_id, running lookup() only once per ID.
+
+        Args:
+            property_id: Property ID being looked up
+            lookup: Callable with no arguments returning the property details
+
+        Returns:
+            tuple: (property details, True if the result was shared from another lead)
+        """
+        with self._lock:
+            self.requests += 1
+
+        while True:
+            with self._lock:
+                if property_id in self._results:
+                    return self._results[property_id], True
+
+                flight = self._in_flight.get(property_id)
+                if flight is None:
+                    # No lookup running: this caller owns the next one
+                    flight = {"event": threading.Event(), "result": None}
+                    self._in_flight[property_id] = flight
+                    self.lookups += 1
+                    break
+            flight["event"].wait()
+            if flight["result"] is not None:
+                return flight["result"], True
+            # The owner raised; the first waiter to wake up takes over
+
+        try:
+            flight["result"] = lookup()
+            return flight["result"], False
+        finally:
+            with self._lock:
+                if is_shareable(flight["result"]):
+                    self._results[property_id] = flight["result"]
+                del self._in_flight[property_id]
+            flight["event"].set()
+
+    def stats(self):
+        """
+        Return the deduplication counters.
+
+        Returns:
+            dict: requests, lookups, shared and dedupe_ratio (0-100)
+        """
+        with self._lock:
+            shared = self.requests - self.lookups
+            ratio = (shared * 100.0 / self.requests) if self.requests else 0.0
+            return {
+                "requests": self.requests,
+                "lookups": self.lookups,
+                "shared": shared,
+                "dedupe_ratio": ratio,
+            }
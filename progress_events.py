@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Progress Events
+Typed events published by the processing thread and drained by the GUI at a
+fixed refresh rate, instead of one cross-thread signal per log line
+"""
+
+import threading
+from contextlib import contextmanager
+from collections import deque, namedtuple
+
+# Free-form log line
+LogMessage = namedtuple("LogMessage", ["text"])
+
+# A lead starts being processed (current is 1-based)
+LeadStarted = namedtuple("LeadStarted", ["current", "total", "name", "phone", "property_id"])
+
+# Property details were obtained; source is one of the SOURCE_* constants and
+# webdriver_commands counts the browser round trips the lookup needed
+LookupFinished = namedtuple("LookupFinished", ["property_id", "source", "elapsed", "webdriver_commands"],
+                            defaults=(0,))
+
+# A lead changed (new status, city, URL...); lead is a copy owned by the GUI
+LeadUpdated = namedtuple("LeadUpdated", ["lead"])
+
+# Overall progress
+ProgressChanged = namedtuple("ProgressChanged", ["current", "total"])
+
+SOURCE_CACHE = "cache"
+SOURCE_CATALOG = "catalog"
+SOURCE_SITE = "site"
+SOURCE_SHARED = "shared"
+
+# Events where only the most recent one matters; older ones are dropped on drain
+LATEST_ONLY = (ProgressChanged, LeadUpdated)
+
+
+class ProgressChannel:
+    """
+    Thread-safe queue of progress events.
+
+    The worker calls publish() as often as it likes; the GUI calls drain()
+    from a timer and handles each returned event once.
+    """
+
+    def __init__(self):
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._context = threading.local()
+
+    def publish(self, event):
+        """
+        Queue an event.
+
+        Args:
+            event: One of the event tuples of this module
+        """
+        with self._lock:
+            self._events.append(event)
+
+    def log(self, text):
+        """Queue a LogMessage, prefixed with the calling thread's lead_context() label"""
+        label = getattr(self._context, "label", None)
+        self.publish(LogMessage(f"[{label}] {text}" if label else text))
+
+    @contextmanager
+    def lead_context(self, label):
+        """
+        Prefix the log lines of the calling thread with a label.
+
+        Concurrent workers log through the same channel; the label (such
+        as the property ID) tells their lines apart.
+
+        Args:
+            label: Text shown in brackets before each line
+        """
+        previous = getattr(self._context, "label", None)
+        self._context.label = label
+        try:
+            yield
+        finally:
+            self._context.label = previous
+
+    def drain(self):
+        """
+        Take every queued event.
+
+        Only the last event of each LATEST_ONLY type is kept, at its own
+        position, so a burst of progress updates costs one GUI update.
+
+        Returns:
+            list: Events in publication order
+        """
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+
+        seen = set()
+        drained = []
+        for event in reversed(events):
+            event_type = type(event)
+            if event_type in LATEST_ONLY:
+                if event_type in seen:
+                    continue
+                seen.add(event_type)
+            drained.append(event)
+        drained.reverse()
+        return drained
+
+    def __len__(self):
+        with self._lock:
+            return len(self._events)
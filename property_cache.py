@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Property Cache
+Persists property lookups on disk so recurring property IDs skip the website
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger('PropertyCache')
+
+CACHE_FILE_NAME = "property_cache.sqlite3"
+
+
+class PropertyCache:
+    """
+    SQLite cache of property details keyed by property_id.
+
+    Positive results (URL and city found) and negative results (property no
+    longer available) have separate TTLs. The cache is bounded to max_entries
+    rows; the least recently used rows are evicted first.
+    """
+
+    def __init__(self, db_path, positive_ttl=7 * 24 * 3600, negative_ttl=24 * 3600, max_entries=5000):
+        """
+        Initialize the PropertyCache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            positive_ttl: Seconds a found property stays valid
+            negative_ttl: Seconds an unavailable property stays valid
+            max_entries: Maximum number of cached properties
+        """
+        self.db_path = str(db_path)
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Create a cache in the application cache directory using the cache.* settings.
+
+        Args:
+            settings: AppSettings instance
+
+        Returns:
+            PropertyCache: Configured cache
+        """
+        return cls(
+            settings.cache_dir / CACHE_FILE_NAME,
+            positive_ttl=settings.get("cache.positive_ttl_hours", 168) * 3600,
+            negative_ttl=settings.get("cache.negative_ttl_hours", 24) * 3600,
+            max_entries=settings.get("cache.max_entries", 5000),
+        )
+
+    def _connect(self):
+        """Open the database on first use (must be called with the lock held)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS properties (
+                    property_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    city TEXT NOT NULL,
+                    property_not_available INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON properties (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, property_id):
+        """
+        Return the cached details of a property if they are still fresh.
+
+        Args:
+            property_id: Property ID to look up
+
+        Returns:
+            dict: Property details, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT url, city, property_not_available, fetched_at FROM properties WHERE property_id = ?",
+                (property_id,),
+            ).fetchone()
+
+            if row is not None:
+                url, city, not_available, fetched_at = row
+                ttl = self.negative_ttl if not_available else self.positive_ttl
+                if now - fetched_at > ttl:
+                    conn.execute("DELETE FROM properties WHERE property_id = ?", (property_id,))
+                    conn.commit()
+                    row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE properties SET last_access = ? WHERE property_id = ?", (now, property_id))
+            conn.commit()
+            self.hits += 1
+
+        if not_available:
+            return {
+                "url": url,
+                "city": "",
+                "manual_review_needed": True,
+                "error_details": "property_no_longer_available",
+                "property_not_available": True,
+                "from_cache": True,
+            }
+        return {
+            "url": url,
+            "city": city,
+            "manual_review_needed": False,
+            "error_details": "",
+            "from_cache": True,
+        }
+
+    def put(self, property_id, details):
+        """
+        Store the details of a property.
+
+        Only definitive results are stored: a URL with a city, or a property
+        that is no longer available. Anything needing manual review is skipped
+        so it is looked up again next time.
+
+        Args:
+            property_id: Property ID
+            details: Property details dictionary
+
+        Returns:
+            bool: True if the details were stored
+        """
+        if not property_id or not details or not details.get("url"):
+            return False
+
+        not_available = bool(details.get("property_not_available"))
+        if not not_available and not details.get("city"):
+            return False
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO properties VALUES (?, ?, ?, ?, ?, ?)",
+                (property_id, details["url"], details.get("city", ""), int(not_available), now, now),
+            )
+            # Evict the least recently used rows beyond the size bound
+            conn.execute(
+                """DELETE FROM properties WHERE property_id IN (
+                    SELECT property_id FROM properties ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
+            conn.commit()
+        return True
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: hits, misses, hit_rate (0-100) and number of entries
+        """
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM properties").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits * 100 // lookups) if lookups else 0,
+            "entries": entries,
+        }
+
+    def clear(self):
+        """Remove every cached property"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM properties")
+            conn.commit()
+        logger.info("Property cache cleared")
+
+    def close(self):
+        """Close the database; it is reopened automatically on next use"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Property Catalog
+Local index of the listings published on viahouseleiloes.com.br, built from
+the site's sitemap and refreshed incrementally with conditional requests, so
+most property lookups never reach the site
+"""
+
+import re
+import time
+import sqlite3
+import logging
+import threading
+import xml.etree.ElementTree as ElementTree
+
+logger = logging.getLogger('PropertyCatalog')
+
+CATALOG_FILE_NAME = "property_catalog.sqlite3"
+SITEMAP_URL = "https://viahouseleiloes.com.br/sitemap.xml"
+
+# Sitemap entries that are property pages
+PROPERTY_PATH_PATTERN = re.compile(r"/im[oó]ve(?:l|is)/", re.IGNORECASE)
+# CAIXA property code as written in the lead e-mails (e.g. CX1444400123456SP)
+PROPERTY_ID_PATTERN = re.compile(r"\b(CX[0-9A-Z]{6,})\b", re.IGNORECASE)
+UF_PATTERN = re.compile(r"-\s*([A-Z]{2})\b")
+
+SITEMAP_NAMESPACE = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+# lastmod stored for listings that left the sitemap, so they are fetched again if they return
+REMOVED_LASTMOD = "removed"
+
+
+def parse_sitemap(xml_text):
+    """
+    Parse a sitemap or sitemap index.
+
+    Args:
+        xml_text: Sitemap XML
+
+    Returns:
+        tuple: (child sitemap URLs, list of (url, lastmod) page entries)
+    """
+    root = ElementTree.fromstring(xml_text)
+    sitemaps, pages = [], []
+    for element in root:
+        loc = element.findtext(f"{SITEMAP_NAMESPACE}loc") or element.findtext("loc")
+        if not loc:
+            continue
+        lastmod = element.findtext(f"{SITEMAP_NAMESPACE}lastmod") or element.findtext("lastmod") or ""
+        if element.tag.endswith("sitemap"):
+            sitemaps.append(loc.strip())
+        else:
+            pages.append((loc.strip(), lastmod.strip()))
+    return sitemaps, pages
+
+
+def parse_listing(html, url):
+    """
+    Parse a property page into a catalog listing.
+
+    Args:
+        html: Raw HTML of the page
+        url: URL of the page
+
+    Returns:
+        dict: property_id, url, city, uf and available, or None if the page has no property code
+    """
+    # Imported here so that opening the GUI does not load requests and bs4
+    from http_lookup import LOCATION_SELECTOR, parse_property_page
+
+    id_match = PROPERTY_ID_PATTERN.search(url) or PROPERTY_ID_PATTERN.search(html)
+    if id_match is None:
+        return None
+
+    details = parse_property_page(html, url)
+    if details is None:
+        return None
+
+    uf = ""
+    if details.get("city"):
+        from bs4 import BeautifulSoup
+        location = BeautifulSoup(html, "lxml").select_one(LOCATION_SELECTOR)
+        uf_match = UF_PATTERN.search(location.get_text(" ")) if location is not None else None
+        uf = uf_match.group(1) if uf_match else ""
+
+    return {
+        "property_id": id_match.group(1).upper(),
+        "url": url,
+        "city": details.get("city", ""),
+        "uf": uf,
+        "available": not details.get("property_not_available"),
+    }
+
+
+class PropertyCatalog:
+    """
+    SQLite catalog of listings: property_id -> url, city, UF, availability, last_seen.
+
+    sync() walks the sitemap with If-None-Match / If-Modified-Since, fetches
+    only pages that are new or whose lastmod changed (at most max_pages per
+    call, so a first sync is spread over several runs) and marks listings
+    that left the sitemap as unavailable. get() answers from the index and
+    reports a miss for unknown or stale listings.
+    """
+
+    def __init__(self, db_path, sitemap_url=SITEMAP_URL, max_age=24 * 3600, max_pages=300, timeout=10,
+                 session=None):
+        """
+        Initialize the PropertyCatalog.
+
+        Args:
+            db_path: Path to the SQLite database file
+            sitemap_url: Sitemap (or sitemap index) of the property site
+            max_age: Seconds after which a listing not seen again is stale
+            max_pages: Maximum property pages fetched per sync
+            timeout: Timeout in seconds for each HTTP request
+            session: Optional requests.Session (created on first sync otherwise)
+        """
+        self.db_path = str(db_path)
+        self.sitemap_url = sitemap_url
+        self.max_age = max_age
+        self.max_pages = max(1, int(max_pages))
+        self.timeout = timeout
+        self.session = session
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Create a catalog in the application cache directory using the catalog.* settings.
+
+        Args:
+            settings: AppSettings instance
+
+        Returns:
+            PropertyCatalog: Configured catalog
+        """
+        return cls(
+            settings.cache_dir / CATALOG_FILE_NAME,
+            sitemap_url=settings.get("catalog.sitemap_url", SITEMAP_URL),
+            max_age=settings.get("catalog.max_age_hours", 24) * 3600,
+            max_pages=settings.get("catalog.max_pages_per_sync", 300),
+        )
+
+    def _connect(self):
+        """Open the database on first use (must be called with the lock held)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS listings (
+                    property_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    city TEXT NOT NULL,
+                    uf TEXT NOT NULL,
+                    available INTEGER NOT NULL,
+                    lastmod TEXT NOT NULL,
+                    last_seen REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_listings_url ON listings (url)")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS documents (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL,
+                    last_modified TEXT NOT NULL,
+                    checked_at REAL NOT NULL
+                )"""
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, property_id):
+        """
+        Return the details of a listing if it was seen recently.
+
+        Args:
+            property_id: Property ID to look up
+
+        Returns:
+            dict: Property details, or None on a miss or stale listing
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT url, city, available, last_seen FROM listings WHERE property_id = ?",
+                ((property_id or "").upper(),),
+            ).fetchone()
+            if row is None or time.time() - row[3] > self.max_age or (row[2] and not row[1]):
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        url, city, available, _ = row
+        if not available:
+            return {
+                "url": url,
+                "city": "",
+                "manual_review_needed": True,
+                "error_details": "property_no_longer_available",
+                "property_not_available": True,
+                "lookup_method": "catalog",
+            }
+        return {
+            "url": url,
+            "city": city,
+            "manual_review_needed": False,
+            "error_details": "",
+            "lookup_method": "catalog",
+        }
+
+    def _fetch(self, url, conditional=True):
+        """
+        Fetch a document, conditionally on the validators of the last complete fetch.
+
+        Returns:
+            tuple: (body or None if not modified, ETag, Last-Modified)
+        """
+        if self.session is None:
+            import requests
+            from http_lookup import DEFAULT_HEADERS
+            self.session = requests.Session()
+            self.session.headers.update(DEFAULT_HEADERS)
+
+        headers = {}
+        if conditional:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT etag, last_modified FROM documents WHERE url = ?", (url,)
+                ).fetchone()
+            if row and row[0]:
+                headers["If-None-Match"] = row[0]
+            if row and row[1]:
+                headers["If-Modified-Since"] = row[1]
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return None, "", ""
+        response.raise_for_status()
+        return response.text, response.headers.get("ETag", ""), response.headers.get("Last-Modified", "")
+
+    def _remember(self, url, etag, last_modified):
+        """Store the validators of a document for the next conditional fetch"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                         (url, etag, last_modified, time.time()))
+            conn.commit()
+
+    def _read_sitemaps(self, stats):
+        """
+        Read the sitemap tree.
+
+        Only the root sitemap is fetched conditionally: a sitemap index changes
+        whenever one of its children does.
+
+        Returns:
+            tuple: ((url, lastmod) of every property page, root validators), or
+                None if the root sitemap was not modified
+        """
+        body, etag, last_modified = self._fetch(self.sitemap_url)
+        if body is None:
+            stats["sitemaps_not_modified"] += 1
+            return None
+
+        pages, pending = [], []
+        while True:
+            stats["sitemaps_fetched"] += 1
+            sitemaps, entries = parse_sitemap(body)
+            pages.extend(entry for entry in entries if PROPERTY_PATH_PATTERN.search(entry[0]))
+            pending.extend(sitemaps)
+            if not pending:
+                return pages, (etag, last_modified)
+            body = self._fetch(pending.pop(), conditional=False)[0]
+
+    def sync(self, should_stop=None):
+        """
+        Refresh the catalog from the sitemap.
+
+        Args:
+            should_stop: Optional callable; when it returns True no further pages are fetched
+
+        Returns:
+            dict: Counters of the sync (sitemaps and pages fetched or not modified,
+                listings added/updated, seen unchanged and removed)
+        """
+        stats = dict.fromkeys(("sitemaps_fetched", "sitemaps_not_modified", "pages_fetched",
+                               "pages_not_modified", "updated", "unchanged", "removed", "deferred"), 0)
+        with self._sync_lock:
+            now = time.time()
+            try:
+                sitemap = self._read_sitemaps(stats)
+            except Exception as e:
+                logger.warning(f"Failed to read the sitemap: {str(e)}")
+                return stats
+            if sitemap is None:
+                # Nothing was published since the last complete sync: the listings are still current
+                with self._lock:
+                    conn = self._connect()
+                    conn.execute("UPDATE listings SET last_seen = ?", (now,))
+                    conn.commit()
+                return stats
+            pages, root_validators = sitemap
+
+            with self._lock:
+                known = {url: (property_id, lastmod) for property_id, url, lastmod in
+                         self._connect().execute("SELECT property_id, url, lastmod FROM listings")}
+
+            seen_ids = set()
+            for url, lastmod in pages:
+                property_id, known_lastmod = known.get(url, (None, None))
+                if property_id and lastmod == known_lastmod:
+                    seen_ids.add(property_id)
+                    stats["unchanged"] += 1
+                    continue
+                if (stats["pages_fetched"] + stats["pages_not_modified"] >= self.max_pages
+                        or (should_stop and should_stop())):
+                    if property_id:
+                        seen_ids.add(property_id)
+                    stats["deferred"] += 1
+                    continue
+                property_id = self._sync_page(url, lastmod, property_id, now, stats)
+                if property_id:
+                    seen_ids.add(property_id)
+
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "UPDATE listings SET last_seen = ? WHERE property_id = ?",
+                    [(now, property_id) for property_id in seen_ids],
+                )
+                # Listings that left the sitemap are no longer for sale
+                gone = [(property_id,) for property_id, _ in known.values() if property_id not in seen_ids]
+                conn.executemany(
+                    "UPDATE listings SET available = 0, lastmod = ?, last_seen = ? WHERE property_id = ?",
+                    [(REMOVED_LASTMOD, now, property_id) for (property_id,) in gone],
+                )
+                conn.commit()
+            stats["removed"] = len(gone)
+            # Pages left for the next sync must not be hidden behind a 304 of the sitemap
+            if not stats["deferred"]:
+                self._remember(self.sitemap_url, *root_validators)
+
+        logger.info(f"Catalog sync: {stats}")
+        return stats
+
+    def _sync_page(self, url, lastmod, property_id, now, stats):
+        """Fetch one property page and store its listing; return its property ID"""
+        try:
+            html, etag, last_modified = self._fetch(url)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {url}: {str(e)}")
+            return property_id
+
+        if html is None:
+            stats["pages_not_modified"] += 1
+            with self._lock:
+                conn = self._connect()
+                conn.execute("UPDATE listings SET lastmod = ? WHERE url = ?", (lastmod, url))
+                conn.commit()
+            return property_id
+
+        stats["pages_fetched"] += 1
+        listing = parse_listing(html, url)
+        if listing is None:
+            return property_id
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (listing["property_id"], url, listing["city"], listing["uf"], int(listing["available"]),
+                 lastmod, now),
+            )
+            conn.commit()
+        self._remember(url, etag, last_modified)
+        stats["updated"] += 1
+        return listing["property_id"]
+
+    def stats(self):
+        """
+        Return the catalog counters.
+
+        Returns:
+            dict: hits, misses, entries, available and last_sync (timestamp or None)
+        """
+        with self._lock:
+            conn = self._connect()
+            entries, available, last_sync = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(available), 0), MAX(last_seen) FROM listings"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "available": available,
+            "last_sync": last_sync,
+        }
+
+    def close(self):
+        """Close the database and the HTTP session; both are reopened on next use"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Review Queue
+Bounded hand-off of resolved leads from the processing thread to the
+operator, so lookups run ahead while earlier leads are being reviewed
+"""
+
+import threading
+from collections import deque
+
+
+class ReviewQueue:
+    """
+    Leads ready for review, in the order they were resolved.
+
+    The producer blocks in put() while `capacity` leads are waiting, so the
+    lookups never run more than `capacity` leads ahead of the operator.
+    A capacity of 0 means no limit.
+    """
+
+    def __init__(self, capacity=10):
+        """
+        Initialize the ReviewQueue.
+
+        Args:
+            capacity: Maximum number of leads waiting for review (0: no limit)
+        """
+        self.capacity = max(0, int(capacity))
+        self._leads = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def put(self, lead, should_stop=None, poll_interval=0.2):
+        """
+        Add a resolved lead, waiting while the queue is full.
+
+        Args:
+            lead: Lead dictionary
+            should_stop: Optional callable; when it returns True the wait is abandoned
+            poll_interval: Seconds between should_stop checks while waiting
+
+        Returns:
+            bool: True if the lead was queued
+        """
+        with self._condition:
+            while self.capacity and len(self._leads) >= self.capacity and not self._closed:
+                if should_stop and should_stop():
+                    return False
+                self._condition.wait(poll_interval)
+            if self._closed:
+                return False
+            self._leads.append(lead)
+            return True
+
+    def take(self):
+        """
+        Remove the next lead to review without waiting.
+
+        Returns:
+            dict: Next lead, or None if no lead is ready
+        """
+        with self._condition:
+            if not self._leads:
+                return None
+            lead = self._leads.popleft()
+            self._condition.notify_all()
+            return lead
+
+    def close(self):
+        """Stop accepting leads and release a producer waiting in put()"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._leads)
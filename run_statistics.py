@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Run Statistics
+Status counters, histogram and throughput of a processing run, updated as
+each lead finishes instead of recounted from the lead list
+"""
+
+import time
+import threading
+from collections import Counter
+
+from lead_search import status_facet
+
+
+class RunStatistics:
+    """
+    Incremental statistics of a processing run.
+
+    The worker thread calls record() once per finished lead; the GUI reads
+    snapshot() at any time, so no reader ever scans the lead list.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Initialize the RunStatistics.
+
+        Args:
+            clock: Monotonic clock in seconds (replaceable in tests)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.start(0)
+
+    @classmethod
+    def from_leads(cls, leads):
+        """
+        Build statistics for leads that were already processed.
+
+        Args:
+            leads: Lead dictionaries
+
+        Returns:
+            RunStatistics: Statistics with one record per lead
+        """
+        statistics = cls()
+        statistics.start(len(leads))
+        for lead in leads:
+            statistics.record(lead.get("status", ""))
+        return statistics
+
+    def start(self, total):
+        """
+        Reset the counters for a new run.
+
+        Args:
+            total: Number of leads expected in the run
+        """
+        with self._lock:
+            self._total = total
+            self._done = 0
+            self._skipped = 0
+            self._facets = Counter()
+            self._histogram = Counter()
+            self._started_at = self._clock()
+
+    def record(self, status, skipped=False):
+        """
+        Count a finished lead.
+
+        Args:
+            status: Final status of the lead
+            skipped: True for a lead finished without being processed; it counts
+                as done but not towards the throughput
+        """
+        with self._lock:
+            self._done += 1
+            self._skipped += 1 if skipped else 0
+            self._facets[status_facet(status)] += 1
+            self._histogram[status] += 1
+
+    def change(self, old_status, new_status):
+        """
+        Move a lead that was already counted to another status.
+
+        Args:
+            old_status: Status the lead was counted with
+            new_status: New status of the lead
+        """
+        if old_status == new_status:
+            return
+        with self._lock:
+            self._facets[status_facet(old_status)] -= 1
+            self._facets[status_facet(new_status)] += 1
+            self._histogram[old_status] -= 1
+            if self._histogram[old_status] <= 0:
+                del self._histogram[old_status]
+            self._histogram[new_status] += 1
+
+    def snapshot(self):
+        """
+        Return the current statistics.
+
+        Returns:
+            dict: total, done, complete, pending, error, histogram (status -> count),
+                elapsed (s), leads_per_minute and eta_seconds (None until a lead finishes)
+        """
+        with self._lock:
+            elapsed = self._clock() - self._started_at
+            processed = self._done - self._skipped
+            rate = processed / elapsed if elapsed > 0 else 0
+            remaining = max(self._total - self._done, 0)
+            return {
+                "total": self._total,
+                "done": self._done,
+                "complete": self._facets["Completo"],
+                "pending": self._facets["Pendente"],
+                "error": self._facets["Erro"],
+                "histogram": dict(self._histogram),
+                "elapsed": elapsed,
+                "leads_per_minute": rate * 60,
+                "eta_seconds": remaining / rate if rate else None,
+            }
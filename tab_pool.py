@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Tab Pool
+Runs parallel property lookups in tabs of a single browser instead of one
+browser per worker, for machines without the memory for several Chromes
+"""
+
+import copy
+import logging
+import threading
+
+from driver_pool import DriverPool
+from browser_profiles import configure_driver
+from driver_supervisor import browser_rss_mb
+
+logger = logging.getLogger('TabPool')
+
+CONCURRENCY_BROWSERS = "browsers"
+CONCURRENCY_TABS = "tabs"
+CONCURRENCY_MODES = (CONCURRENCY_BROWSERS, CONCURRENCY_TABS)
+
+NAVIGATION_TIMEOUT = 30
+POLL_FREQUENCY = 0.2
+
+# With "normal" or "eager", ChromeDriver waits for the current tab's pending
+# navigation before and after window commands, so one loading tab would hold
+# the command lock until it finished and the tabs would load one at a time.
+# With "none" commands return at once and the lookup's explicit waits decide
+# when a page is ready
+TAB_PAGE_LOAD_STRATEGY = "none"
+
+# Marks the current document and starts the navigation without waiting for it
+NAVIGATE_SCRIPT = "window.__tabPoolStale = true; window.location.href = arguments[0];"
+
+# True once a new document replaced the marked one and has been parsed
+LOADED_SCRIPT = "return window.__tabPoolStale !== true && document.readyState !== 'loading';"
+
+
+def navigate_in_background(driver, url, timeout=NAVIGATION_TIMEOUT):
+    """
+    Load a URL in the driver's tab without blocking the browser meanwhile.
+
+    driver.get() keeps the WebDriver session busy until the page has loaded;
+    starting the navigation from a script and polling for the new document
+    lets the other tabs send commands while this one loads.
+
+    Args:
+        driver: Tab view returned by TabPool.open_tab()
+        url: URL to open
+        timeout: Budget in seconds
+
+    Raises:
+        TimeoutException: If the new document was not parsed within the budget
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import WebDriverException
+
+    driver.execute_script(NAVIGATE_SCRIPT, url)
+
+    def loaded(driver):
+        try:
+            return driver.execute_script(LOADED_SCRIPT)
+        except WebDriverException:
+            # The old document is being torn down; poll again
+            return False
+
+    WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(loaded)
+
+
+class TabLease:
+    """
+    Gives a pooled processor its tab through the processor's warm-driver hook.
+
+    ensure_driver() calls take() the first time a lookup falls back to
+    Selenium, so the shared browser is only started when it is needed.
+    """
+
+    def __init__(self, pool, headless, browser_profile):
+        """
+        Initialize the TabLease.
+
+        Args:
+            pool: TabPool that owns the browser
+            headless: Headless mode of the processor (and of the shared browser)
+            browser_profile: Browser profile of the processor
+        """
+        self.pool = pool
+        self.headless = headless
+        self.browser_profile = browser_profile
+
+    def take(self, timeout=0):
+        """
+        Open the processor's tab.
+
+        Args:
+            timeout: Unused; the browser is started on demand
+
+        Returns:
+            WebDriver: Tab view of the shared browser, or None if it could not start
+        """
+        return self.pool.open_tab(self.browser_profile)
+
+
+class TabPool(DriverPool):
+    """
+    DriverPool whose workers share one browser, each through its own tab.
+
+    Every command of a worker is sent to its tab: the pool switches the
+    browser's current window before the command, under a single lock. The
+    browser runs with the "none" page load strategy and page loads are
+    started without blocking (navigate_in_background), so no command waits
+    for another tab's page and the tabs load in parallel while the workers
+    take turns sending commands. Memory grows with the number of tabs
+    instead of the number of browsers.
+
+    Every tab reports the memory of the whole shared browser, so the memory
+    limit is enforced here, once, instead of by each tab's DriverSupervisor:
+    when the browser goes over max_rss_mb, new lookups wait for the running
+    ones, the browser is quit and the next lookups open tabs in a fresh one.
+    """
+
+    def __init__(self, size=4, headless=True, processor_factory=None, browser_factory=None,
+                 max_rss_mb=0, rss_probe=browser_rss_mb):
+        """
+        Initialize the TabPool.
+
+        Args:
+            size: Number of workers (and tabs) in the pool
+            headless: Whether to run the browser in headless mode
+            processor_factory: Optional callable returning a new processor
+            browser_factory: Optional callable returning the shared WebDriver (or None on failure);
+                it should use TAB_PAGE_LOAD_STRATEGY, or page loads will not overlap
+            max_rss_mb: Shared browser memory in MB above which it is replaced (0: never)
+            rss_probe: Callable returning a driver's browser memory in MB, or None
+        """
+        super().__init__(size, headless, processor_factory)
+        self.browser_factory = browser_factory or self._default_browser_factory
+        self.browser = None
+        self._browser_execute = None
+        self._browser_failed = False
+        self._browser_lock = threading.Lock()
+        self._command_lock = threading.Lock()
+        self._current_handle = None
+        self._initial_handle = None
+        self.max_rss_mb = max_rss_mb
+        self.rss_probe = rss_probe
+        self.recycles = 0
+        self._tasks_changed = threading.Condition()
+        self._active_tasks = 0
+        self._recycling = False
+
+    def _default_browser_factory(self):
+        """Start the shared browser with a processor's setup_driver and the "none" page load strategy"""
+        # The warm driver is not used: its page load strategy cannot be changed once started
+        host = self.processor_factory()
+        try:
+            return host.driver if host.setup_driver(self.headless, TAB_PAGE_LOAD_STRATEGY) else None
+        finally:
+            if getattr(host, "http_lookup", None):
+                host.http_lookup.close()
+
+    def _run_task(self, fn, args):
+        self._enter_task()
+        try:
+            return super()._run_task(fn, args)
+        finally:
+            with self._tasks_changed:
+                self._active_tasks -= 1
+                self._tasks_changed.notify_all()
+
+    def _enter_task(self):
+        """Count a starting lookup, first recycling the shared browser if it uses too much memory"""
+        with self._tasks_changed:
+            while self._recycling:
+                self._tasks_changed.wait()
+            if self._over_memory_limit():
+                self._recycling = True
+                try:
+                    # No command may reach the browser while it is replaced
+                    while self._active_tasks:
+                        self._tasks_changed.wait()
+                    self._recycle_browser()
+                finally:
+                    self._recycling = False
+                    self._tasks_changed.notify_all()
+            self._active_tasks += 1
+
+    def _over_memory_limit(self):
+        """Return True if the shared browser is above max_rss_mb"""
+        browser = self.browser
+        if not self.max_rss_mb or browser is None:
+            return False
+        return (self.rss_probe(browser) or 0) > self.max_rss_mb
+
+    def _recycle_browser(self):
+        """Quit the shared browser and drop every worker's tab (no lookup may be running)"""
+        with self._browser_lock:
+            logger.info(f"Recycling the tab pool browser: above {self.max_rss_mb} MB")
+            self._discard_browser()
+            with self._lock:
+                processors = list(self._processors)
+        for processor in processors:
+            # The tabs died with the browser; the next lookup asks the pool for a new one
+            processor.driver = None
+        self.recycles += 1
+
+    def _get_processor(self):
+        """Return the worker's processor, wired to ask the pool for its tab"""
+        new_worker = getattr(self._local, "processor", None) is None
+        processor = super()._get_processor()
+        if new_worker:
+            processor.warm_driver = TabLease(self, processor.headless, processor.browser_profile)
+        return processor
+
+    def open_tab(self, browser_profile=None):
+        """
+        Open a tab for the calling worker, starting the browser on first use.
+
+        Args:
+            browser_profile: Profile whose per-tab settings are applied to the tab
+
+        Returns:
+            WebDriver: View of the shared browser bound to the new tab,
+                or None if the browser could not be started
+        """
+        with self._browser_lock:
+            handle = None
+            if self.browser is not None and self._initial_handle is None:
+                try:
+                    with self._command_lock:
+                        # New Window does not change the current window
+                        handle = self._browser_execute("newWindow", {"type": "tab"})["value"]["handle"]
+                except Exception as e:
+                    # The shared browser died; the other tabs find out through their own lookups
+                    logger.warning(f"Tab pool browser stopped answering, restarting it: {str(e)}")
+                    self._discard_browser()
+
+            if handle is None:
+                if self.browser is None and not self._start_browser():
+                    return None
+                # The browser's own window becomes the first tab
+                handle, self._initial_handle = self._initial_handle, None
+
+        tab = self._tab_view(handle)
+        if browser_profile is not None:
+            # Blocked URLs are set per tab through DevTools
+            configure_driver(tab, browser_profile)
+        return tab
+
+    def _start_browser(self):
+        """Start the shared browser (must be called with the browser lock held)"""
+        if self._browser_failed or self._closed:
+            return False
+        browser = self.browser_factory()
+        if browser is None:
+            self._browser_failed = True
+            logger.warning("Failed to start the shared browser for the tab pool")
+            return False
+        self.browser = browser
+        self._browser_execute = browser.execute
+        self._current_handle = self._initial_handle = browser.current_window_handle
+        logger.info(f"Tab pool browser started for up to {self.size} tabs")
+        return True
+
+    def _discard_browser(self):
+        """Quit the shared browser (must be called with the browser lock held)"""
+        browser, self.browser = self.browser, None
+        self._initial_handle = self._current_handle = None
+        if browser is not None:
+            try:
+                browser.quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit the tab pool browser: {str(e)}")
+
+    def _tab_view(self, handle):
+        """
+        Return a copy of the browser's WebDriver whose commands all go to one tab.
+
+        Every Selenium call, WebElement methods included, goes through
+        execute(); the copy shares the session and routes execute() through
+        the pool's lock, switching windows when another tab was current.
+        """
+        tab = copy.copy(self.browser)
+        execute = self._browser_execute
+
+        def tab_execute(driver_command, params=None):
+            with self._command_lock:
+                if self._current_handle != handle:
+                    execute("switchToWindow", {"handle": handle})
+                    self._current_handle = handle
+                return execute(driver_command, params)
+
+        def tab_quit():
+            # Quitting a tab only closes the tab; the pool quits the shared browser itself
+            if not self._closed:
+                tab.close()
+
+        tab.execute = tab_execute
+        tab.get = lambda url: navigate_in_background(tab, url)
+        tab.quit = tab_quit
+        tab.window_handle = handle
+        return tab
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers and quit the shared browser.
+
+        Args:
+            wait: Whether to wait for running lookups to finish before quitting the browser
+        """
+        super().shutdown(wait)
+        with self._browser_lock:
+            self._discard_browser()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the CAIXA lead processor: the non-interactive mode and the
+direct navigation to learned detail-page URLs.
+
+The property lookup and the browser are replaced, so no browser or network
+access is needed.
+"""
+
+import builtins
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from caixa_lead_processor import CAIXALeadProcessor
+from dom_extraction import SNAPSHOT_SCRIPT
+from url_resolver import URLResolver
+from wait_strategy import RESULT_LOCATION
+
+
+LEADS_TEXT = """Olá ,
+Você possui um novo lead para o imóvel CX08787701604879SP:
+Nome: Valmir Souza
+E-mail: valmir@example.com
+Telefone: 11992963253
+
+Olá ,
+Você possui um novo lead para o imóvel CX08787710134227SP:
+Nome: Pedro Guelere
+E-mail: pedro@example.com
+
+Olá ,
+Você possui um novo lead para o imóvel CX12345678901234SP:
+Nome: Maria Silva
+E-mail: maria@example.com
+Telefone: 11987654321
+"""
+
+DETAILS = {
+    "CX08787701604879SP": {"url": "https://example.com/imovel/1", "city": "Campinas",
+                           "manual_review_needed": False, "error_details": ""},
+    "CX12345678901234SP": {"url": "https://example.com/busca", "city": "", "manual_review_needed": True,
+                           "property_not_available": True, "error_details": "property_no_longer_available"},
+}
+
+
+class TestNonInteractiveProcessing(unittest.TestCase):
+    """Test cases for CAIXALeadProcessor.process_leads() with non_interactive=True."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.leads_file = os.path.join(self.temp_dir.name, "leads.txt")
+        with open(self.leads_file, "w", encoding="utf-8") as f:
+            f.write(LEADS_TEXT)
+        self.output_file = os.path.join(self.temp_dir.name, "results.jsonl")
+
+        self.processor = CAIXALeadProcessor(leads_file=self.leads_file, use_http_lookup=False, non_interactive=True)
+        self.lookups = []
+        self.processor.search_property_details = self.fake_lookup
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def fake_lookup(self, property_id, timeout=30, use_cache=True):
+        """Return canned details, recording how many results were already written."""
+        self.lookups.append((property_id, len(self.read_results())))
+        return DETAILS[property_id]
+
+    def read_results(self):
+        """Return the leads written to the results file so far."""
+        if not os.path.exists(self.output_file):
+            return []
+        with open(self.output_file, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def process(self):
+        """Run the unattended processing, failing if anything is asked on stdin."""
+        with mock.patch.object(builtins, "input", side_effect=AssertionError("input() called")):
+            return self.processor.process_leads(headless=True, output_file=self.output_file)
+
+    def test_runs_without_prompting(self):
+        """Every complete lead is looked up and nothing is read from stdin."""
+        self.assertTrue(self.process())
+        self.assertEqual([property_id for property_id, _ in self.lookups],
+                         ["CX08787701604879SP", "CX12345678901234SP"])
+
+    def test_incomplete_block_goes_to_quarantine(self):
+        """A block without a phone is written to the quarantine file with the missing field."""
+        self.process()
+
+        self.assertEqual(self.processor.quarantined_count, 1)
+        self.assertEqual(self.processor.quarantine_file, os.path.join(self.temp_dir.name, "leads_quarantine.txt"))
+        with open(self.processor.quarantine_file, encoding="utf-8") as f:
+            quarantined = f.read()
+        self.assertIn("CX08787710134227SP", quarantined)
+        self.assertIn("Pedro Guelere", quarantined)
+        self.assertNotIn("Valmir", quarantined)
+        self.assertRegex(quarantined.splitlines()[0], r"^# .* - campos faltantes: .+")
+
+    def test_results_are_streamed_as_json_lines(self):
+        """Each lead is written as one JSON line before the next lead is looked up."""
+        self.process()
+
+        # The second lookup already saw the first result on disk
+        self.assertEqual([written for _, written in self.lookups], [0, 1])
+
+        results = self.read_results()
+        self.assertEqual([lead["name"] for lead in results], ["Valmir Souza", "Maria Silva"])
+        complete, unavailable = results
+        self.assertEqual(complete["status"], "complete")
+        self.assertEqual(complete["city"], "Campinas")
+        self.assertEqual(complete["property_url"], "https://example.com/imovel/1")
+        self.assertIn("Campinas", complete["message"])
+        self.assertIn("processed_at", complete)
+        self.assertEqual(unavailable["status"], "property_not_available")
+        self.assertTrue(unavailable["property_not_available"])
+        self.assertTrue(unavailable["message"])
+
+
+class FakePageDriver:
+    """Stand-in for a WebDriver that answers snapshot scripts from a dict of field values."""
+
+    def __init__(self, page):
+        self.page = page
+        self.visited = []
+        self.snapshot_fields = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        if script != SNAPSHOT_SCRIPT:
+            raise AssertionError(f"unexpected script: {script[:40]}")
+        fields = args[0]
+        self.snapshot_fields.append(sorted(fields))
+        snapshot = {"url": self.visited[-1], "ready_state": "complete"}
+        for name, spec in fields.items():
+            snapshot[name] = self.page.get(name, [] if spec["all"] else None)
+        return snapshot
+
+
+class TestDirectNavigation(unittest.TestCase):
+    """Test cases for CAIXALeadProcessor._open_property_page_directly()."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.resolver = URLResolver(os.path.join(self.temp_dir.name, "url_patterns.json"))
+        for property_id in ("CX1000000000001SP", "CX1000000000002SP"):
+            self.resolver.learn(property_id, f"https://example.com/imovel/{property_id.lower()}")
+        self.template = "https://example.com/imovel/{id_lower}"
+        self.processor = CAIXALeadProcessor(use_http_lookup=False, url_resolver=self.resolver)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def open_directly(self, page, property_id="CX1000000000003SP"):
+        """Open a property directly on a fake page and return the result."""
+        self.processor.driver = FakePageDriver(page)
+        return self.processor._open_property_page_directly(property_id)
+
+    def template_counts(self):
+        """Return (successes, failures) recorded for the learned template."""
+        entry = self.resolver._templates[self.template]
+        return entry["successes"], entry["failures"]
+
+    def test_verified_page_confirms_the_template(self):
+        """The detail page of the property is returned and counted as a success."""
+        before = self.template_counts()
+        result, snapshot = self.open_directly({
+            "location_html": "Rua A, 1 <br> Santos- SP",
+            "page_html": "<html><h2>Imóvel CX1000000000003SP</h2></html>",
+        })
+
+        self.assertEqual(result, RESULT_LOCATION)
+        self.assertEqual(snapshot["location_html"], "Rua A, 1 <br> Santos- SP")
+        self.assertEqual(self.processor.driver.visited, ["https://example.com/imovel/cx1000000000003sp"])
+        self.assertEqual(self.template_counts(), (before[0] + 1, before[1]))
+
+    def test_page_html_is_read_once(self):
+        """The result poll reads only the small fields; the HTML is read once, after it."""
+        self.open_directly({
+            "location_html": "Rua A, 1 <br> Santos- SP",
+            "page_html": "<html><h2>Imóvel CX1000000000003SP</h2></html>",
+        })
+
+        polls, html_read = self.processor.driver.snapshot_fields
+        self.assertNotIn("page_html", polls)
+        self.assertEqual(html_read, ["page_html"])
+
+    def test_page_of_another_property_is_a_failure(self):
+        """A location block without the property ID counts against the template."""
+        before = self.template_counts()
+        self.assertIsNone(self.open_directly({
+            "location_html": "Rua A, 1 <br> Santos- SP",
+            "page_html": "<html><h2>Imóvel CX9999999999999SP</h2></html>",
+        }))
+        self.assertEqual(self.template_counts(), (before[0], before[1] + 1))
+
+    def test_not_found_is_neutral(self):
+        """A "not found" page may be a withdrawn property, so the template is not blamed."""
+        before = self.template_counts()
+        self.assertIsNone(self.open_directly({"headings": ["Imóvel não encontrado"]}))
+        self.assertEqual(self.template_counts(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the contact ledger.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from contact_ledger import ContactLedger, mark_contacted, contact_notice, flag_status
+from lead_search import status_facet
+
+
+LEAD = {"name": "Ana", "email": "ana@example.com", "phone": "(11) 99999-0000", "property_id": "CX1SP"}
+
+
+class TestContactLedger(unittest.TestCase):
+    """Test cases for the ContactLedger class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ledger = ContactLedger(os.path.join(self.temp_dir.name, "contacts.sqlite3"))
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.ledger.close()
+        self.temp_dir.cleanup()
+
+    def test_recorded_contact_is_found(self):
+        """A re-forwarded lead must match its recorded contact."""
+        self.assertIsNone(self.ledger.last_contact(LEAD))
+        self.ledger.record(LEAD)
+        reforwarded = dict(LEAD, phone="5511999990000", property_id="cx1sp")
+        self.assertIsNotNone(self.ledger.last_contact(reforwarded, window_days=30))
+
+    def test_contact_outside_window_is_ignored(self):
+        """Contacts older than the window must not count."""
+        self.ledger.record(LEAD, contacted_at=time.time() - 40 * 86400)
+        self.assertIsNone(self.ledger.last_contact(LEAD, window_days=30))
+        self.assertIsNotNone(self.ledger.last_contact(LEAD))
+
+    def test_other_property_is_not_a_contact(self):
+        """The same phone about another property is a new lead."""
+        self.ledger.record(LEAD)
+        self.assertIsNone(self.ledger.last_contact(dict(LEAD, property_id="CX2SP"), window_days=30))
+
+    def test_flagged_lead_keeps_its_status_facet(self):
+        """In flag mode the notice is added to the lookup status without changing its facet."""
+        lead = dict(LEAD)
+        self.assertEqual(contact_notice(lead), "")
+        self.assertEqual(flag_status("✅ Completo", lead), "✅ Completo")
+
+        contacted_at = time.mktime((2024, 3, 5, 14, 30, 0, 0, 0, -1))
+        mark_contacted(lead, contacted_at)
+        self.assertTrue(lead["already_contacted"])
+        self.assertEqual(contact_notice(lead), "Já contatado em 05/03/2024")
+
+        for status, facet in (("✅ Completo", "Completo"), ("⚠️ Pendente - revisar", "Pendente"), ("❌ Erro", "Erro")):
+            flagged = flag_status(status, lead)
+            self.assertIn("Já contatado em 05/03/2024", flagged)
+            self.assertEqual(status_facet(flagged), facet)
+            # Applying the flag twice does not repeat the notice
+            self.assertEqual(flag_status(flagged, lead), flagged)
+
+
+if __name__ == "__main__":
+    unittest.main()
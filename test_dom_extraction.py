@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the single-round-trip DOM extraction.
+
+A fake driver replays page snapshots and records every command it receives.
+"""
+
+import unittest
+
+from selenium.common.exceptions import TimeoutException
+
+from dom_extraction import CommandCounter, snapshot_to_property_details
+from wait_strategy import wait_for_search_result, RESULT_LOCATION, RESULT_NOT_FOUND
+
+
+class FakeDriver:
+    """Driver whose execute_script returns the queued snapshots in order."""
+
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        snapshot = self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+        return {"value": snapshot}
+
+    def execute_script(self, script, *args):
+        # Same funnel as Selenium: every public call goes through execute()
+        return self.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+
+def page(url, headings=(), location_html=None, location_text=None):
+    """Snapshot as returned by the injected script for SEARCH_RESULT_FIELDS"""
+    return {"url": url, "ready_state": "complete", "headings": list(headings),
+            "location_html": location_html, "location_text": location_text}
+
+
+class TestDOMExtraction(unittest.TestCase):
+    """Test cases for dom_extraction and the search result wait built on it."""
+
+    def test_search_result_is_one_command_per_poll(self):
+        """The location block and the URL come back with the poll that found them."""
+        driver = FakeDriver([
+            page("https://site/busca"),
+            page("https://site/imovel/1", location_html="Rua A <br> Campinas- SP", location_text="Rua A Campinas- SP"),
+        ])
+        result, snapshot = wait_for_search_result(driver, timeout=2)
+
+        self.assertEqual(result, RESULT_LOCATION)
+        self.assertEqual(snapshot["url"], "https://site/imovel/1")
+        self.assertEqual(snapshot["location_html"], "Rua A <br> Campinas- SP")
+        self.assertEqual(driver.commands, ["executeScript", "executeScript"])
+
+    def test_not_found_wins_the_race(self):
+        """A "not found" heading is reported even if a location block is present."""
+        driver = FakeDriver([page("https://site/busca", headings=["Ofertas", "Imóvel não encontrado"],
+                                  location_html="")])
+        result, _ = wait_for_search_result(driver, timeout=1)
+        self.assertEqual(result, RESULT_NOT_FOUND)
+
+        with self.assertRaises(TimeoutException):
+            wait_for_search_result(FakeDriver([page("https://site/busca")]), timeout=0.3)
+
+    def test_property_details_from_snapshot(self):
+        """Text is stripped, and missing fields are empty instead of aborting the rest."""
+        details = snapshot_to_property_details({
+            "title": "  Casa 3 quartos ", "price": None,
+            "features": [" Piscina ", "", "Garagem"], "images": ["https://site/1.jpg"],
+        })
+        self.assertEqual(details["title"], "Casa 3 quartos")
+        self.assertEqual(details["price"], "")
+        self.assertEqual(details["description"], "")
+        self.assertEqual(details["features"], ["Piscina", "Garagem"])
+        self.assertEqual(details["images"], ["https://site/1.jpg"])
+
+    def test_command_counter(self):
+        """Commands are counted while active and the driver is restored afterwards."""
+        driver = FakeDriver([page("https://site/")])
+        with CommandCounter(driver) as counter:
+            driver.execute_script("return 1")
+            driver.execute("getCurrentUrl")
+        driver.execute_script("return 2")
+
+        self.assertEqual(counter.count, 2)
+        self.assertNotIn("execute", driver.__dict__)
+        self.assertEqual(len(driver.commands), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the WebDriver pool.
+
+These tests use fake processors, so no browser is started.
+"""
+
+import threading
+import time
+import unittest
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Minimal stand-in for a Selenium WebDriver."""
+
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeHTTPLookup:
+    """Minimal stand-in for HTTPPropertyLookup."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeProcessor:
+    """Minimal stand-in for CAIXALeadProcessor."""
+
+    def __init__(self):
+        self.driver = FakeDriver()
+        self.http_lookup = FakeHTTPLookup()
+        self.owner = threading.get_ident()
+
+    def close(self):
+        self.http_lookup.close()
+        self.driver.quit()
+
+
+class TestDriverPool(unittest.TestCase):
+    """Test cases for the DriverPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.created = []
+
+        def factory():
+            processor = FakeProcessor()
+            self.created.append(processor)
+            return processor
+
+        self.factory = factory
+
+    def test_each_worker_owns_its_processor(self):
+        """Every task must run with the processor created by its own thread."""
+        def task(processor, item):
+            time.sleep(0.01)
+            return processor.owner == threading.get_ident()
+
+        with DriverPool(3, processor_factory=self.factory) as pool:
+            results = [result for _, _, result in pool.imap_unordered(task, range(12))]
+
+        self.assertTrue(all(results))
+        self.assertLessEqual(len(self.created), 3)
+        self.assertTrue(all(p.driver.quit_called for p in self.created))
+        self.assertTrue(all(p.http_lookup.closed for p in self.created))
+
+    def test_results_arrive_in_completion_order(self):
+        """Faster items must be yielded before slower ones."""
+        def task(processor, delay):
+            time.sleep(delay)
+            return delay
+
+        with DriverPool(3, processor_factory=self.factory) as pool:
+            order = [index for index, _, _ in pool.imap_unordered(task, [0.2, 0.1, 0.0])]
+
+        self.assertEqual(order, [2, 1, 0])
+
+    def test_should_stop_cancels_pending_items(self):
+        """Pending items must not run once a stop is requested."""
+        stop = threading.Event()
+
+        def task(processor, item):
+            time.sleep(0.02)
+            return item
+
+        with DriverPool(1, processor_factory=self.factory) as pool:
+            seen = []
+            for _, item, _ in pool.imap_unordered(task, range(10), should_stop=stop.is_set):
+                seen.append(item)
+                stop.set()
+
+        self.assertLess(len(seen), 10)
+
+    def test_failing_items_do_not_stop_the_others(self):
+        """An exception in one item, or in the processor factory, becomes that item's result."""
+        def task(processor, item):
+            if item == 3:
+                raise ValueError("page changed")
+            return item * 10
+
+        with DriverPool(2, processor_factory=self.factory) as pool:
+            results = dict((index, result) for index, _, result in pool.imap_unordered(
+                task, range(6), on_error=lambda item, error: f"erro {item}: {error}"))
+
+        self.assertEqual(results, {0: 0, 1: 10, 2: 20, 3: "erro 3: page changed", 4: 40, 5: 50})
+
+        def broken_factory():
+            raise RuntimeError("chromedriver not found")
+
+        with DriverPool(2, processor_factory=broken_factory) as pool:
+            results = [result for _, _, result in pool.imap_unordered(
+                task, range(4), on_error=lambda item, error: str(error))]
+            self.assertEqual(results, ["chromedriver not found"] * 4)
+
+            with self.assertRaises(RuntimeError):
+                list(pool.imap_unordered(task, range(2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
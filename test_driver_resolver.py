@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the chromedriver resolver.
+"""
+
+import os
+import tempfile
+import unittest
+
+from driver_resolver import ChromeDriverResolver
+
+
+class FakeInstaller:
+    """webdriver_manager stand-in returning a driver file per call."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.calls = 0
+        self.offline = False
+
+    def __call__(self):
+        if self.offline:
+            raise ConnectionError("no network")
+        self.calls += 1
+        path = os.path.join(self.directory, f"chromedriver-{self.calls}")
+        open(path, "w").close()
+        return path
+
+
+class TestChromeDriverResolver(unittest.TestCase):
+    """Test cases for the ChromeDriverResolver class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.installer = FakeInstaller(self.temp_dir.name)
+        self.chrome_version = "120.0.6099.109"
+        self.resolver = ChromeDriverResolver(
+            record_file=os.path.join(self.temp_dir.name, "config", "chromedriver.json"),
+            installer=self.installer,
+            version_probe=lambda: self.chrome_version,
+        )
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_recorded_driver_is_reused(self):
+        """The installer runs once; later starts reuse the recorded driver."""
+        first = self.resolver.resolve()
+        self.chrome_version = "120.0.6099.200"
+        self.assertEqual(self.resolver.resolve(), first)
+        self.assertEqual(self.installer.calls, 1)
+        self.assertEqual(self.resolver.load_record()["chrome_version"], "120.0.6099.109")
+
+    def test_new_chrome_major_revalidates(self):
+        """A new Chrome major version resolves a new driver."""
+        first = self.resolver.resolve()
+        self.chrome_version = "121.0.6167.85"
+        second = self.resolver.resolve()
+
+        self.assertNotEqual(second, first)
+        self.assertEqual(self.installer.calls, 2)
+        self.assertEqual(self.resolver.load_record()["driver_path"], second)
+
+    def test_offline_falls_back_to_record(self):
+        """With no network, the recorded driver is used; with no record, Selenium decides."""
+        self.installer.offline = True
+        self.assertIsNone(self.resolver.resolve())
+
+        self.installer.offline = False
+        first = self.resolver.resolve()
+        self.installer.offline = True
+        self.chrome_version = "121.0.6167.85"
+        self.assertEqual(self.resolver.resolve(), first)
+
+        self.chrome_version = None
+        self.assertEqual(self.resolver.resolve(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the driver supervisor.
+
+Fake drivers stand in for Chrome and the Selenium lookup is replaced, so no
+browser is started.
+"""
+
+import unittest
+
+from caixa_lead_processor import CAIXALeadProcessor
+from driver_supervisor import DriverSupervisor, REASON_DEAD, REASON_MEMORY
+
+
+class FakeDriver:
+    """Stand-in for a Selenium WebDriver that can crash."""
+
+    def __init__(self, rss_mb=100):
+        self.alive = True
+        self.quit_called = False
+        self.rss_mb = rss_mb
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeProcessor(CAIXALeadProcessor):
+    """CAIXALeadProcessor whose browser and Selenium lookup are simulated."""
+
+    def __init__(self, supervisor, crash_on=()):
+        super().__init__(use_http_lookup=False, driver_supervisor=supervisor)
+        self.drivers = []
+        self.crash_on = set(crash_on)
+        self.attempts = []
+
+    def ensure_driver(self):
+        if self.driver is None:
+            self.driver = FakeDriver()
+            self.drivers.append(self.driver)
+        return True
+
+    def _search_property_details_selenium(self, property_id, timeout=30):
+        self.ensure_driver()
+        self.attempts.append(property_id)
+        if property_id in self.crash_on:
+            # The browser dies halfway through the first attempt
+            self.crash_on.discard(property_id)
+            self.driver.alive = False
+            return {"url": "", "city": "", "manual_review_needed": True, "error_details": "invalid session id"}
+        if property_id.startswith("SEM-CIDADE"):
+            return {"url": "https://x/1", "city": "", "manual_review_needed": True, "error_details": "city_not_found"}
+        return {"url": f"https://x/{property_id}", "city": "Campinas", "manual_review_needed": False, "error_details": ""}
+
+    def lookup(self, property_id):
+        return self._search_property_details_supervised(property_id)
+
+
+class TestDriverSupervisor(unittest.TestCase):
+    """Test cases for the DriverSupervisor class."""
+
+    def supervisor(self, **kwargs):
+        kwargs.setdefault("recycle_after", 0)
+        kwargs.setdefault("max_rss_mb", 0)
+        return DriverSupervisor(health_check=lambda driver: driver.alive,
+                                rss_probe=lambda driver: driver.rss_mb, **kwargs)
+
+    def test_crash_restarts_and_retries_the_lead(self):
+        """A session that dies during a lookup is replaced and only that lead is retried."""
+        processor = FakeProcessor(self.supervisor(), crash_on={"CX2"})
+        results = [processor.lookup(property_id) for property_id in ("CX1", "CX2", "CX3")]
+
+        self.assertTrue(all(details["city"] == "Campinas" for details in results))
+        self.assertEqual(processor.attempts, ["CX1", "CX2", "CX2", "CX3"])
+        self.assertEqual(len(processor.drivers), 2)
+        self.assertTrue(processor.drivers[0].quit_called)
+        self.assertEqual(processor.driver_supervisor.restarts, 1)
+
+    def test_ordinary_failures_are_not_retried(self):
+        """A lookup that fails with a healthy browser keeps the browser and is not repeated."""
+        processor = FakeProcessor(self.supervisor())
+        details = processor.lookup("SEM-CIDADE-1")
+
+        self.assertTrue(details["manual_review_needed"])
+        self.assertEqual(processor.attempts, ["SEM-CIDADE-1"])
+        self.assertEqual(len(processor.drivers), 1)
+
+    def test_dead_session_found_between_leads(self):
+        """A browser that died while idle is replaced before the next lookup."""
+        processor = FakeProcessor(self.supervisor())
+        processor.lookup("CX1")
+        processor.driver.alive = False
+
+        self.assertEqual(processor.driver_supervisor.before_lookup(processor), REASON_DEAD)
+        self.assertIsNone(processor.driver)
+        processor.lookup("CX2")
+        self.assertEqual(len(processor.drivers), 2)
+
+    def test_recycling_by_lookups_and_memory(self):
+        """The browser is replaced after recycle_after lookups or above max_rss_mb."""
+        processor = FakeProcessor(self.supervisor(recycle_after=3))
+        for index in range(7):
+            processor.lookup(f"CX{index}")
+        self.assertEqual(len(processor.drivers), 3)
+        self.assertEqual(processor.driver_supervisor.recycles, 2)
+
+        processor = FakeProcessor(self.supervisor(max_rss_mb=500))
+        processor.lookup("CX1")
+        processor.driver.rss_mb = 800
+        self.assertEqual(processor.driver_supervisor.before_lookup(processor), REASON_MEMORY)
+        self.assertIsNone(processor.driver)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the browserless property lookup.
+
+A fake session stands in for the site, so no network access is needed.
+"""
+
+import unittest
+
+from http_lookup import HTTPPropertyLookup, parse_city, parse_property_page
+
+
+class FakeResponse:
+    """Stand-in for a requests response."""
+
+    def __init__(self, text, url):
+        self.text = text
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stand-in for requests.Session serving a home page that needs JavaScript."""
+
+    def __init__(self):
+        self.gets = []
+
+    def get(self, url, **kwargs):
+        self.gets.append(url)
+        return FakeResponse("<div id='app'></div>", url)
+
+
+class TestHTTPLookupParsing(unittest.TestCase):
+    """Test cases for the HTTP lookup page parsing."""
+
+    def test_parse_city_from_html(self):
+        """The city after the <br> must be extracted."""
+        self.assertEqual(parse_city("Rua das Flores, s/n <br> Campinas- SP"), "Campinas")
+
+    def test_parse_city_from_text_fallback(self):
+        """The visible text must be used when the HTML has no <br>."""
+        self.assertEqual(parse_city("", "Rua X, 10\nSorocaba - SP"), "Sorocaba")
+
+    def test_property_page_with_city(self):
+        """A rendered property page must resolve without a browser."""
+        html = '<div class="info-destaque localizacao">Rua A, 1 <br> Santos- SP</div>'
+        details = parse_property_page(html, "https://example.com/imovel/1")
+        self.assertEqual(details["city"], "Santos")
+        self.assertFalse(details["manual_review_needed"])
+        self.assertEqual(details["url"], "https://example.com/imovel/1")
+
+    def test_property_not_available(self):
+        """The 'not found' page must be reported as unavailable."""
+        html = '<div class="container"><h1>Imóvel não encontrado</h1></div>'
+        details = parse_property_page(html, "https://example.com/busca")
+        self.assertTrue(details["property_not_available"])
+        self.assertEqual(details["error_details"], "property_no_longer_available")
+
+    def test_page_requiring_javascript(self):
+        """A page without the location block must fall back to Selenium."""
+        self.assertIsNone(parse_property_page("<div id='app'></div>", "https://example.com/"))
+
+
+class TestHTTPLookupSearchForm(unittest.TestCase):
+    """Test cases for the search form discovery."""
+
+    def test_missing_form_is_cached(self):
+        """A home page without the form is fetched once per retry period, not once per lead."""
+        now = [0]
+        lookup = HTTPPropertyLookup(base_url="https://example.com/", form_retry_seconds=600, clock=lambda: now[0])
+        lookup.session = FakeSession()
+
+        for property_id in ("CX1", "CX2", "CX3"):
+            self.assertIsNone(lookup.lookup(property_id))
+        self.assertEqual(lookup.session.gets, ["https://example.com/"])
+
+        now[0] = 601
+        self.assertIsNone(lookup.lookup("CX4"))
+        self.assertEqual(len(lookup.session.gets), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
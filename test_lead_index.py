@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the lead identity index.
+"""
+
+import unittest
+
+from lead_index import LeadIdentityIndex, DUPLICATE_EMAIL, DUPLICATE_PHONE
+
+
+LEAD = {"name": "Ana", "email": "Ana@Example.com ", "phone": "(11) 99999-0000", "property_id": "CX1SP"}
+
+
+class TestLeadIdentityIndex(unittest.TestCase):
+    """Test cases for the LeadIdentityIndex class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = LeadIdentityIndex([LEAD])
+
+    def test_same_email_is_duplicate(self):
+        """E-mails must match regardless of case and spaces."""
+        lead = {"email": "ana@example.com", "phone": "11988887777", "property_id": "cx1sp"}
+        reason, existing = self.index.find_duplicate(lead)
+        self.assertEqual(reason, DUPLICATE_EMAIL)
+        self.assertIs(existing, LEAD)
+
+    def test_same_phone_different_email_is_duplicate(self):
+        """Phones must match with or without the country code."""
+        lead = {"email": "outro@example.com", "phone": "5511999990000", "property_id": "CX1SP"}
+        reason, _ = self.index.find_duplicate(lead)
+        self.assertEqual(reason, DUPLICATE_PHONE)
+
+    def test_same_contact_other_property_is_not_duplicate(self):
+        """The same contact may be interested in another property."""
+        lead = dict(LEAD, property_id="CX2SP")
+        self.assertIsNone(self.index.find_duplicate(lead))
+
+    def test_clear_and_rebuild(self):
+        """Clearing must forget every lead; rebuilding must restore them."""
+        self.index.clear()
+        self.assertIsNone(self.index.find_duplicate(LEAD))
+        self.index.rebuild([LEAD])
+        self.assertIsNotNone(self.index.find_duplicate(LEAD))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the streaming lead parser.
+"""
+
+import io
+import re
+import unittest
+
+from lead_parser import iter_lead_blocks, iter_lead_records, missing_fields, parse_lead_block
+
+
+SAMPLE = """Encaminhado do Outlook
+Olá ,
+Você possui um novo lead para o imóvel CX08787701604879SP:
+Nome: VALMIR da silva
+E-mail: valmir@example.com
+Telefone: (11) 99296-3253
+
+Olá ,
+Você possui um novo lead para o imóvel CX12345:
+Nome: maria
+E-mail: maria@example.com
+Olá, Você possui um novo lead para o imóvel CX999: Nome: Ana
+Telefone: 11 98888-7777
+"""
+
+
+class TestLeadParser(unittest.TestCase):
+    """Test cases for the lead parser."""
+
+    def test_blocks_match_regex_split(self):
+        """Streaming blocks must match splitting the whole text at every greeting."""
+        expected = [block for block in re.split(r'(?=Olá\s*,)', SAMPLE)[1:] if block.strip()]
+        self.assertEqual(list(iter_lead_blocks(io.StringIO(SAMPLE))), expected)
+
+    def test_fields_are_extracted_and_cleaned(self):
+        """Names are capitalized and phones reduced to digits."""
+        records = [lead for _, lead in iter_lead_records(io.StringIO(SAMPLE))]
+        lead = records[0]
+
+        self.assertEqual(lead["property_id"], "CX08787701604879SP")
+        self.assertEqual(lead["name"], "Valmir Da Silva")
+        self.assertEqual(lead["email"], "valmir@example.com")
+        self.assertEqual(lead["phone"], "11992963253")
+
+    def test_missing_fields(self):
+        """Blocks without a phone must be reported as incomplete."""
+        records = [lead for _, lead in iter_lead_records(io.StringIO(SAMPLE))]
+        self.assertEqual(missing_fields(records[1]), ["phone"])
+        self.assertEqual(missing_fields(records[2]), [])
+
+    def test_preamble_is_ignored(self):
+        """Text before the first greeting is not a lead block."""
+        blocks = list(iter_lead_blocks(io.StringIO(SAMPLE)))
+        self.assertEqual(len(blocks), 3)
+        self.assertNotIn("Encaminhado do Outlook", "".join(blocks))
+
+    def test_text_without_greeting_is_one_block(self):
+        """Without any "Olá ," the whole text is a single block, as with re.split."""
+        text = "Você possui um novo lead para o imóvel CX1SP:\nNome: A\nTelefone: 11999990000\n"
+        self.assertEqual(list(iter_lead_blocks(io.StringIO(text))), [text])
+
+    def test_property_id_needs_a_colon(self):
+        """Only "imóvel CX...:" is a property ID; a mention without the colon is not."""
+        lead = parse_lead_block("Olá ,\nVeja o imóvel CX111 ou o imóvel CX222SP:\nNome: A\n")
+        self.assertEqual(lead["property_id"], "CX222SP")
+        self.assertNotIn("property_id", parse_lead_block("Olá ,\nimóvel CX111\nNome: A\n"))
+
+    def test_value_may_be_on_the_next_line(self):
+        """A label followed by a line break takes its value from the next line."""
+        lead = parse_lead_block("Olá ,\nimóvel CX1SP:\nNome:\nAna Lima\nE-mail:\nana@example.com\nTelefone:\n11 98888-7777\n")
+        self.assertEqual(lead["name"], "Ana Lima")
+        self.assertEqual(lead["email"], "ana@example.com")
+        self.assertEqual(lead["phone"], "11988887777")
+
+    def test_label_needs_whitespace_before_the_value(self):
+        """A value glued to its label is not read."""
+        self.assertEqual(parse_lead_block("Olá ,\nimóvel CX1SP:\nNome:Ana\nTelefone:11988887777\n"),
+                         {"property_id": "CX1SP"})
+
+    def test_second_property_mention_does_not_split(self):
+        """Only the greeting starts a new lead; the first property ID of the block wins."""
+        text = (
+            "Olá ,\nVocê possui um novo lead para o imóvel CX1SP:\nNome: A\nTelefone: 11999990000\n"
+            "Mensagem: também gostei do imóvel CX2SP: e do imóvel CX3SP:\n"
+        )
+        records = [lead for _, lead in iter_lead_records(io.StringIO(text))]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["property_id"], "CX1SP")
+
+    def test_blocks_are_yielded_lazily(self):
+        """A block must be available before the rest of the input is read."""
+        lines_read = []
+
+        def lines():
+            for line in io.StringIO(SAMPLE):
+                lines_read.append(line)
+                yield line
+
+        next(iter_lead_blocks(lines()))
+        self.assertLess(len(lines_read), len(SAMPLE.splitlines()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the lead search index.
+"""
+
+import unittest
+
+from lead_search import LeadSearchIndex, fold_text, status_facet
+
+
+LEADS = [
+    {"name": "João Conceição", "email": "joao@example.com", "phone": "11999990000",
+     "property_id": "CX1SP", "city": "São Paulo", "status": "Completo"},
+    {"name": "Maria", "email": "maria@example.com", "phone": "21988887777",
+     "property_id": "CX2RJ", "city": "", "status": "Pendente - cidade não encontrada"},
+    {"name": "Pedro", "email": "pedro@example.com", "phone": "31977776666",
+     "property_id": "CX3MG", "city": "Belo Horizonte", "status": "Erro"},
+]
+
+
+class TestLeadSearchIndex(unittest.TestCase):
+    """Test cases for the LeadSearchIndex class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = LeadSearchIndex([dict(lead) for lead in LEADS])
+
+    def test_fold_text(self):
+        """Accents and case must be ignored."""
+        self.assertEqual(fold_text("Conceição SÃO"), "conceicao sao")
+        self.assertEqual(status_facet("Pendente - cidade não encontrada"), "Pendente")
+
+    def test_search_without_accents(self):
+        """A query typed without accents must find accented values."""
+        self.assertEqual(self.index.matching_rows("sao paulo"), [0])
+        self.assertEqual(self.index.matching_rows("CONCEIÇÃO"), [0])
+
+    def test_search_property_id_and_city(self):
+        """Property codes and cities are searchable."""
+        self.assertEqual(self.index.matching_rows("cx2"), [1])
+        self.assertEqual(self.index.matching_rows("horizonte"), [2])
+
+    def test_status_facet(self):
+        """Facets restrict the rows before the text search."""
+        self.assertEqual(self.index.matching_rows("", "Pendente"), [1])
+        self.assertEqual(self.index.matching_rows("example", "Erro"), [2])
+        self.assertEqual(self.index.matching_rows("example"), [0, 1, 2])
+
+    def test_update(self):
+        """Updating a row re-indexes its text and facet."""
+        lead = dict(LEADS[1], city="Niterói", status="Completo")
+        self.index.update(1, lead)
+        self.assertEqual(self.index.matching_rows("niteroi", "Completo"), [1])
+        self.assertEqual(self.index.matching_rows("", "Pendente"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the batched log sink.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from PyQt5.QtCore import QCoreApplication
+
+from log_sink import LogSink, classify_message, format_log_html, DEFAULT_COLOR, SEPARATOR_COLOR
+
+
+class TestClassifyMessage(unittest.TestCase):
+    """Test cases for the tag/emoji style table."""
+
+    def test_tags(self):
+        """Known tags decide the color."""
+        self.assertEqual(classify_message("❌ [ERRO] Falha ao abrir"), "#ff5555")
+        self.assertEqual(classify_message("[CIDADE] ✅ São Paulo"), "#50fa7b")
+        self.assertEqual(classify_message("[PENDENTE] Cidade não encontrada"), "#ffb86c")
+
+    def test_emoji_fallback_and_default(self):
+        """Emojis are used when no tag is known; plain text keeps the default."""
+        self.assertEqual(classify_message("🔍 Procurando imóvel"), "#8be9fd")
+        self.assertEqual(classify_message("[OUTRO] texto"), DEFAULT_COLOR)
+        self.assertEqual(classify_message("=" * 40), SEPARATOR_COLOR)
+
+    def test_html_is_escaped(self):
+        """Lead data must not be interpreted as HTML."""
+        self.assertIn("&lt;b&gt;", format_log_html("<b>Ana</b>", "10:00:00", DEFAULT_COLOR))
+        self.assertEqual(format_log_html("  ", "10:00:00", DEFAULT_COLOR), "")
+
+
+class TestLogSink(unittest.TestCase):
+    """Test cases for the LogSink class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application needed by the flush timer."""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / "test.log"
+        self.batches = []
+        self.sink = LogSink(self.batches.append, log_file=self.log_file)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.sink.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_messages_are_flushed_in_one_batch(self):
+        """Queued messages reach the writer together and in order."""
+        for index in range(50):
+            self.sink.append(f"[INFO] mensagem {index}")
+        self.assertEqual(self.batches, [])
+        self.assertEqual(self.sink.pending_count(), 50)
+
+        self.sink.flush()
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([entry.message for entry in self.batches[0]][-1], "[INFO] mensagem 49")
+        self.assertEqual(self.sink.pending_count(), 0)
+
+    def test_history_file(self):
+        """Every non-blank message is written to the history file."""
+        self.sink.append("✅ [SUCESSO] Lead processado")
+        self.sink.append("")
+        self.sink.close()
+
+        lines = self.log_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("✅ [SUCESSO] Lead processado"))
+
+
+if __name__ == "__main__":
+    unittest.main()
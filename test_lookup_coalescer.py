@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the lookup coalescer.
+"""
+
+import threading
+import time
+import unittest
+
+from lookup_coalescer import LookupCoalescer, group_leads_by_property
+
+
+RESOLVED = {"url": "https://example.com/imovel/1", "city": "Campinas", "manual_review_needed": False}
+NEEDS_REVIEW = {"url": "", "city": "", "manual_review_needed": True, "error_details": "timeout"}
+
+
+class TestLookupCoalescer(unittest.TestCase):
+    """Test cases for the LookupCoalescer class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.coalescer = LookupCoalescer()
+        self.calls = []
+        self.calls_lock = threading.Lock()
+
+    def run_concurrently(self, property_id, lookup, callers=5):
+        """Call run() from several threads at once and return their results."""
+        barrier = threading.Barrier(callers)
+        results = [None] * callers
+        errors = []
+
+        def caller(index):
+            barrier.wait()
+            try:
+                results[index] = self.coalescer.run(property_id, lookup)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller, args=(index,)) for index in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return results, errors
+
+    def slow_lookup(self, *outcomes):
+        """Return a lookup that takes a while and gives the outcomes in order (exceptions are raised)."""
+        outcomes = list(outcomes)
+
+        def lookup():
+            with self.calls_lock:
+                self.calls.append(threading.current_thread().name)
+                outcome = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+            time.sleep(0.05)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return lookup
+
+    def test_concurrent_waiters_share_one_lookup(self):
+        """Callers arriving while the lookup runs wait for it instead of repeating it."""
+        results, errors = self.run_concurrently("CX1", self.slow_lookup(RESOLVED))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(details is RESOLVED for details, _ in results))
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+
+        # Later callers get the stored result
+        self.assertEqual(self.coalescer.run("CX1", self.slow_lookup(RESOLVED)), (RESOLVED, True))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_owner_failure_hands_over_to_one_waiter(self):
+        """If the owner raises, a single waiter runs the lookup again and the rest share its result."""
+        results, errors = self.run_concurrently("CX1", self.slow_lookup(RuntimeError("browser crashed"), RESOLVED))
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(len(self.calls), 2)
+        finished = [result for result in results if result is not None]
+        self.assertEqual(len(finished), 4)
+        self.assertTrue(all(details is RESOLVED for details, _ in finished))
+        self.assertEqual(sorted(shared for _, shared in finished), [False, True, True, True])
+
+    def test_failing_result_is_shared_with_waiting_callers(self):
+        """Callers already waiting get a result that needs review; only later callers try again."""
+        results, errors = self.run_concurrently("CX1", self.slow_lookup(NEEDS_REVIEW, RESOLVED), callers=3)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(details is NEEDS_REVIEW for details, _ in results))
+
+        self.assertEqual(self.coalescer.run("CX1", self.slow_lookup(RESOLVED)), (RESOLVED, False))
+        self.assertEqual(len(self.calls), 2)
+
+    def test_manual_review_results_are_not_memoized(self):
+        """A lookup that needs manual review is retried for the next lead with the same property."""
+        lookup = self.slow_lookup(NEEDS_REVIEW, RESOLVED)
+        self.assertEqual(self.coalescer.run("CX1", lookup), (NEEDS_REVIEW, False))
+        self.assertEqual(self.coalescer.run("CX1", lookup), (RESOLVED, False))
+        self.assertEqual(self.coalescer.run("CX1", lookup), (RESOLVED, True))
+        self.assertEqual(len(self.calls), 2)
+
+        unavailable = {"url": "https://example.com/busca", "manual_review_needed": True, "property_not_available": True}
+        self.coalescer.run("CX2", self.slow_lookup(unavailable))
+        self.assertEqual(self.coalescer.run("CX2", self.slow_lookup(RESOLVED)), (unavailable, True))
+
+    def test_dedupe_ratio(self):
+        """The counters report how many leads reused another lead's lookup."""
+        leads = [{"property_id": property_id} for property_id in ("CX1", "CX2", "CX1", "CX3", "CX1", "CX2", "CX4", "CX4")]
+        self.assertEqual(list(group_leads_by_property(leads).items()),
+                         [("CX1", [0, 2, 4]), ("CX2", [1, 5]), ("CX3", [3]), ("CX4", [6, 7])])
+
+        for lead in leads:
+            self.coalescer.run(lead["property_id"], lambda: RESOLVED)
+
+        stats = self.coalescer.stats()
+        self.assertEqual(stats["requests"], 8)
+        self.assertEqual(stats["lookups"], 4)
+        self.assertEqual(stats["shared"], 4)
+        self.assertAlmostEqual(stats["dedupe_ratio"], 50.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
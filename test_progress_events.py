@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the progress event channel.
+"""
+
+import threading
+import unittest
+
+from progress_events import (ProgressChannel, LogMessage, LeadStarted, LeadUpdated,
+                             ProgressChanged)
+
+
+class TestProgressChannel(unittest.TestCase):
+    """Test cases for the ProgressChannel class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.channel = ProgressChannel()
+
+    def test_drain_keeps_order(self):
+        """Events come out in publication order and only once."""
+        self.channel.log("a")
+        self.channel.publish(LeadStarted(1, 2, "Ana", "11999990000", "CX1"))
+        self.channel.log("b")
+
+        events = self.channel.drain()
+        self.assertEqual(events[0], LogMessage("a"))
+        self.assertIsInstance(events[1], LeadStarted)
+        self.assertEqual(events[2], LogMessage("b"))
+        self.assertEqual(self.channel.drain(), [])
+
+    def test_progress_is_coalesced(self):
+        """Only the latest progress and lead update survive a drain."""
+        for current in range(1, 101):
+            self.channel.publish(ProgressChanged(current, 100))
+            self.channel.publish(LeadUpdated({"name": f"Lead {current}"}))
+        self.channel.log("fim")
+
+        events = self.channel.drain()
+        self.assertEqual(events, [ProgressChanged(100, 100), LeadUpdated({"name": "Lead 100"}), LogMessage("fim")])
+
+    def test_lead_context_labels_each_thread(self):
+        """Lines logged inside lead_context() carry that thread's label only."""
+        def worker(property_id):
+            with self.channel.lead_context(property_id):
+                self.channel.log("buscando")
+
+        threads = [threading.Thread(target=worker, args=(f"CX{index}",)) for index in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.channel.log("fim")
+
+        texts = [event.text for event in self.channel.drain()]
+        self.assertEqual(sorted(texts[:3]), ["[CX0] buscando", "[CX1] buscando", "[CX2] buscando"])
+        self.assertEqual(texts[3], "fim")
+
+    def test_publish_from_threads(self):
+        """Events published from several threads are all kept."""
+        def publish():
+            for _ in range(1000):
+                self.channel.log("x")
+
+        threads = [threading.Thread(target=publish) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.channel.drain()), 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the on-disk property cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from property_cache import PropertyCache
+
+
+FOUND = {"url": "https://example.com/imovel/1", "city": "Campinas"}
+UNAVAILABLE = {"url": "https://example.com/busca", "city": "", "property_not_available": True}
+
+
+class TestPropertyCache(unittest.TestCase):
+    """Test cases for the PropertyCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "cache.sqlite3")
+        self.cache = PropertyCache(self.db_path, positive_ttl=60, negative_ttl=60, max_entries=2)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_hit_and_miss_counters(self):
+        """A stored property must be a hit; an unknown one a miss."""
+        self.assertIsNone(self.cache.get("CX1"))
+        self.cache.put("CX1", FOUND)
+        details = self.cache.get("CX1")
+
+        self.assertEqual(details["city"], "Campinas")
+        self.assertTrue(details["from_cache"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_negative_result_is_cached(self):
+        """Unavailable properties must be cached as unavailable."""
+        self.cache.put("CX2", UNAVAILABLE)
+        details = self.cache.get("CX2")
+        self.assertTrue(details["property_not_available"])
+        self.assertEqual(details["error_details"], "property_no_longer_available")
+
+    def test_incomplete_result_is_not_cached(self):
+        """Results needing manual review must be looked up again."""
+        self.assertFalse(self.cache.put("CX3", {"url": "https://example.com/imovel/3", "city": ""}))
+        self.assertIsNone(self.cache.get("CX3"))
+
+    def test_expired_entry_is_a_miss(self):
+        """Entries older than their TTL must not be returned."""
+        self.cache.negative_ttl = 0
+        self.cache.put("CX2", UNAVAILABLE)
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get("CX2"))
+
+    def test_least_recently_used_is_evicted(self):
+        """The cache must stay within max_entries, evicting the oldest access."""
+        self.cache.put("CX1", FOUND)
+        time.sleep(0.01)
+        self.cache.put("CX2", FOUND)
+        time.sleep(0.01)
+        self.cache.get("CX1")
+        time.sleep(0.01)
+        self.cache.put("CX3", FOUND)
+
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.assertIsNotNone(self.cache.get("CX1"))
+        self.assertIsNone(self.cache.get("CX2"))
+
+    def test_entries_survive_reopen(self):
+        """The cache must persist across instances."""
+        self.cache.put("CX1", FOUND)
+        self.cache.close()
+        reopened = PropertyCache(self.db_path)
+        self.assertEqual(reopened.get("CX1")["url"], FOUND["url"])
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the property catalog.
+
+A local HTTP server stands in for the property site.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from property_catalog import PropertyCatalog
+
+
+PAGE_TEMPLATE = (
+    '<html><body><h2>Imóvel {property_id}</h2>'
+    '<div class="info-destaque localizacao">Rua A, 1 <br> {city}- SP</div></body></html>'
+)
+
+
+class FixtureSite:
+    """Documents served by the fixture, with ETags and a request log."""
+
+    def __init__(self):
+        self.documents = {}
+        self.requests = []
+
+    def set_page(self, path, property_id, city):
+        self.documents[path] = PAGE_TEMPLATE.format(property_id=property_id, city=city)
+
+    def set_sitemap(self, entries):
+        urls = "".join(
+            f"<url><loc>{self.base_url}{path}</loc><lastmod>{lastmod}</lastmod></url>"
+            for path, lastmod in entries
+        )
+        self.documents["/sitemap.xml"] = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+        )
+
+    def handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = site.documents.get(self.path)
+                if body is None:
+                    site.requests.append((self.path, 404))
+                    self.send_error(404)
+                    return
+                etag = f'"{hash(body) & 0xffffffff:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    site.requests.append((self.path, 304))
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                site.requests.append((self.path, 200))
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class TestPropertyCatalog(unittest.TestCase):
+    """Test cases for the PropertyCatalog class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.site = FixtureSite()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.site.handler())
+        self.site.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.site.set_page("/imovel/1", "CX0000001SP", "Campinas")
+        self.site.set_page("/imovel/2", "CX0000002SP", "Santos")
+        self.site.set_sitemap([("/imovel/1", "2024-01-01"), ("/imovel/2", "2024-01-01"), ("/sobre", "2024-01-01")])
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.catalog = PropertyCatalog(os.path.join(self.temp_dir.name, "catalog.sqlite3"),
+                                       sitemap_url=f"{self.site.base_url}/sitemap.xml")
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.catalog.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def fetched_pages(self):
+        """Property pages downloaded in full since the last call"""
+        pages = [path for path, status in self.site.requests if status == 200 and path.startswith("/imovel/")]
+        self.site.requests.clear()
+        return sorted(pages)
+
+    def test_sync_indexes_listings(self):
+        """Property pages from the sitemap are answered from the catalog."""
+        stats = self.catalog.sync()
+        self.assertEqual(stats["updated"], 2)
+        self.assertEqual(self.fetched_pages(), ["/imovel/1", "/imovel/2"])
+
+        details = self.catalog.get("cx0000001sp")
+        self.assertEqual(details["city"], "Campinas")
+        self.assertEqual(details["url"], f"{self.site.base_url}/imovel/1")
+        self.assertIsNone(self.catalog.get("CX9999999SP"))
+
+        self.catalog.max_age = -1
+        self.assertIsNone(self.catalog.get("CX0000001SP"))
+
+    def test_incremental_refresh(self):
+        """An unchanged sitemap costs one 304; changes only fetch the pages involved."""
+        self.catalog.sync()
+        self.fetched_pages()
+
+        stats = self.catalog.sync()
+        self.assertEqual(stats["sitemaps_not_modified"], 1)
+        self.assertEqual(self.site.requests, [("/sitemap.xml", 304)])
+        self.site.requests.clear()
+
+        self.site.set_page("/imovel/2", "CX0000002SP", "Guarujá")
+        self.site.set_page("/imovel/3", "CX0000003SP", "Sorocaba")
+        self.site.set_sitemap([("/imovel/2", "2024-02-01"), ("/imovel/3", "2024-02-01")])
+        stats = self.catalog.sync()
+
+        self.assertEqual(self.fetched_pages(), ["/imovel/2", "/imovel/3"])
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(self.catalog.get("CX0000002SP")["city"], "Guarujá")
+        self.assertTrue(self.catalog.get("CX0000001SP")["property_not_available"])
+
+    def test_page_budget_spreads_first_sync(self):
+        """Pages beyond max_pages are fetched by the next sync despite the sitemap ETag."""
+        self.catalog.max_pages = 1
+        self.assertEqual(self.catalog.sync()["deferred"], 1)
+        self.assertEqual(len(self.fetched_pages()), 1)
+
+        self.catalog.sync()
+        self.assertEqual(len(self.fetched_pages()), 1)
+        self.assertIsNotNone(self.catalog.get("CX0000001SP"))
+        self.assertIsNotNone(self.catalog.get("CX0000002SP"))
+        self.assertEqual(self.catalog.sync()["sitemaps_not_modified"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the review queue.
+"""
+
+import threading
+import time
+import unittest
+
+from review_queue import ReviewQueue
+
+
+class TestReviewQueue(unittest.TestCase):
+    """Test cases for the ReviewQueue class."""
+
+    def test_order_and_empty_take(self):
+        """Leads are reviewed in the order they were resolved."""
+        queue = ReviewQueue(capacity=0)
+        for index in range(3):
+            self.assertTrue(queue.put({"name": f"Lead {index}"}))
+        self.assertEqual([queue.take()["name"] for _ in range(3)], ["Lead 0", "Lead 1", "Lead 2"])
+        self.assertIsNone(queue.take())
+
+    def test_producer_waits_for_review(self):
+        """A full queue holds the producer until the operator takes a lead."""
+        queue = ReviewQueue(capacity=2)
+        produced = []
+
+        def produce():
+            for index in range(4):
+                queue.put(index, poll_interval=0.01)
+                produced.append(index)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        time.sleep(0.1)
+        self.assertEqual(produced, [0, 1])
+
+        self.assertEqual(queue.take(), 0)
+        self.assertEqual(queue.take(), 1)
+        producer.join(timeout=2)
+        self.assertEqual(produced, [0, 1, 2, 3])
+
+    def test_stop_and_close_release_producer(self):
+        """A waiting producer gives up when stopped or when the queue is closed."""
+        queue = ReviewQueue(capacity=1)
+        queue.put("a")
+        self.assertFalse(queue.put("b", should_stop=lambda: True))
+
+        queue.close()
+        self.assertFalse(queue.put("c"))
+        self.assertEqual(queue.take(), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
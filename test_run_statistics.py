@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the run statistics aggregator.
+"""
+
+import unittest
+
+from run_statistics import RunStatistics
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRunStatistics(unittest.TestCase):
+    """Test cases for the RunStatistics class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.statistics = RunStatistics(clock=self.clock)
+        self.statistics.start(10)
+
+    def test_counts_and_histogram(self):
+        """Statuses are counted by facet and by exact text."""
+        self.statistics.record("✅ Completo")
+        self.statistics.record("✅ Completo")
+        self.statistics.record("⚠️ Pendente - Revisar cidade manualmente")
+        self.statistics.record("⚠️ Erro - Timeout na busca")
+
+        stats = self.statistics.snapshot()
+        self.assertEqual((stats["done"], stats["complete"], stats["pending"], stats["error"]), (4, 2, 1, 1))
+        self.assertEqual(stats["histogram"]["✅ Completo"], 2)
+
+    def test_throughput_and_eta(self):
+        """Throughput and ETA come from the leads finished so far."""
+        self.assertIsNone(self.statistics.snapshot()["eta_seconds"])
+
+        for _ in range(4):
+            self.statistics.record("✅ Completo")
+        self.clock.now += 60
+
+        stats = self.statistics.snapshot()
+        self.assertAlmostEqual(stats["leads_per_minute"], 4)
+        self.assertAlmostEqual(stats["eta_seconds"], 90)
+
+    def test_skipped_leads_count_as_done_only(self):
+        """Skipped leads are done from the start but do not inflate the throughput."""
+        for _ in range(2):
+            self.statistics.record("⏭️ Já contatado em 01/03/2024", skipped=True)
+        self.clock.now += 1
+        self.assertIsNone(self.statistics.snapshot()["eta_seconds"])
+
+        for _ in range(4):
+            self.statistics.record("✅ Completo")
+        self.clock.now += 59
+
+        stats = self.statistics.snapshot()
+        self.assertEqual((stats["total"], stats["done"]), (10, 6))
+        self.assertAlmostEqual(stats["leads_per_minute"], 4)
+        self.assertAlmostEqual(stats["eta_seconds"], 60)
+
+    def test_change_and_from_leads(self):
+        """Edited leads move between counters; existing lists can be loaded."""
+        statistics = RunStatistics.from_leads([
+            {"status": "⚠️ Pendente - Revisar cidade manualmente"},
+            {"status": "✅ Completo"},
+        ])
+        statistics.change("⚠️ Pendente - Revisar cidade manualmente", "✅ Completo")
+
+        stats = statistics.snapshot()
+        self.assertEqual((stats["done"], stats["complete"], stats["pending"]), (2, 2, 0))
+        self.assertEqual(stats["histogram"], {"✅ Completo": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the tab pool.
+
+A fake browser records the WebDriver commands it receives, so no Chrome is started.
+"""
+
+import unittest
+
+from driver_supervisor import DriverSupervisor
+from tab_pool import TabPool, NAVIGATE_SCRIPT, LOADED_SCRIPT, TAB_PAGE_LOAD_STRATEGY
+
+
+class FakeBrowser:
+    """Stand-in for a Chrome WebDriver with several window handles."""
+
+    def __init__(self):
+        self.current_window_handle = "main"
+        self.commands = []
+        self.tabs = 0
+        self.quit_calls = 0
+        self.loading_polls = 0
+        self.rss_mb = 100
+
+    def execute(self, driver_command, params=None):
+        self.commands.append((driver_command, params))
+        if driver_command == "newWindow":
+            self.tabs += 1
+            return {"value": {"handle": f"tab{self.tabs}", "type": "tab"}}
+        if driver_command == "executeScript" and params["script"] == LOADED_SCRIPT:
+            self.loading_polls -= 1
+            return {"value": self.loading_polls < 0}
+        return {"value": None}
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+    def close(self):
+        self.execute("closeWindow")
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class FakeProcessor:
+    """Minimal stand-in for CAIXALeadProcessor that asks for its browser like ensure_driver()."""
+
+    def __init__(self):
+        self.driver = None
+        self.headless = True
+        self.browser_profile = "standard"
+        self.warm_driver = None
+
+    def ensure_driver(self):
+        if self.driver is None:
+            self.driver = self.warm_driver.take()
+        return self.driver is not None
+
+    def setup_driver(self, headless=False, page_load_strategy=None):
+        self.driver = FakeBrowser()
+        self.driver.page_load_strategy = page_load_strategy
+        return True
+
+    def close(self):
+        if self.driver:
+            self.driver.quit()
+
+
+class TestTabPool(unittest.TestCase):
+    """Test cases for the TabPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.browsers = []
+
+        def browser_factory():
+            browser = FakeBrowser()
+            self.browsers.append(browser)
+            return browser
+
+        self.pool = TabPool(3, processor_factory=FakeProcessor, browser_factory=browser_factory)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.pool.shutdown()
+
+    def test_commands_go_to_their_tab(self):
+        """Each tab switches the shared browser to its window only when another tab was current."""
+        first = self.pool.open_tab()
+        second = self.pool.open_tab()
+        browser = self.browsers[0]
+        browser.commands.clear()
+
+        first.execute_script("return 1")
+        first.execute_script("return 2")
+        second.execute_script("return 3")
+        first.execute("getCurrentUrl")
+
+        self.assertEqual([command for command, _ in browser.commands], [
+            "executeScript", "executeScript",
+            "switchToWindow", "executeScript",
+            "switchToWindow", "getCurrentUrl",
+        ])
+        self.assertEqual(browser.commands[2][1], {"handle": "tab1"})
+        self.assertEqual(browser.commands[4][1], {"handle": "main"})
+
+    def test_one_browser_started_on_demand(self):
+        """The browser starts with the first Selenium lookup and holds one tab per worker."""
+        def lookup(processor, item):
+            self.assertTrue(processor.ensure_driver())
+            return processor.driver.window_handle
+
+        with self.pool as pool:
+            self.assertEqual(self.browsers, [])
+            handles = {result for _, _, result in pool.imap_unordered(lookup, range(9))}
+            # A processor quitting its driver only closes its own tab
+            for processor in pool._processors:
+                processor.driver.quit()
+            closed = [command for command, _ in self.browsers[0].commands if command == "closeWindow"]
+            self.assertEqual(len(closed), len(handles))
+            self.assertEqual(self.browsers[0].quit_calls, 0)
+
+        self.assertEqual(len(self.browsers), 1)
+        self.assertLessEqual(len(handles), 3)
+        self.assertEqual(self.browsers[0].quit_calls, 1)
+
+    def test_navigation_is_polled(self):
+        """get() starts the navigation from a script and polls for the new document."""
+        tab = self.pool.open_tab()
+        browser = self.browsers[0]
+        browser.loading_polls = 2
+        browser.commands.clear()
+        tab.get("https://example.com/imovel")
+
+        scripts = [params["script"] for command, params in browser.commands if command == "executeScript"]
+        self.assertEqual(scripts, [NAVIGATE_SCRIPT, LOADED_SCRIPT, LOADED_SCRIPT, LOADED_SCRIPT])
+        self.assertEqual(browser.commands[0][1]["args"], ["https://example.com/imovel"])
+
+    def test_shared_browser_does_not_wait_for_page_loads(self):
+        """The default shared browser is started with the "none" page load strategy."""
+        pool = TabPool(2, processor_factory=FakeProcessor)
+        try:
+            tab = pool.open_tab()
+            self.assertEqual(pool.browser.page_load_strategy, TAB_PAGE_LOAD_STRATEGY)
+            self.assertEqual(TAB_PAGE_LOAD_STRATEGY, "none")
+            self.assertEqual(tab.window_handle, "main")
+        finally:
+            pool.shutdown()
+
+    def test_memory_limit_recycles_the_shared_browser_once(self):
+        """Above max_rss_mb the shared browser is replaced once, not every tab before every lookup."""
+        browsers = []
+
+        def browser_factory():
+            browsers.append(FakeBrowser())
+            return browsers[-1]
+
+        def processor_factory():
+            processor = FakeProcessor()
+            # Each tab measures the whole shared browser, so its supervisor has no memory limit
+            processor.driver_supervisor = DriverSupervisor(recycle_after=0, max_rss_mb=0,
+                                                           health_check=lambda driver: True,
+                                                           rss_probe=lambda driver: pool.browser.rss_mb)
+            return processor
+
+        def lookup(processor, item):
+            self.assertIsNone(processor.driver_supervisor.before_lookup(processor))
+            self.assertTrue(processor.ensure_driver())
+            return processor.driver
+
+        pool = TabPool(2, processor_factory=processor_factory, browser_factory=browser_factory,
+                       max_rss_mb=500, rss_probe=lambda browser: browser.rss_mb)
+        with pool:
+            list(pool.imap_unordered(lookup, range(4)))
+            browsers[0].rss_mb = 800
+            tabs = [tab for _, _, tab in pool.imap_unordered(lookup, range(6))]
+
+        self.assertEqual(len(browsers), 2)
+        self.assertEqual(pool.recycles, 1)
+        self.assertEqual(browsers[0].quit_calls, 1)
+        # After the recycle every lookup ran in a tab of the new browser
+        self.assertTrue(all(tab.commands is browsers[1].commands for tab in tabs))
+        self.assertEqual([command for command, _ in browsers[0].commands].count("closeWindow"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
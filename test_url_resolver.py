@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the property URL resolver.
+"""
+
+import os
+import tempfile
+import unittest
+
+from url_resolver import URLResolver, url_template, page_mentions
+
+
+class TestURLResolver(unittest.TestCase):
+    """Test cases for the URLResolver class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.patterns_file = os.path.join(self.temp_dir.name, "url_patterns.json")
+        self.resolver = URLResolver(self.patterns_file)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_template_from_url(self):
+        """The ID is replaced by the placeholder of the form found in the URL."""
+        self.assertEqual(url_template("CX0012SP", "https://site/imovel/cx0012sp-casa"),
+                         "https://site/imovel/{id_lower}-casa")
+        self.assertEqual(url_template("CX0012SP", "https://site/busca?codigo=0012"),
+                         "https://site/busca?codigo={digits}")
+        self.assertIsNone(url_template("CX0012SP", "https://site/imovel/casa-em-santos"))
+
+    def test_template_needs_confirmation(self):
+        """A template is only used after two different properties produced it."""
+        self.resolver.learn("CX0001SP", "https://site/imovel/cx0001sp")
+        self.resolver.learn("CX0001SP", "https://site/imovel/cx0001sp")
+        self.assertEqual(self.resolver.candidate_url("CX0003SP"), (None, None))
+
+        self.resolver.learn("CX0002SP", "https://site/imovel/cx0002sp")
+        url, template = self.resolver.candidate_url("CX0003SP")
+        self.assertEqual(url, "https://site/imovel/cx0003sp")
+
+        # Learned templates survive a restart
+        self.assertEqual(URLResolver(self.patterns_file).candidate_url("CX0004SP")[0], "https://site/imovel/cx0004sp")
+
+    def test_failed_verifications_drop_template(self):
+        """A template whose pages keep failing verification is no longer used."""
+        self.resolver.learn("CX0001SP", "https://site/imovel/cx0001sp")
+        self.resolver.learn("CX0002SP", "https://site/imovel/cx0002sp")
+        _, template = self.resolver.candidate_url("CX0003SP")
+
+        for _ in range(2):
+            self.resolver.record(template, verified=False)
+        self.assertEqual(self.resolver.candidate_url("CX0003SP"), (None, None))
+
+    def test_page_mentions(self):
+        """Verification accepts the ID in any case or as bare digits."""
+        self.assertTrue(page_mentions("CX0012SP", "<h2>Imóvel cx0012sp</h2>"))
+        self.assertTrue(page_mentions("CX0012SP", "Código: 0012"))
+        self.assertFalse(page_mentions("CX0012SP", "Código: 0099"))
+
+
+if __name__ == "__main__":
+    unittest.main()
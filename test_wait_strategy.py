@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the explicit Selenium waits.
+
+A fake driver answers every script from a queue of canned results, so no
+browser is needed.
+"""
+
+import time
+import unittest
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from wait_strategy import (wait_for_any_element, wait_for_url_change, wait_for_search_result,
+                           FIRST_MATCH_SCRIPT, RESULT_LOCATION, RESULT_NOT_FOUND)
+
+
+class FakeDriver:
+    """Driver whose execute_script returns the queued results in order (exceptions are raised)."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def page(url, headings=(), location_html=None):
+    """Snapshot as returned by the injected script for the search result fields"""
+    return {"url": url, "ready_state": "complete", "headings": list(headings),
+            "location_html": location_html, "location_text": None}
+
+
+class TestWaitForAnyElement(unittest.TestCase):
+    """Test cases for wait_for_any_element()."""
+
+    def test_found(self):
+        """The first element returned by the page is passed back."""
+        driver = FakeDriver([None, WebDriverException("stale"), "search-box"])
+        self.assertEqual(wait_for_any_element(driver, ["#a", "#b"], timeout=2), "search-box")
+        self.assertEqual(driver.scripts[0], (FIRST_MATCH_SCRIPT, (["#a", "#b"],)))
+
+    def test_timeout(self):
+        """A page where no selector matches raises once the budget is spent."""
+        started = time.monotonic()
+        with self.assertRaises(TimeoutException):
+            wait_for_any_element(FakeDriver([None]), ["#a"], timeout=0.3)
+        self.assertLess(time.monotonic() - started, 2)
+
+
+class TestWaitForURLChange(unittest.TestCase):
+    """Test cases for wait_for_url_change()."""
+
+    def test_interactive_document_is_enough(self):
+        """The wait ends at "interactive", so eager and none page loads do not time out."""
+        driver = FakeDriver([
+            ["https://site/", "complete"],
+            WebDriverException("document unloaded"),
+            ["https://site/busca", "loading"],
+            ["https://site/busca", "interactive"],
+            ["https://site/busca", "complete"],
+        ])
+        self.assertTrue(wait_for_url_change(driver, "https://site/", timeout=2))
+        self.assertEqual(len(driver.scripts), 4)
+
+    def test_timeout(self):
+        """If the URL never changes the wait gives up and returns False."""
+        driver = FakeDriver([["https://site/", "complete"]])
+        self.assertFalse(wait_for_url_change(driver, "https://site/", timeout=0.3))
+
+
+class TestWaitForSearchResult(unittest.TestCase):
+    """Test cases for wait_for_search_result()."""
+
+    def test_found(self):
+        """The location block wins once it appears."""
+        driver = FakeDriver([page("https://site/busca"),
+                             page("https://site/imovel/1", location_html="Rua A <br> Campinas- SP")])
+        result, snapshot = wait_for_search_result(driver, timeout=2)
+        self.assertEqual(result, RESULT_LOCATION)
+        self.assertEqual(snapshot["url"], "https://site/imovel/1")
+
+    def test_not_found(self):
+        """The "not found" heading ends the wait with RESULT_NOT_FOUND."""
+        driver = FakeDriver([page("https://site/busca", headings=["Imóvel não encontrado"])])
+        result, _ = wait_for_search_result(driver, timeout=2)
+        self.assertEqual(result, RESULT_NOT_FOUND)
+
+    def test_timeout(self):
+        """A page with neither result raises once the budget is spent."""
+        with self.assertRaises(TimeoutException):
+            wait_for_search_result(FakeDriver([page("https://site/busca")]), timeout=0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
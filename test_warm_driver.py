@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the warm driver.
+"""
+
+import threading
+import unittest
+
+from warm_driver import WarmDriver
+
+
+class FakeDriver:
+    """WebDriver stand-in that can be made to stop answering."""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("browser gone")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestWarmDriver(unittest.TestCase):
+    """Test cases for the WarmDriver class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.created = []
+        self.launched = threading.Semaphore(0)
+
+        def factory():
+            driver = FakeDriver()
+            self.created.append(driver)
+            self.launched.release()
+            return driver
+
+        self.warm = WarmDriver(driver_factory=factory, health_interval=0.01)
+
+    def tearDown(self):
+        self.warm.close()
+
+    def test_take_hands_over_driver(self):
+        """The warmed driver is handed over once; start() warms the next one."""
+        self.warm.start()
+        driver = self.warm.take(timeout=2)
+        self.assertIs(driver, self.created[0])
+        self.assertFalse(driver.quit_called)
+        self.assertIsNone(self.warm.take())
+
+        self.warm.start()
+        self.assertIsNot(self.warm.take(timeout=2), driver)
+
+    def test_dead_driver_is_relaunched(self):
+        """A driver that stops answering is quit and replaced."""
+        self.warm.start()
+        self.assertTrue(self.launched.acquire(timeout=2))
+        first = self.created[0]
+        first.alive = False
+
+        self.assertTrue(self.launched.acquire(timeout=2))
+        self.assertTrue(first.quit_called)
+        self.assertIs(self.warm.take(timeout=2), self.created[1])
+
+    def test_close_quits_idle_driver(self):
+        """Closing the service quits a driver nobody took."""
+        self.warm.start()
+        driver = self.warm.take(timeout=2)
+        self.warm.start()
+        self.assertTrue(self.launched.acquire(timeout=2))
+        self.assertTrue(self.launched.acquire(timeout=2))
+        self.warm.close()
+        self.assertFalse(driver.quit_called)
+        self.assertTrue(self.created[1].quit_called)
+        self.assertFalse(self.warm.is_ready())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - URL Resolver
+Learns how property IDs map to detail-page URLs from past lookups, so the
+Selenium path can open the detail page directly instead of going through
+the home-page search
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger('URLResolver')
+
+PATTERNS_FILE_NAME = "url_patterns.json"
+
+# A template is trusted once this many different properties produced it
+MIN_CONFIRMATIONS = 2
+
+# "CX1444400123456SP" -> digits "1444400123456"
+PROPERTY_DIGITS_PATTERN = re.compile(r"^CX(\d+)[A-Z]*$", re.IGNORECASE)
+
+
+def id_variants(property_id):
+    """
+    Return the forms a property ID may take in a URL.
+
+    Args:
+        property_id: Property ID such as "CX1444400123456SP"
+
+    Returns:
+        dict: placeholder name -> text
+    """
+    variants = {"id": property_id, "id_lower": property_id.lower(), "id_upper": property_id.upper()}
+    digits_match = PROPERTY_DIGITS_PATTERN.match(property_id)
+    if digits_match:
+        variants["digits"] = digits_match.group(1)
+    return variants
+
+
+def url_template(property_id, url):
+    """
+    Turn a detail-page URL into a template by replacing the property ID.
+
+    Args:
+        property_id: Property ID that led to the URL
+        url: Final URL of the detail page
+
+    Returns:
+        str: Template such as "https://site/imovel/{id_lower}", or None if the ID is not in the URL
+    """
+    if not property_id or not url:
+        return None
+    for name, text in sorted(id_variants(property_id).items(), key=lambda item: -len(item[1])):
+        if text and text in url:
+            # Braces in the URL itself must survive str.format
+            escaped = [part.replace("{", "{{").replace("}", "}}") for part in url.split(text)]
+            return ("{" + name + "}").join(escaped)
+    return None
+
+
+def page_mentions(property_id, page_text):
+    """
+    Check that a page belongs to a property by looking for its ID in the content.
+
+    Args:
+        property_id: Property ID
+        page_text: HTML or visible text of the page
+
+    Returns:
+        bool: True if any form of the ID appears in the page
+    """
+    page_text = page_text or ""
+    variants = id_variants(property_id)
+    return variants["id_upper"] in page_text.upper() or variants.get("digits", "\0") in page_text
+
+
+class URLResolver:
+    """
+    Property ID -> detail URL templates learned from successful lookups.
+
+    Every resolved lookup is generalised into a template; a template becomes
+    usable once MIN_CONFIRMATIONS different properties produced it, and is
+    dropped again when direct navigations with it keep failing verification.
+    Templates are kept in data/url_patterns.json.
+    """
+
+    def __init__(self, patterns_file, min_confirmations=MIN_CONFIRMATIONS):
+        """
+        Initialize the URLResolver.
+
+        Args:
+            patterns_file: JSON file holding the learned templates
+            min_confirmations: Properties needed before a template is used
+        """
+        self.patterns_file = str(patterns_file)
+        self.min_confirmations = min_confirmations
+        self._lock = threading.Lock()
+        self._templates = self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Open the resolver in the application data directory.
+
+        Args:
+            settings: AppSettings instance
+
+        Returns:
+            URLResolver: Resolver stored under data/
+        """
+        return cls(settings.data_dir / PATTERNS_FILE_NAME)
+
+    def _load(self):
+        try:
+            with open(self.patterns_file, "r", encoding="utf-8") as f:
+                templates = json.load(f).get("templates", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+        return templates if isinstance(templates, dict) else {}
+
+    def _save(self):
+        """Write the templates atomically (must be called with the lock held)"""
+        temp_file = f"{self.patterns_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"templates": self._templates}, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, self.patterns_file)
+        except OSError as e:
+            logger.warning(f"Failed to save URL patterns: {str(e)}")
+
+    def candidate_url(self, property_id):
+        """
+        Return the detail URL predicted for a property.
+
+        Args:
+            property_id: Property ID
+
+        Returns:
+            tuple: (url, template), or (None, None) if no trusted template applies
+        """
+        with self._lock:
+            trusted = [
+                (entry["successes"] - entry["failures"], template)
+                for template, entry in self._templates.items()
+                if len(entry["properties"]) >= self.min_confirmations and entry["successes"] > entry["failures"]
+            ]
+        variants = id_variants(property_id)
+        for _, template in sorted(trusted, reverse=True):
+            try:
+                return template.format(**variants), template
+            except (KeyError, IndexError, ValueError):
+                continue
+        return None, None
+
+    def learn(self, property_id, url):
+        """
+        Learn from a lookup that reached the detail page through the search.
+
+        Args:
+            property_id: Property ID that was searched
+            url: Final URL of the detail page
+
+        Returns:
+            str: Template learned, or None if the URL does not contain the ID
+        """
+        template = url_template(property_id, url)
+        if template is None:
+            return None
+        with self._lock:
+            entry = self._templates.setdefault(template, {"properties": [], "successes": 0, "failures": 0})
+            if property_id not in entry["properties"]:
+                # Only a few distinct IDs are needed as evidence
+                if len(entry["properties"]) < self.min_confirmations:
+                    entry["properties"].append(property_id)
+                entry["successes"] += 1
+                entry["last_success"] = time.time()
+                self._save()
+        return template
+
+    def record(self, template, verified):
+        """
+        Record the outcome of a direct navigation.
+
+        Args:
+            template: Template returned by candidate_url()
+            verified: Whether the page was the property's detail page
+        """
+        with self._lock:
+            entry = self._templates.get(template)
+            if entry is None:
+                return
+            if verified:
+                entry["successes"] += 1
+                entry["last_success"] = time.time()
+            else:
+                entry["failures"] += 1
+                logger.info(f"Direct URL not verified ({entry['failures']} failures): {template}")
+            self._save()
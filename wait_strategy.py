@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Wait Strategy
+Explicit, condition-based waits for the Selenium lookup path, so no probe
+ever blocks on the implicit wait or on fixed sleeps
+"""
+
+import logging
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from http_lookup import NOT_FOUND_TEXT, NOT_FOUND_SELECTOR, LOCATION_SELECTOR
+from dom_extraction import field, wait_for_snapshot
+
+logger = logging.getLogger('WaitStrategy')
+
+# Per-probe budgets in seconds
+SEARCH_BOX_TIMEOUT = 15
+NAVIGATION_TIMEOUT = 10
+RESULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.2
+
+RESULT_NOT_FOUND = "not_found"
+RESULT_LOCATION = "location"
+
+# Document states in which the new page can be queried; "interactive" is reached
+# under the eager and none page load strategies without waiting for images
+READY_STATES = ("interactive", "complete")
+
+# Returns the first element matching any of the selectors in arguments[0], or null
+FIRST_MATCH_SCRIPT = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var element = document.querySelector(selectors[i]);
+    if (element) { return element; }
+}
+return null;
+"""
+
+# Everything the search result race reads, fetched in one command per poll
+SEARCH_RESULT_FIELDS = {
+    "headings": field(NOT_FOUND_SELECTOR, all=True),
+    "location_html": field(LOCATION_SELECTOR, "innerHTML"),
+    "location_text": field(LOCATION_SELECTOR),
+}
+
+
+def wait_for_any_element(driver, selectors, timeout=SEARCH_BOX_TIMEOUT):
+    """
+    Wait for the first of several CSS selectors to match.
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: CSS selectors, tried on every poll
+        timeout: Budget in seconds
+
+    Returns:
+        WebElement: The first element found
+
+    Raises:
+        TimeoutException: If none of the selectors matched within the budget
+    """
+    def any_present(driver):
+        # All selectors are tried in the page, one round trip per poll
+        try:
+            return driver.execute_script(FIRST_MATCH_SCRIPT, list(selectors)) or False
+        except WebDriverException:
+            return False
+
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(any_present)
+
+
+def wait_for_url_change(driver, old_url, timeout=NAVIGATION_TIMEOUT):
+    """
+    Wait for the browser to leave old_url and for the new document to be parsed.
+
+    Subresources are not waited for: the caller waits for the element it needs.
+
+    Args:
+        driver: Selenium WebDriver
+        old_url: URL before the navigation was triggered
+        timeout: Budget in seconds
+
+    Returns:
+        bool: True if the URL changed and the document is interactive, False on timeout
+    """
+    def navigated(driver):
+        # URL and readyState in one round trip
+        try:
+            url, ready_state = driver.execute_script("return [window.location.href, document.readyState]")
+        except WebDriverException:
+            # The old document is being torn down; poll again
+            return False
+        return url != old_url and ready_state in READY_STATES
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(navigated)
+        return True
+    except TimeoutException:
+        logger.info(f"URL did not change within {timeout}s, reading the current page")
+        return False
+
+
+def search_result(snapshot):
+    """
+    Classify a snapshot taken with SEARCH_RESULT_FIELDS.
+
+    Args:
+        snapshot: Result of extract_snapshot()
+
+    Returns:
+        str: RESULT_NOT_FOUND, RESULT_LOCATION, or None while neither is on the page
+    """
+    if any(NOT_FOUND_TEXT in heading for heading in snapshot.get("headings") or []):
+        return RESULT_NOT_FOUND
+    if snapshot.get("location_html") is not None:
+        return RESULT_LOCATION
+    return None
+
+
+def wait_for_search_result(driver, timeout=RESULT_TIMEOUT, extra_fields=None):
+    """
+    Race the "property not found" page against the property location block.
+
+    Each poll reads the headings and the location block with a single script,
+    so the winner's content comes back with the poll that detected it.
+
+    Args:
+        driver: Selenium WebDriver
+        timeout: Budget in seconds
+        extra_fields: More field() specifications to read along with the result
+
+    Returns:
+        tuple: (RESULT_NOT_FOUND or RESULT_LOCATION, snapshot), whichever appears first;
+            the snapshot holds "location_html" and "location_text" for RESULT_LOCATION
+
+    Raises:
+        TimeoutException: If neither appeared within the budget
+    """
+    fields = dict(SEARCH_RESULT_FIELDS, **(extra_fields or {}))
+    return wait_for_snapshot(driver, fields, search_result, timeout, poll_frequency=POLL_FREQUENCY)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CAIXA Lead Processor - Warm Driver
+Starts a headless WebDriver in the background while the operator prepares
+the batch, keeps it healthy while idle and hands it to the next run
+"""
+
+import logging
+import threading
+
+from browser_profiles import PROFILE_STANDARD
+
+logger = logging.getLogger('WarmDriver')
+
+HEALTH_CHECK_INTERVAL = 60  # seconds between checks of the idle driver
+
+
+def default_driver_factory(browser_profile=PROFILE_STANDARD):
+    """Start a headless WebDriver the same way the processor does"""
+    from caixa_lead_processor import CAIXALeadProcessor
+    processor = CAIXALeadProcessor(headless=True, use_http_lookup=False, browser_profile=browser_profile)
+    if not processor.setup_driver(headless=True):
+        return None
+    return processor.driver
+
+
+def driver_is_alive(driver):
+    """Return True if the browser still answers WebDriver commands"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class WarmDriver:
+    """
+    A headless WebDriver started ahead of the next processing run.
+
+    start() launches the browser on a background thread and returns at once;
+    while nobody uses it, the driver is checked every `health_interval`
+    seconds and relaunched if the browser died. take() hands the driver over
+    (the caller then owns it and must quit it); call start() again to warm
+    the next one.
+    """
+
+    # Warm browsers are always headless; processors in visible mode start their own
+    headless = True
+
+    def __init__(self, driver_factory=None, health_interval=HEALTH_CHECK_INTERVAL, browser_profile=PROFILE_STANDARD):
+        """
+        Initialize the WarmDriver.
+
+        Args:
+            driver_factory: Callable returning a new headless WebDriver (or None on failure)
+            health_interval: Seconds between checks of the idle driver
+            browser_profile: Profile of the warmed browser; processors only take a matching one
+        """
+        self.browser_profile = browser_profile
+        self.driver_factory = driver_factory or (lambda: default_driver_factory(self.browser_profile))
+        self.health_interval = health_interval
+        self._driver = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._stop.set()
+
+    def start(self):
+        """Warm a driver in the background, unless one is ready or being started"""
+        with self._lock:
+            if not self._stop.is_set():
+                return self
+            # Each warm-up thread has its own stop flag, so a thread still
+            # finishing after take() never blocks the next warm-up
+            self._stop = threading.Event()
+            threading.Thread(target=self._run, args=(self._stop,), name="warm-driver", daemon=True).start()
+        return self
+
+    def _run(self, stop):
+        while not stop.is_set():
+            with self._lock:
+                driver = self._driver
+            if driver is None or not driver_is_alive(driver):
+                if driver is not None:
+                    logger.warning("Warm WebDriver stopped answering; relaunching")
+                    self._discard(driver)
+                self._launch(stop)
+            stop.wait(self.health_interval)
+
+    def _launch(self, stop):
+        try:
+            driver = self.driver_factory()
+        except Exception as e:
+            logger.warning(f"Failed to warm WebDriver: {str(e)}")
+            driver = None
+        with self._lock:
+            if driver is not None and not stop.is_set():
+                self._driver = driver
+                self._ready.set()
+                logger.info("Warm WebDriver ready")
+                return
+        if driver is not None:
+            # Taken or closed while the browser was starting
+            self._quit(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if self._driver is driver:
+                self._driver = None
+                self._ready.clear()
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to quit warm WebDriver: {str(e)}")
+
+    def is_ready(self):
+        """Return True if a driver can be taken right now"""
+        return self._ready.is_set()
+
+    def take(self, timeout=0):
+        """
+        Hand the warm driver over and stop watching it.
+
+        Args:
+            timeout: Seconds to wait for a driver that is still starting
+
+        Returns:
+            WebDriver: The warm driver, or None if none is ready
+        """
+        if timeout:
+            self._ready.wait(timeout)
+        with self._lock:
+            self._stop.set()
+            driver, self._driver = self._driver, None
+            self._ready.clear()
+        return driver
+
+    def close(self):
+        """Stop warming and quit the idle driver, if any"""
+        driver = self.take()
+        if driver is not None:
+            self._quit(driver)
+
+    def set_profile(self, browser_profile):
+        """
+        Change the profile of the warmed browser, dropping one warmed with another profile.
+
+        Returns:
+            bool: True if the profile changed (call start() to warm a new browser)
+        """
+        if browser_profile == self.browser_profile:
+            return False
+        self.close()
+        self.browser_profile = browser_profile
+        return True